@@ -0,0 +1,126 @@
+"""Speed of the NumPy workout statistics on a large session journal.
+
+Writes a synthetic journal of `--events` step events, then times
+`analytics.step_stats` on all of it against a plain Python loop over
+`read_journal` on the first `--python-events` events.
+
+    python benchmarks/analytics.py --events 10000000
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from analytics import record_dtype, step_stats  # noqa: E402
+from storage.session_journal import (  # noqa: E402
+    HEADER,
+    MAGIC,
+    NAMES_FILE,
+    RECORD,
+    VERSION,
+    Event,
+    StepKind,
+    read_journal,
+)
+
+SEGMENT_RECORDS = 4 * 1024 * 1024 // RECORD.size
+
+
+def write_synthetic_journal(directory: Path, events: int, exercises: int):
+    rng = np.random.default_rng(23)
+    names = [f"Routine {i}" for i in range(10)]
+    names += [f"Exercise {i}" for i in range(exercises)]
+    with open(directory / NAMES_FILE, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(name) + "\n" for name in names)
+
+    for number, start in enumerate(range(0, events, SEGMENT_RECORDS), 1):
+        count = min(SEGMENT_RECORDS, events - start)
+        records = np.zeros(count, dtype=record_dtype())
+        exercise = rng.integers(11, 11 + exercises, count)
+        planned = (exercise % 6 + 1) * 10_000_000_000
+        records["monotonic_ns"] = np.arange(start, start + count)
+        records["planned_ns"] = planned
+        records["actual_ns"] = planned + rng.normal(0, 2e9, count).astype(
+            np.int64
+        )
+        records["session"] = np.arange(start, start + count) // 20 + 1
+        records["routine"] = rng.integers(1, 11, count)
+        records["exercise"] = exercise
+        records["event"] = np.where(
+            rng.random(count) < 0.05, Event.SKIP, Event.STEP_END
+        )
+        records["step_kind"] = np.where(
+            exercise % 2, StepKind.DURATION, StepKind.REPETITION
+        )
+        with open(directory / f"journal-{number:06}.bin", "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+            records.tofile(f)
+
+
+def python_stats(directory: Path, limit: int) -> dict:
+    """The per-exercise totals and percentiles, one record at a time."""
+    times = {}
+    for i, record in enumerate(read_journal(directory)):
+        if i == limit:
+            break
+        if record.event == Event.STEP_END:
+            times.setdefault(record.exercise, []).append(record.actual_ns)
+    stats = {}
+    for exercise, values in times.items():
+        values.sort()
+        stats[exercise] = (
+            sum(values),
+            values[len(values) // 2],
+            values[int(len(values) * 0.95)],
+        )
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=10_000_000)
+    parser.add_argument("--python-events", type=int, default=500_000)
+    parser.add_argument("--exercises", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        start = perf_counter()
+        write_synthetic_journal(directory, args.events, args.exercises)
+        print(f"wrote {args.events} events in {perf_counter() - start:.1f} s")
+
+        timings = []
+        for _ in range(args.runs):
+            start = perf_counter()
+            stats = step_stats(directory)
+            timings.append(perf_counter() - start)
+        numpy_time = median(timings)
+
+        python_events = min(args.python_events, args.events)
+        start = perf_counter()
+        python_stats(directory, python_events)
+        python_time = perf_counter() - start
+
+    print(f"{len(stats.name)} exercises, {stats.count.sum()} steps done")
+    print(
+        f"numpy   {numpy_time:8.2f} s  "
+        f"{numpy_time / args.events * 1e9:8.1f} ns/event"
+    )
+    print(
+        f"python  {python_time / python_events * args.events:8.2f} s  "
+        f"{python_time / python_events * 1e9:8.1f} ns/event "
+        f"(from {python_events} events)"
+    )
+
+
+if __name__ == "__main__":
+    main()
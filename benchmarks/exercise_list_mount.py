@@ -0,0 +1,118 @@
+"""Mount time and memory of the routine exercise list.
+
+Mounts a routine of synthetic exercises in a headless app, once with the
+previous `ListView` of exercise card widgets and once with `ExerciseList`,
+and reports the time until the screen is ready and how much the peak
+resident memory grew. Every run happens in a fresh process.
+
+    python benchmarks/exercise_list_mount.py --sizes 10 1000 10000
+"""
+
+import argparse
+import asyncio
+import sys
+import resource
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from textual.app import App, ComposeResult  # noqa: E402
+from textual.containers import HorizontalGroup  # noqa: E402
+from textual.widgets import Label, ListItem, ListView  # noqa: E402
+
+from routine import DurationExercise, RepetitionExercise  # noqa: E402
+from widgets.exercise_list import (  # noqa: E402
+    ExerciseList,
+    exercise_quantity_str,
+)
+
+
+class LegacyExerciseWidget(HorizontalGroup):
+    """The previous per-exercise card: a group of two labels."""
+
+    DEFAULT_CSS = """
+    LegacyExerciseWidget {
+        background: $boost;
+        border: tall $border;
+        margin: 1 1;
+    }
+    """
+
+    def __init__(self, exercise):
+        super().__init__()
+        self.exercise = exercise
+
+    def compose(self) -> ComposeResult:
+        yield HorizontalGroup(
+            Label(self.exercise.name),
+            Label(exercise_quantity_str(self.exercise)),
+        )
+
+
+class MountApp(App):
+    def __init__(self, exercises, legacy: bool):
+        super().__init__()
+        self.exercises = exercises
+        self.legacy = legacy
+
+    def compose(self) -> ComposeResult:
+        if self.legacy:
+            yield ListView(
+                *[ListItem(LegacyExerciseWidget(e)) for e in self.exercises]
+            )
+        else:
+            yield ExerciseList(self.exercises)
+
+
+def synthetic_exercises(count: int) -> list:
+    return [
+        (
+            DurationExercise(f"Exercise {i}", 30 + i % 60)
+            if i % 2
+            else RepetitionExercise(f"Exercise {i}", 10 + i % 20)
+        )
+        for i in range(count)
+    ]
+
+
+def peak_rss_bytes() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+async def mount(exercises, legacy: bool) -> float:
+    start = perf_counter()
+    app = MountApp(exercises, legacy)
+    async with app.run_test(size=(100, 40)) as pilot:
+        await pilot.pause()
+        return perf_counter() - start
+
+
+def measure(size: int, legacy: bool) -> tuple[float, int]:
+    exercises = synthetic_exercises(size)
+    before = peak_rss_bytes()
+    elapsed = asyncio.run(mount(exercises, legacy))
+    return elapsed, peak_rss_bytes() - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 1000, 10000]
+    )
+    args = parser.parse_args()
+
+    print(f"{'exercises':>10}{'list':>15}{'mount ms':>12}{'peak MB':>10}")
+    for size in args.sizes:
+        for label, legacy in (("ListView", True), ("ExerciseList", False)):
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                elapsed, memory = pool.submit(measure, size, legacy).result()
+            print(
+                f"{size:>10}{label:>15}{elapsed * 1000:>12.0f}"
+                f"{memory / 1e6:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Resident memory of a large routines file, by exercise model.
+
+Writes a synthetic routines.json and compares the memory held after
+decoding every routine with the slotted model against the previous
+plain-class model, plus an index-only load.
+
+    python benchmarks/routine_memory.py --routines 2000 --exercises 25
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from routine import (  # noqa: E402
+    DurationExercise,
+    RepetitionExercise,
+    Routine,
+    load_routines,
+    save_routines,
+)
+from storage.routine_store import FileRoutineStore  # noqa: E402
+
+
+class PlainExercise:
+    """The previous exercise model: per-instance __dict__ and type string."""
+
+    def __init__(self, name, type):
+        self.name = name
+        self.type = type
+
+
+class PlainDurationExercise(PlainExercise):
+    def __init__(self, name, duration):
+        super().__init__(name, type="duration")
+        self.duration = duration
+
+
+class PlainRepetitionExercise(PlainExercise):
+    def __init__(self, name, repetitions):
+        super().__init__(name, type="repetition")
+        self.repetitions = repetitions
+
+
+class PlainRoutine:
+    def __init__(self, name, exercises):
+        self.name = name
+        self.exercises = exercises
+
+
+def plain_object_hook(obj):
+    kind = obj.get("__type__")
+    if kind == "Routine":
+        return PlainRoutine(obj["name"], obj["exercises"])
+    elif kind == "DurationExercise":
+        return PlainDurationExercise(obj["name"], obj["duration"])
+    elif kind == "RepetitionExercise":
+        return PlainRepetitionExercise(obj["name"], obj["repetitions"])
+    return obj
+
+
+def write_synthetic_file(path: Path, routines: int, exercises: int) -> None:
+    save_routines(
+        path,
+        [
+            Routine(
+                f"Routine {i}",
+                [
+                    (
+                        DurationExercise(f"Exercise {j}", 30 + j)
+                        if j % 2
+                        else RepetitionExercise(f"Exercise {j}", 10 + j)
+                    )
+                    for j in range(exercises)
+                ],
+            )
+            for i in range(routines)
+        ],
+    )
+
+
+def resident_bytes(load) -> int:
+    gc.collect()
+    tracemalloc.start()
+    loaded = load()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loaded
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--routines", type=int, default=2000)
+    parser.add_argument("--exercises", type=int, default=25)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "routines.json"
+        write_synthetic_file(path, args.routines, args.exercises)
+        total = args.routines * args.exercises
+
+        def load_plain():
+            with open(path) as f:
+                return json.load(f, object_hook=plain_object_hook)
+
+        def load_index():
+            store = FileRoutineStore(path)
+            store.load()
+            return store
+
+        def load_slotted():
+            return load_routines(path)
+
+        results = [
+            ("plain classes", resident_bytes(load_plain)),
+            ("slotted, interned", resident_bytes(load_slotted)),
+            ("index only", resident_bytes(load_index)),
+        ]
+
+    print(f"{args.routines} routines, {total} exercises")
+    print(f"{'model':<18}{'MB':>10}{'bytes/exercise':>18}")
+    for label, size in results:
+        print(f"{label:<18}{size / 1e6:>10.2f}{size / total:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Keystroke-to-results latency of the routine picker search.
+
+Types queries into a `RoutineNameIndex` of synthetic routine names one
+character at a time, then deletes them again, and reports the slowest
+and median time per keystroke against a 60 Hz frame.
+
+    python benchmarks/routine_search.py --routines 50000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from routine_index import RoutineNameIndex  # noqa: E402
+
+WORDS = [
+    "push", "pull", "leg", "core", "hiit", "yoga", "stretch", "morning",
+    "evening", "full", "body", "upper", "lower", "cardio", "abs", "arms",
+]  # fmt: skip
+
+QUERIES = ["pull", "legday", "mrn str", "hiit 42", "zzz"]
+
+FRAME = 1 / 60
+
+
+def synthetic_names(count: int) -> list[str]:
+    rng = random.Random(1)
+    return [
+        " ".join(rng.choice(WORDS) for _ in range(3)).title() + f" {i}"
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--routines", type=int, default=50000)
+    args = parser.parse_args()
+
+    names = synthetic_names(args.routines)
+    start = perf_counter()
+    index = RoutineNameIndex(names)
+    print(
+        f"{args.routines} routines, index built in "
+        f"{(perf_counter() - start) * 1000:.1f} ms"
+    )
+    print(f"{'query':<10}{'results':>10}{'median ms':>12}{'max ms':>10}")
+
+    slowest = 0
+    for query in QUERIES:
+        typed = [query[:i] for i in range(1, len(query) + 1)]
+        keystrokes = typed + typed[-2::-1] + [""]
+        timings = []
+        for text in keystrokes:
+            start = perf_counter()
+            results = index.search(text)
+            timings.append(perf_counter() - start)
+            if text == query:
+                count = len(results)
+        slowest = max(slowest, max(timings))
+        print(
+            f"{query!r:<10}{count:>10}"
+            f"{statistics.median(timings) * 1000:>12.2f}"
+            f"{max(timings) * 1000:>10.2f}"
+        )
+    verdict = "within" if slowest < FRAME else "over"
+    print(f"slowest keystroke {slowest * 1000:.2f} ms, {verdict} one frame")
+
+
+if __name__ == "__main__":
+    main()
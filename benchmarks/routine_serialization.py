@@ -0,0 +1,87 @@
+"""Load and save throughput of the routines file formats.
+
+Encodes a synthetic routine library with every codec and times full
+saves, full loads and index-only loads.
+
+    python benchmarks/routine_serialization.py --routines 5000 --exercises 20
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from routine import (  # noqa: E402
+    DurationExercise,
+    RepetitionExercise,
+    Routine,
+)
+from storage.codecs import CODECS, save_all_routines  # noqa: E402
+
+
+def synthetic_routines(routines: int, exercises: int) -> list[Routine]:
+    return [
+        Routine(
+            f"Routine {i}",
+            [
+                (
+                    DurationExercise(f"Exercise {j}", 30 + j)
+                    if j % 2
+                    else RepetitionExercise(f"Exercise {j}", 10 + j)
+                )
+                for j in range(exercises)
+            ],
+        )
+        for i in range(routines)
+    ]
+
+
+def best_of(repeat: int, func) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--routines", type=int, default=5000)
+    parser.add_argument("--exercises", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    routines = synthetic_routines(args.routines, args.exercises)
+    total = args.routines * args.exercises
+    print(f"{args.routines} routines, {total} exercises")
+    print(
+        f"{'format':<10}{'size MB':>10}{'save ms':>10}{'load ms':>10}"
+        f"{'index ms':>10}{'load exercises/s':>20}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, codec in CODECS.items():
+            path = Path(tmp) / f"routines.{name}"
+
+            def index():
+                with open(path, "rb") as f:
+                    codec.index(f)
+
+            save = best_of(
+                args.repeat, lambda: save_all_routines(path, routines, codec)
+            )
+            load = best_of(args.repeat, lambda: codec.load_all(path))
+            index_time = best_of(args.repeat, index)
+            size = path.stat().st_size
+            print(
+                f"{name:<10}{size / 1e6:>10.2f}{save * 1000:>10.0f}"
+                f"{load * 1000:>10.0f}{index_time * 1000:>10.0f}"
+                f"{total / load:>20,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Navigation latency between the routine screens.
+
+Runs the app headless on a synthetic routines file and walks the
+routine list and routine view back and forth, timing every navigation
+until the new screen has been processed. Each run is repeated with the
+screen cache disabled, which composes a fresh screen on every visit.
+
+    python benchmarks/screen_navigation.py --routines 5000 --exercises 200
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+SRC = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+from textual.reactive import var  # noqa: E402
+
+from routine import (  # noqa: E402
+    DurationExercise,
+    RepetitionExercise,
+    Routine,
+    save_routines,
+)
+from screens.screen_manager import ScreenManager  # noqa: E402
+from timero import TimeroApp  # noqa: E402
+
+
+def write_routines(path: Path, routines: int, exercises: int) -> None:
+    save_routines(
+        path,
+        [
+            Routine(
+                f"Routine {i}",
+                [
+                    (
+                        DurationExercise(f"Exercise {j}", 30 + j)
+                        if j % 2
+                        else RepetitionExercise(f"Exercise {j}", 10 + j)
+                    )
+                    for j in range(exercises)
+                ],
+            )
+            for i in range(routines)
+        ],
+    )
+
+
+async def navigate(path: Path, cache_size: int, visits: int) -> dict:
+    class BenchmarkApp(TimeroApp):
+        CSS_PATH = SRC / "timero.tcss"
+        routines_path = var(path)
+
+    app = BenchmarkApp(data_dir=path.parent)
+    timings = {"routine list": [], "routine view": []}
+    async with app.run_test(size=(120, 40)) as pilot:
+        app.screen_manager = ScreenManager(app, cache_size=cache_size)
+        controller = app.routine_controller
+
+        async def timed(label, go_to):
+            start = perf_counter()
+            await go_to()
+            await pilot.pause()
+            timings[label].append(perf_counter() - start)
+
+        for visit in range(visits):
+            await timed(
+                "routine list", app.screen_manager.go_to_routine_select
+            )
+            # Alternate between two routines, like picking one and then
+            # going back for another.
+            controller.set_routine(app.routines[visit % 2])
+            await timed("routine view", app.screen_manager.go_to_routine)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--routines", type=int, default=5000)
+    parser.add_argument("--exercises", type=int, default=200)
+    parser.add_argument("--visits", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "routines.json"
+        write_routines(path, args.routines, args.exercises)
+        print(f"{args.routines} routines, {args.exercises} exercises each")
+        print(f"{'screen':<15}{'cache':>8}{'median ms':>12}{'max ms':>10}")
+        for cache_size, label in ((0, "off"), (8, "on")):
+            timings = asyncio.run(navigate(path, cache_size, args.visits))
+            for screen, values in timings.items():
+                print(
+                    f"{screen:<15}{label:>8}"
+                    f"{statistics.median(values) * 1000:>12.1f}"
+                    f"{max(values) * 1000:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
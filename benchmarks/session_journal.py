@@ -0,0 +1,71 @@
+"""Cost of recording workout session events.
+
+Measures the time `SessionJournal.record` takes on the caller's thread
+(the UI thread in the app), the time to write the buffered events and the
+disk space used per event.
+
+    python benchmarks/session_journal.py --events 100000
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from storage.session_journal import (  # noqa: E402
+    RECORD,
+    Event,
+    SessionJournal,
+    StepKind,
+    read_journal,
+    segment_paths,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--exercises", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # A long flush delay keeps the background write out of the timing.
+        journal = SessionJournal(tmp, flush_delay=3600)
+        session = journal.begin_session("Benchmark")
+        exercises = [f"Exercise {i}" for i in range(args.exercises)]
+
+        start = perf_counter()
+        for i in range(args.events):
+            journal.record(
+                Event.STEP_END,
+                session,
+                step=i,
+                step_kind=StepKind.DURATION,
+                routine="Benchmark",
+                exercise=exercises[i % args.exercises],
+                planned_ns=30_000_000_000,
+                actual_ns=30_001_000_000,
+            )
+        record_time = perf_counter() - start
+
+        start = perf_counter()
+        journal.close()
+        write_time = perf_counter() - start
+
+        size = sum(p.stat().st_size for p in segment_paths(tmp))
+        start = perf_counter()
+        events = sum(1 for _ in read_journal(tmp))
+        read_time = perf_counter() - start
+
+    print(f"{args.events} events, {RECORD.size} bytes per record")
+    print(f"record   {record_time / args.events * 1e6:8.2f} us/event")
+    print(f"write    {write_time / args.events * 1e6:8.2f} us/event")
+    print(f"read     {read_time / events * 1e6:8.2f} us/event")
+    print(f"on disk  {size / events:8.1f} bytes/event")
+
+
+if __name__ == "__main__":
+    main()
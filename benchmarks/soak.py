@@ -0,0 +1,329 @@
+"""Soak benchmark of whole training sessions on a simulated clock.
+
+Runs long routines end to end in a headless app, through the real
+`TrainView`, `Timer` and `TimeDisplay`, with breaks, skips and auto-start
+on and off. Time is simulated: the app's clock only moves when the
+benchmark jumps it to the next timer wake-up, so an hour of training
+takes seconds. For every scenario it records frames rendered, timer
+wake-ups, CPU time, peak RSS (of the whole process so far) and the
+latency from the end of a step to the first frame of the next one.
+
+Results are written as JSON. Given a baseline file from an earlier run,
+every metric that got worse than its tolerance allows is reported and
+the exit status is 1:
+
+    python benchmarks/soak.py --output soak.json
+    python benchmarks/soak.py --baseline soak.json
+"""
+
+import argparse
+import asyncio
+import heapq
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+from itertools import count
+from pathlib import Path
+from time import perf_counter, process_time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+SRC = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+from textual.reactive import var  # noqa: E402
+
+from countdown import NS_PER_SECOND  # noqa: E402
+from routine import (  # noqa: E402
+    DurationExercise,
+    RepetitionExercise,
+    Routine,
+    save_routines,
+)
+from timero import TimeroApp  # noqa: E402
+from training_engine import TrainingEvent  # noqa: E402
+
+# name: settings, and every how many steps one is skipped (0 for none)
+SCENARIOS = {
+    "breaks-auto-start": (
+        {"show_breaks": True, "auto_start_breaks": True},
+        0,
+    ),
+    "breaks-manual-start": (
+        {
+            "show_breaks": True,
+            "auto_start_breaks": False,
+            "auto_start_exercises": False,
+        },
+        0,
+    ),
+    "no-breaks-with-skips": ({"show_breaks": False}, 4),
+}
+
+# Metrics compared with the baseline and how much worse (relative) each
+# may get; lower is better for all of them. Frames and wake-ups hardly
+# vary between runs, timings do. The maximum transition latency is too
+# noisy to compare at all.
+TOLERANCES = {
+    "frames": 0.05,
+    "timer_wakeups": 0.05,
+    "cpu_s": 0.3,
+    "peak_rss_kb": 0.2,
+    "transition_median_ms": 0.5,
+}
+
+
+class SimulatedTimer:
+    __slots__ = ("callback", "cancelled")
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class SimulatedClock:
+    """A monotonic clock that only moves when told to.
+
+    Callbacks scheduled with `call_later` (as the tick scheduler does) run
+    when `run_next` jumps the clock to their time.
+    """
+
+    def __init__(self):
+        self.now_ns = 0
+        self._timers = []
+        self._order = count()
+
+    def __call__(self) -> int:
+        return self.now_ns
+
+    def call_later(self, delay: float, callback) -> SimulatedTimer:
+        timer = SimulatedTimer(callback)
+        when = self.now_ns + round(delay * NS_PER_SECOND)
+        heapq.heappush(self._timers, (when, next(self._order), timer))
+        return timer
+
+    def run_next(self) -> bool:
+        """Jump to the next pending callback and run it."""
+        while self._timers:
+            when, _, timer = heapq.heappop(self._timers)
+            if not timer.cancelled:
+                self.now_ns = max(self.now_ns, when)
+                timer.callback()
+                return True
+        return False
+
+
+def make_routine(exercises: int, duration: int) -> Routine:
+    """Duration exercises with every third one done in repetitions."""
+    return Routine(
+        "Soak",
+        [
+            (
+                RepetitionExercise(f"Exercise {i}", 12)
+                if i % 3 == 2
+                else DurationExercise(f"Exercise {i}", duration)
+            )
+            for i in range(exercises)
+        ],
+    )
+
+
+async def run_scenario(
+    tmp: Path, settings: dict, skip_every: int, args
+) -> dict:
+    clock = SimulatedClock()
+
+    class SoakApp(TimeroApp):
+        CSS_PATH = SRC / "timero.tcss"
+        routines_path = var(tmp / "routines.json")
+
+        frames = 0
+
+        def _display(self, screen, renderable) -> None:
+            nonlocal step_ended_at
+            if renderable is not None:
+                self.frames += 1
+                if step_ended_at is not None and next_step_started:
+                    transitions.append(perf_counter() - step_ended_at)
+                    step_ended_at = None
+            super()._display(screen, renderable)
+
+    # Keep the benchmark's files out of the working tree.
+    app = SoakApp(clock=clock, call_later=clock.call_later, data_dir=tmp)
+
+    # Time from the end of a step to the first frame after the next one
+    # started.
+    transitions = []
+    step_ended_at = None
+    next_step_started = False
+
+    def on_training_event(event, engine) -> None:
+        nonlocal step_ended_at, next_step_started
+        if event in (TrainingEvent.STEP_ENDED, TrainingEvent.STEP_SKIPPED):
+            step_ended_at = perf_counter()
+            next_step_started = False
+        elif event in (
+            TrainingEvent.STEP_STARTED,
+            TrainingEvent.BREAK_STARTED,
+            TrainingEvent.FINISHED,
+        ):
+            next_step_started = True
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        # Changed in memory only, so config.json is left alone.
+        app.settings.settings.update(
+            {
+                "auto_start_exercises": True,
+                "break_duration": args.break_duration,
+                "timer_precision": args.precision,
+                **settings,
+            }
+        )
+        app.routine_controller.set_routine(
+            make_routine(args.exercises, args.duration)
+        )
+        cpu_start = process_time()
+        await app.screen_manager.go_to_training()
+        await pilot.pause()
+        view = app.screen
+        engine = view.engine
+        engine.subscribe(on_training_event)
+        frames_start = app.frames
+
+        while not engine.is_finished:
+            position = engine.position
+            if skip_every and position % skip_every == skip_every - 1:
+                await pilot.press("s")
+            elif not engine.is_timed:
+                await pilot.click("#reps-finished")
+            else:
+                if not engine.countdown.is_running:
+                    timer = (
+                        view.break_timer
+                        if engine.is_in_break
+                        else view.exercise_timer
+                    )
+                    await pilot.click(timer.query_one("#start"))
+                # pause(0) processes pending messages and paints at once,
+                # where pause() would wait for the process to look idle.
+                while engine.position == position and clock.run_next():
+                    await pilot.pause(0)
+            await pilot.pause(0)
+            if engine.position == position and not engine.is_finished:
+                raise RuntimeError(f"Step {position} did not end")
+
+        cpu = process_time() - cpu_start
+        frames = app.frames - frames_start
+        wakeups = app.tick_scheduler.wakeups
+        simulated = clock.now_ns / NS_PER_SECOND
+
+    return {
+        "steps": len(engine.plan),
+        "simulated_s": round(simulated, 3),
+        "frames": frames,
+        "timer_wakeups": wakeups,
+        "cpu_s": round(cpu, 3),
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "transition_median_ms": round(
+            statistics.median(transitions) * 1000, 2
+        ),
+        "transition_max_ms": round(max(transitions) * 1000, 2),
+    }
+
+
+def compare(results: dict, baseline: dict, scale: float = 1.0) -> list[str]:
+    """Metrics that are worse than in `baseline` by more than their
+    tolerance times `scale`."""
+    regressions = []
+    for name, metrics in results["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if base is None:
+            continue
+        for metric, tolerance in TOLERANCES.items():
+            if metric not in base:
+                continue
+            if metrics[metric] > base[metric] * (1 + tolerance * scale):
+                regressions.append(
+                    f"{name}: {metric} {metrics[metric]} "
+                    f"(baseline {base[metric]})"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--exercises", type=int, default=20)
+    parser.add_argument("--duration", type=int, default=20)
+    parser.add_argument("--break-duration", type=int, default=10)
+    parser.add_argument(
+        "--precision",
+        choices=("seconds", "tenths", "hundredths"),
+        default="tenths",
+    )
+    parser.add_argument(
+        "--scenario",
+        choices=SCENARIOS,
+        action="append",
+        help="run only this scenario (can be repeated)",
+    )
+    parser.add_argument("--output", type=Path, help="write results here")
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument(
+        "--tolerance-scale",
+        type=float,
+        default=1.0,
+        help="multiply every metric's tolerance, e.g. on noisy machines",
+    )
+    args = parser.parse_args()
+
+    results = {
+        "python": platform.python_version(),
+        "parameters": {
+            "exercises": args.exercises,
+            "duration": args.duration,
+            "break_duration": args.break_duration,
+            "precision": args.precision,
+        },
+        "scenarios": {},
+    }
+    for name in args.scenario or SCENARIOS:
+        settings, skip_every = SCENARIOS[name]
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            save_routines(tmp / "routines.json", [])
+            metrics = asyncio.run(
+                run_scenario(tmp, settings, skip_every, args)
+            )
+        results["scenarios"][name] = metrics
+        print(
+            f"{name:<22} {metrics['steps']:>4} steps "
+            f"{metrics['simulated_s']:>8.0f} s simulated  "
+            f"{metrics['frames']:>6} frames "
+            f"{metrics['timer_wakeups']:>6} wake-ups "
+            f"{metrics['cpu_s']:>7.2f} s CPU "
+            f"{metrics['peak_rss_kb'] / 1024:>6.1f} MB  "
+            f"transition {metrics['transition_median_ms']:.1f}/"
+            f"{metrics['transition_max_ms']:.1f} ms"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("parameters") != results["parameters"]:
+            print("warning: the baseline was run with other parameters")
+        regressions = compare(results, baseline, args.tolerance_scale)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
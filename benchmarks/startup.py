@@ -0,0 +1,50 @@
+"""Cold start regression check.
+
+Starts the app headless in a fresh interpreter several times (see
+`startup_profile`) and fails with exit status 1 when the median time to
+first paint is above `--max-first-paint-ms`. The default threshold leaves
+room for slow machines; CI can pass a tighter one.
+
+    python benchmarks/startup.py --runs 5 --max-first-paint-ms 1500
+"""
+
+import argparse
+import statistics
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from startup_profile import measure_startup  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-first-paint-ms", type=float, default=1500)
+    args = parser.parse_args()
+
+    profiles = [measure_startup() for _ in range(args.runs)]
+    print(f"{'':<16}{'median ms':>12}{'max ms':>10}")
+    for key, label in (
+        ("imports_time", "import timero"),
+        ("first_paint", "first paint"),
+        ("process", "whole process"),
+    ):
+        values = [profile[key] * 1000 for profile in profiles]
+        print(
+            f"{label:<16}{statistics.median(values):>12.1f}"
+            f"{max(values):>10.1f}"
+        )
+
+    first_paint = statistics.median(p["first_paint"] for p in profiles)
+    if first_paint * 1000 > args.max_first_paint_ms:
+        print(
+            f"FAIL: first paint {first_paint * 1000:.1f} ms is over "
+            f"{args.max_first_paint_ms:.0f} ms"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""CPU cost of running timers: shared tick scheduler vs. 60 Hz polling.
+
+Mounts N running timers in a headless app and measures process CPU time
+spent over a fixed wall-clock window.
+
+    python benchmarks/timer_cpu.py --timers 1 2 8 --seconds 5
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from time import monotonic, process_time
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from textual.app import App  # noqa: E402
+from textual.containers import VerticalGroup  # noqa: E402
+from textual.reactive import reactive  # noqa: E402
+from textual.widgets import Digits  # noqa: E402
+
+from sound_manager import NullSoundManager  # noqa: E402
+from tick_scheduler import TickScheduler  # noqa: E402
+from widgets.timer import TimeDisplay  # noqa: E402
+
+
+class PollingTimeDisplay(Digits):
+    """The pre-scheduler TimeDisplay: recompute and reformat at 60 Hz."""
+
+    start_time = reactive(monotonic)
+    time_to_display = reactive(0.0)
+    time_left = reactive(0.0)
+
+    def __init__(self, duration_time, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.duration_time = duration_time
+
+    def _format_time(self, time: float) -> str:
+        time = max(0.0, time)
+        minutes, seconds = divmod(time, 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours:02,.0f}:{minutes:02.0f}:{seconds:05.2f}"
+
+    def on_mount(self) -> None:
+        self.update_timer = self.set_interval(
+            1 / 60, self.update_time, pause=True
+        )
+        self.set_reactive(PollingTimeDisplay.time_left, self.duration_time)
+
+    def update_time(self) -> None:
+        self.time_to_display = max(
+            0.0, self.time_left - (monotonic() - self.start_time)
+        )
+
+    def watch_time_to_display(self, time: float) -> None:
+        self.update(self._format_time(time))
+
+    def start(self) -> None:
+        self.start_time = monotonic()
+        self.update_timer.resume()
+
+
+class BenchApp(App):
+    def __init__(self, display_cls, timers: int, **kwargs):
+        super().__init__()
+        self.sound_manager = NullSoundManager()
+        self.tick_scheduler = TickScheduler()
+        self.display_cls = display_cls
+        self.timers = timers
+        self.display_kwargs = kwargs
+
+    def compose(self):
+        for _ in range(self.timers):
+            with VerticalGroup():
+                yield self.display_cls(3600, **self.display_kwargs)
+
+
+async def measure(display_cls, timers: int, seconds: float, **kwargs):
+    app = BenchApp(display_cls, timers, **kwargs)
+    async with app.run_test(size=(120, 10 * timers + 10)) as pilot:
+        await pilot.pause()
+        for display in app.query(display_cls):
+            display.start()
+        cpu_start = process_time()
+        await asyncio.sleep(seconds)
+        cpu = process_time() - cpu_start
+    return cpu / seconds / timers * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--timers", type=int, nargs="+", default=[1, 2, 8])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    variants = [
+        ("polling 60 Hz", PollingTimeDisplay, {}),
+        ("hundredths", TimeDisplay, {"precision": "hundredths"}),
+        ("tenths", TimeDisplay, {"precision": "tenths"}),
+        ("seconds", TimeDisplay, {"precision": "seconds"}),
+    ]
+    print(f"{'variant':<18}{'timers':>8}{'CPU ms/s per timer':>22}")
+    for timers in args.timers:
+        for label, cls, kwargs in variants:
+            cost = asyncio.run(measure(cls, timers, args.seconds, **kwargs))
+            print(f"{label:<18}{timers:>8}{cost:>22.2f}")
+
+
+if __name__ == "__main__":
+    main()
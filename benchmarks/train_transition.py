@@ -0,0 +1,136 @@
+"""Latency between training steps.
+
+Runs a headless training session over a routine of short duration
+exercises and measures, for every transition, the time from a timer
+expiring (when `TimeDisplay.Ended` is posted) to the next timer starting
+and to its first display tick.
+
+    python benchmarks/train_transition.py --exercises 20 --breaks
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+SRC = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+from textual.reactive import var  # noqa: E402
+
+from routine import DurationExercise, Routine, save_routines  # noqa: E402
+from timero import TimeroApp  # noqa: E402
+from widgets.timer import TimeDisplay  # noqa: E402
+
+
+class TransitionProbe:
+    """Timestamps timer expiry, start and first tick on TimeDisplay."""
+
+    def __init__(self):
+        self.ended_at = None
+        self.waiting_for_tick = set()
+        self.to_start = []
+        self.to_first_tick = []
+
+    def install(self):
+        probe = self
+        expire, start, tick = (
+            TimeDisplay.expire,
+            TimeDisplay.start,
+            TimeDisplay.tick,
+        )
+
+        def timed_expire(display, now):
+            probe.ended_at = perf_counter()
+            expire(display, now)
+
+        def timed_start(display):
+            start(display)
+            if probe.ended_at is not None:
+                probe.to_start.append(perf_counter() - probe.ended_at)
+                probe.waiting_for_tick.add(display)
+
+        def timed_tick(display, now):
+            tick(display, now)
+            if display in probe.waiting_for_tick:
+                probe.waiting_for_tick.discard(display)
+                probe.to_first_tick.append(perf_counter() - probe.ended_at)
+
+        TimeDisplay.expire = timed_expire
+        TimeDisplay.start = timed_start
+        TimeDisplay.tick = timed_tick
+        return expire, start, tick
+
+    @staticmethod
+    def uninstall(originals):
+        TimeDisplay.expire, TimeDisplay.start, TimeDisplay.tick = originals
+
+
+async def train(path: Path, exercises: int, breaks: bool) -> TransitionProbe:
+    class BenchmarkApp(TimeroApp):
+        CSS_PATH = SRC / "timero.tcss"
+        routines_path = var(path)
+
+    app = BenchmarkApp(data_dir=path.parent)
+    probe = TransitionProbe()
+    originals = probe.install()
+    try:
+        async with app.run_test(size=(120, 40)) as pilot:
+            # Changed in memory only, so config.json is left alone.
+            app.settings.settings.update(
+                show_breaks=breaks,
+                auto_start_breaks=True,
+                auto_start_exercises=True,
+                break_duration=1,
+            )
+            app.routine_controller.set_routine(app.routines[0])
+            await app.screen_manager.go_to_training()
+            steps = exercises * 2 - 1 if breaks else exercises
+            while len(probe.to_first_tick) < steps - 1:
+                await pilot.pause(0.1)
+    finally:
+        probe.uninstall(originals)
+    return probe
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--exercises", type=int, default=20)
+    parser.add_argument("--breaks", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "routines.json"
+        save_routines(
+            path,
+            [
+                Routine(
+                    "Benchmark",
+                    [
+                        DurationExercise(f"Exercise {i}", 1)
+                        for i in range(args.exercises)
+                    ],
+                )
+            ],
+        )
+        probe = asyncio.run(train(path, args.exercises, args.breaks))
+
+    print(f"{len(probe.to_first_tick)} transitions")
+    print(f"{'ended to':<14}{'median ms':>12}{'max ms':>10}")
+    for label, values in (
+        ("start", probe.to_start),
+        ("first tick", probe.to_first_tick),
+    ):
+        print(
+            f"{label:<14}{statistics.median(values) * 1000:>12.1f}"
+            f"{max(values) * 1000:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Bulk statistics over the session journal, computed with NumPy.
+
+Journal segments are memory-mapped as NumPy structured arrays (the
+records are fixed-size, so no parsing is needed) and the statistics of
+every exercise or routine are computed at once, without a Python loop
+over the records. NumPy is only needed for this module:
+
+    pip install numpy
+
+Statistics can be printed or exported to CSV (run from `src`):
+
+    python -m analytics ../sessions --by exercise --csv ../exercises.csv
+"""
+
+import csv
+from functools import cache
+from numbers import Integral
+from pathlib import Path
+from typing import NamedTuple
+
+from storage.session_journal import (
+    HEADER,
+    RECORD,
+    Event,
+    JournalRecord,
+    StepKind,
+    check_header,
+    read_names,
+    segment_paths,
+)
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Workout analytics need NumPy, install it with "
+            "`pip install numpy`"
+        ) from e
+    return numpy
+
+
+@cache
+def record_dtype():
+    """NumPy dtype with the same layout as `RECORD`."""
+    return _numpy().dtype(
+        {
+            "names": JournalRecord._fields,
+            "formats": ["<i8"] * 4 + ["<u4"] * 4 + ["u1"] * 3,
+            "offsets": [0, 8, 16, 24, 32, 36, 40, 44, 48, 49, 50],
+            "itemsize": RECORD.size,
+        }
+    )
+
+
+def map_segment(path: str):
+    """The records of a journal segment as a read-only memory-mapped
+    array."""
+    np = _numpy()
+    with open(path, "rb") as f:
+        check_header(f.read(HEADER.size), path)
+    # A partial record left by a crash is not mapped.
+    count = (Path(path).stat().st_size - HEADER.size) // RECORD.size
+    if count <= 0:
+        return np.zeros(0, dtype=record_dtype())
+    return np.memmap(
+        path,
+        dtype=record_dtype(),
+        mode="r",
+        offset=HEADER.size,
+        shape=(count,),
+    )
+
+
+class StepStats(NamedTuple):
+    """Statistics of exercise steps, one array element per group.
+
+    Times are in seconds and only count steps that were done, not
+    skipped. `overrun` and `adherence` compare the actual and planned
+    time of duration exercises; `adherence` is NaN for groups without
+    any.
+    """
+
+    name: list[str]
+    count: object
+    skipped: object
+    total: object
+    mean: object
+    p50: object
+    p95: object
+    planned: object
+    overrun: object
+    adherence: object
+
+    def rows(self):
+        return zip(*(self[i] for i in range(len(self))))
+
+
+def _percentile(np, values, starts, counts, q: float):
+    """Percentile `q` of every sorted run `values[start:start + count]`,
+    interpolated linearly."""
+    position = starts + q * (counts - 1)
+    low = np.floor(position).astype(np.int64)
+    high = np.minimum(low + 1, starts + counts - 1)
+    low_values = values[low]
+    return low_values + (values[high] - low_values) * (position - low)
+
+
+def step_stats(directory: str, by: str = "exercise") -> StepStats:
+    """Statistics of the steps in the journal, grouped by exercise name or
+    by routine name (`by="routine"`)."""
+    if by not in ("exercise", "routine"):
+        raise ValueError(f"Cannot group steps by {by!r}")
+    np = _numpy()
+    names = read_names(directory)
+    columns = {"key": [], "event": [], "kind": [], "planned": [], "actual": []}
+    for path in segment_paths(directory):
+        records = map_segment(path)
+        kind = records["step_kind"]
+        event = records["event"]
+        steps = (
+            ((event == Event.STEP_END) | (event == Event.SKIP))
+            & (kind != StepKind.BREAK)
+            & (kind != StepKind.NONE)
+        )
+        columns["key"].append(records[by][steps])
+        columns["event"].append(event[steps])
+        columns["kind"].append(kind[steps])
+        columns["planned"].append(records["planned_ns"][steps])
+        columns["actual"].append(records["actual_ns"][steps])
+    key, event, kind, planned, actual = (
+        np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+        for parts in columns.values()
+    )
+
+    groups = len(names)
+    done = event == Event.STEP_END
+    skipped = np.bincount(key[~done], minlength=groups)
+    # Done steps sorted by group, then by time, so every group is a sorted
+    # run for the percentiles.
+    # Sorting by time and then stably by group is much faster than
+    # np.lexsort, as small group IDs are radix sorted.
+    order = np.flatnonzero(done)
+    order = order[np.argsort(actual[order])]
+    order = order[
+        np.argsort(
+            key[order].astype(np.min_scalar_type(groups)), kind="stable"
+        )
+    ]
+    key, kind, planned, actual = (
+        key[order],
+        kind[order],
+        planned[order],
+        actual[order],
+    )
+    ids, starts, counts = np.unique(key, return_index=True, return_counts=True)
+    ids = ids.astype(np.int64)
+
+    def per_group(values, fill=0.0):
+        result = np.full(groups, fill)
+        result[ids] = values
+        return result
+
+    def group_sum(values):
+        if not len(values):
+            return np.zeros(0, dtype=np.int64)
+        return np.add.reduceat(values, starts)
+
+    count = per_group(counts, 0).astype(np.int64)
+    total = per_group(group_sum(actual)) / 1e9
+    duration = kind == StepKind.DURATION
+    duration_actual = per_group(group_sum(np.where(duration, actual, 0)))
+    duration_planned = per_group(group_sum(np.where(duration, planned, 0)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = total / count
+        adherence = np.where(
+            duration_planned > 0, duration_actual / duration_planned, np.nan
+        )
+    stats = StepStats(
+        names,
+        count,
+        skipped,
+        total,
+        mean,
+        per_group(_percentile(np, actual, starts, counts, 0.5), np.nan) / 1e9,
+        per_group(_percentile(np, actual, starts, counts, 0.95), np.nan) / 1e9,
+        per_group(group_sum(planned)) / 1e9,
+        (duration_actual - duration_planned) / 1e9,
+        adherence,
+    )
+    # Keep only the names that have steps (name 0 is the empty name).
+    present = np.flatnonzero(count + skipped)
+    present = present[present > 0]
+    return StepStats(
+        [names[i] for i in present], *(column[present] for column in stats[1:])
+    )
+
+
+def write_csv(stats: StepStats, file) -> None:
+    writer = csv.writer(file)
+    writer.writerow(StepStats._fields)
+    for row in stats.rows():
+        writer.writerow(
+            value if isinstance(value, (str, Integral)) else f"{value:.3f}"
+            for value in row
+        )
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(
+        description="Statistics of the exercises in the session journal."
+    )
+    parser.add_argument("journal", type=Path)
+    parser.add_argument(
+        "--by", choices=("exercise", "routine"), default="exercise"
+    )
+    parser.add_argument("--csv", type=Path, help="write the statistics here")
+    args = parser.parse_args()
+    stats = step_stats(args.journal, args.by)
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            write_csv(stats, f)
+    else:
+        write_csv(stats, sys.stdout)
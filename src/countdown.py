@@ -0,0 +1,67 @@
+from time import monotonic_ns
+
+NS_PER_SECOND = 1_000_000_000
+
+
+def seconds_to_ns(seconds: float) -> int:
+    return round(seconds * NS_PER_SECOND)
+
+
+class Countdown:
+    """A countdown kept as integer nanoseconds of accumulated run time.
+
+    Time only passes inside running segments, from `start` to `stop`.
+    Stopping adds the segment's exact length to `elapsed_ns`, so pausing
+    and resuming any number of times never accumulates rounding error.
+    Every method takes an optional `now` reading of `clock`.
+    """
+
+    __slots__ = ("duration_ns", "elapsed_ns", "segment_start", "clock")
+
+    def __init__(self, duration_ns: int, clock=monotonic_ns):
+        self.duration_ns = duration_ns
+        self.elapsed_ns = 0
+        self.segment_start: int | None = None
+        self.clock = clock
+
+    @property
+    def is_running(self) -> bool:
+        return self.segment_start is not None
+
+    def start(self, now: int | None = None) -> None:
+        if self.segment_start is None:
+            self.segment_start = self.clock() if now is None else now
+
+    def stop(self, now: int | None = None) -> None:
+        if self.segment_start is not None:
+            now = self.clock() if now is None else now
+            self.elapsed_ns += now - self.segment_start
+            self.segment_start = None
+
+    def reset(self, duration_ns: int | None = None) -> None:
+        """Stop and rewind, optionally to a new duration."""
+        if duration_ns is not None:
+            self.duration_ns = duration_ns
+        self.elapsed_ns = 0
+        self.segment_start = None
+
+    def elapsed(self, now: int | None = None) -> int:
+        if self.segment_start is None:
+            return self.elapsed_ns
+        now = self.clock() if now is None else now
+        return self.elapsed_ns + now - self.segment_start
+
+    def remaining(self, now: int | None = None) -> int:
+        """Nanoseconds left, negative once the countdown has overrun."""
+        return self.duration_ns - self.elapsed(now)
+
+    def overrun(self, now: int | None = None) -> int:
+        """Nanoseconds run past the end."""
+        return max(0, -self.remaining(now))
+
+    @property
+    def deadline(self) -> int | None:
+        """Clock reading at which the running countdown ends."""
+        if self.segment_start is None:
+            return None
+        return self.segment_start + self.duration_ns - self.elapsed_ns
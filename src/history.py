@@ -0,0 +1,239 @@
+"""Workout history rolled up from the session journal.
+
+`WorkoutHistory` keeps running totals per routine and per exercise name,
+overall and per day and ISO week, so statistics never need the journal to
+be read again. Sessions are folded in when a training is finished;
+abandoned sessions are kept in the journal but left out of the history.
+The rollups can be rebuilt from the journal at any time (run from `src`):
+
+    python -m history --rebuild ../sessions ../history.json
+"""
+
+import json
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+from storage.session_journal import (
+    Event,
+    Flag,
+    StepKind,
+    read_journal,
+    read_names,
+)
+from utils.files import atomic_write
+
+
+class SessionStep(NamedTuple):
+    exercise: str
+    step_kind: int
+    planned_ns: int
+    actual_ns: int
+    skipped: bool
+
+
+class Session(NamedTuple):
+    session: int
+    routine: str
+    started_wall_ns: int
+    duration_ns: int
+    # Whether the whole plan was gone through (steps may have been
+    # skipped).
+    completed: bool
+    steps: tuple[SessionStep, ...]
+
+
+def sessions_from_journal(directory: str) -> Iterator[Session]:
+    """Every session in the journal that has ended, in order."""
+    names = read_names(directory)
+    open_sessions = {}
+    for record in read_journal(directory):
+        if record.event == Event.SESSION_START:
+            open_sessions[record.session] = (record, [])
+        elif record.session not in open_sessions:
+            continue
+        elif record.event in (Event.STEP_END, Event.SKIP):
+            open_sessions[record.session][1].append(
+                SessionStep(
+                    names[record.exercise],
+                    record.step_kind,
+                    record.planned_ns,
+                    record.actual_ns,
+                    record.event == Event.SKIP,
+                )
+            )
+        elif record.event == Event.SESSION_END:
+            start, steps = open_sessions.pop(record.session)
+            yield Session(
+                record.session,
+                names[start.routine],
+                start.wall_ns,
+                record.actual_ns,
+                bool(record.flags & Flag.COMPLETED),
+                tuple(steps),
+            )
+
+
+def _week_of(day: date) -> str:
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02}"
+
+
+def _add(totals: dict, key: str, values: Iterable[int]) -> None:
+    current = totals.get(key)
+    if current is None:
+        totals[key] = list(values)
+    else:
+        for i, value in enumerate(values):
+            current[i] += value
+
+
+class WorkoutHistory:
+    """Rollups of finished sessions, stored as JSON at `path`.
+
+    Totals are lists so they serialize as-is:
+    - `routines[name]`: sessions, active ns, planned ns
+    - `exercises[name]`: times done, times skipped, active ns, planned ns
+    - `days[date][routine]` and `weeks[week][routine]`: sessions, active ns
+    - `exercise_days[date][name]` and `exercise_weeks[week][name]`: times
+      done, times skipped, active ns
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str | None = None):
+        self.path = Path(path) if path is not None else None
+        self._loaded = False
+        self._clear()
+
+    def _clear(self) -> None:
+        self.routines: dict[str, list[int]] = {}
+        self.exercises: dict[str, list[int]] = {}
+        self.days: dict[str, dict[str, list[int]]] = {}
+        self.weeks: dict[str, dict[str, list[int]]] = {}
+        self.exercise_days: dict[str, dict[str, list[int]]] = {}
+        self.exercise_weeks: dict[str, dict[str, list[int]]] = {}
+
+    def load(self) -> "WorkoutHistory":
+        """Read the rollups once; later calls return straight away."""
+        if self._loaded:
+            return self
+        self._loaded = True
+        if self.path is None or not self.path.exists():
+            return self
+        try:
+            data = json.loads(self.path.read_text())
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"Error loading history: {e}")
+            return self
+        if data.get("version") != self.VERSION:
+            return self
+        self.routines = data["routines"]
+        self.exercises = data["exercises"]
+        self.days = data["days"]
+        self.weeks = data["weeks"]
+        # Missing from files written before they were added, until the
+        # history is rebuilt.
+        self.exercise_days = data.get("exercise_days", {})
+        self.exercise_weeks = data.get("exercise_weeks", {})
+        return self
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        data = {
+            "version": self.VERSION,
+            "routines": self.routines,
+            "exercises": self.exercises,
+            "days": self.days,
+            "weeks": self.weeks,
+            "exercise_days": self.exercise_days,
+            "exercise_weeks": self.exercise_weeks,
+        }
+        try:
+            atomic_write(self.path, json.dumps(data))
+        except OSError as e:
+            print(f"Error saving history: {e}")
+
+    def _fold(self, session: Session) -> None:
+        day = datetime.fromtimestamp(session.started_wall_ns / 1e9).date()
+        exercise_day = self.exercise_days.setdefault(day.isoformat(), {})
+        exercise_week = self.exercise_weeks.setdefault(_week_of(day), {})
+        active_ns = 0
+        for step in session.steps:
+            active_ns += step.actual_ns
+            if step.step_kind == StepKind.BREAK:
+                continue
+            skipped = int(step.skipped)
+            _add(
+                self.exercises,
+                step.exercise,
+                (1, skipped, step.actual_ns, step.planned_ns),
+            )
+            for totals in (exercise_day, exercise_week):
+                _add(totals, step.exercise, (1, skipped, step.actual_ns))
+        _add(
+            self.routines,
+            session.routine,
+            (1, active_ns, sum(step.planned_ns for step in session.steps)),
+        )
+        _add(
+            self.days.setdefault(day.isoformat(), {}),
+            session.routine,
+            (1, active_ns),
+        )
+        _add(
+            self.weeks.setdefault(_week_of(day), {}),
+            session.routine,
+            (1, active_ns),
+        )
+
+    def add_session(self, session: Session) -> None:
+        """Fold in a finished session and save the rollups."""
+        self.load()
+        self._fold(session)
+        self.save()
+
+    def rebuild(self, journal_directory: str) -> int:
+        """Recompute every rollup from the journal; returns the session
+        count."""
+        self._loaded = True
+        self._clear()
+        count = 0
+        for session in sessions_from_journal(journal_directory):
+            if session.completed:
+                self._fold(session)
+                count += 1
+        self.save()
+        return count
+
+    def streaks(self, today: date | None = None) -> tuple[int, int]:
+        """Current and longest runs of consecutive days with a session.
+
+        The current streak is still alive if the last workout was
+        yesterday.
+        """
+        today = today or date.today()
+        days = sorted(date.fromisoformat(day) for day in self.days)
+        longest = run = 0
+        previous = None
+        for day in days:
+            run = run + 1 if previous == day - timedelta(days=1) else 1
+            longest = max(longest, run)
+            previous = day
+        current = run if previous and today - previous <= timedelta(1) else 0
+        return current, longest
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Rebuild the workout history from the session journal."
+    )
+    parser.add_argument("--rebuild", action="store_true", required=True)
+    parser.add_argument("journal", type=Path)
+    parser.add_argument("history", type=Path)
+    args = parser.parse_args()
+    count = WorkoutHistory(args.history).rebuild(args.journal)
+    print(f"Rebuilt history from {count} sessions")
@@ -1,15 +1,25 @@
 import json
+from sys import intern
+
+from utils.files import atomic_write
 
 
 class Exercise:
-    def __init__(self, name: str, type: str):
+    # Exercises are kept resident by the tens of thousands, so they use
+    # slots and share their type tag through the class.
+    __slots__ = ("name",)
+    type: str = None
+
+    def __init__(self, name: str):
         self.name = name
-        self.type = type
 
 
 class DurationExercise(Exercise):
+    __slots__ = ("duration",)
+    type = "duration"
+
     def __init__(self, name: str, duration: int):
-        super().__init__(name, type="duration")
+        super().__init__(name)
         self.duration = duration
 
     def duration_mask_string(self) -> str:
@@ -24,15 +34,50 @@ class DurationExercise(Exercise):
 
 
 class RepetitionExercise(Exercise):
+    __slots__ = ("repetitions",)
+    type = "repetition"
+
     def __init__(self, name: str, repetitions: int):
-        super().__init__(name, type="repetition")
+        super().__init__(name)
         self.repetitions = repetitions
 
 
 class Routine:
-    def __init__(self, name: str, exercises: list[Exercise] = None):
+    """A named list of exercises.
+
+    Routines loaded from an index are created with a `loader` instead of
+    exercises; the exercises are decoded on first access and can later be
+    dropped again with `unload`.
+    """
+
+    __slots__ = ("name", "_exercises", "_loader")
+
+    def __init__(
+        self, name: str, exercises: list[Exercise] = None, loader=None
+    ):
+        if exercises is None and loader is None:
+            exercises = []
         self.name = name
-        self.exercises = exercises if exercises else []
+        self._exercises = exercises
+        self._loader = loader
+
+    @property
+    def exercises(self) -> list[Exercise]:
+        if self._exercises is None:
+            self._exercises = self._loader(self)
+        return self._exercises
+
+    @exercises.setter
+    def exercises(self, exercises: list[Exercise]) -> None:
+        self._exercises = exercises
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._exercises is not None
+
+    def unload(self) -> None:
+        if self._loader is not None:
+            self._exercises = None
 
     def add_exercise(self, exercise: Exercise):
         self.exercises.append(exercise)
@@ -74,16 +119,33 @@ class RoutineDecoder(json.JSONDecoder):
                 routine = Routine(obj["name"])
                 routine.exercises = obj["exercises"]
                 return routine
+            # Exercise names repeat across routines, so share one copy.
             elif obj["__type__"] == "DurationExercise":
-                return DurationExercise(obj["name"], obj["duration"])
+                return DurationExercise(intern(obj["name"]), obj["duration"])
             elif obj["__type__"] == "RepetitionExercise":
-                return RepetitionExercise(obj["name"], obj["repetitions"])
+                return RepetitionExercise(
+                    intern(obj["name"]), obj["repetitions"]
+                )
         return obj
 
 
+def dumps_routine(routine: Routine) -> str:
+    return json.dumps(routine, cls=RoutineEncoder)
+
+
+def dumps_routines(routines) -> str:
+    """A JSON array with one routine per line.
+
+    The layout lets a routine's name and position in the file be found
+    without decoding its exercises.
+    """
+    if not routines:
+        return "[]\n"
+    return "[\n" + ",\n".join(dumps_routine(r) for r in routines) + "\n]\n"
+
+
 def save_routines(filename, routines):
-    with open(filename, "w") as file:
-        json.dump(routines, file, cls=RoutineEncoder, indent=2)
+    atomic_write(filename, dumps_routines(routines))
 
 
 def load_routines(filename):
@@ -1,42 +1,136 @@
 from textual.app import App
 import datetime
+from collections.abc import Sequence
+from itertools import count
 from routine import (
     DurationExercise,
     RepetitionExercise,
     Routine,
 )
+from routine_index import RoutineNameIndex
+from storage.codecs import CODECS
+from storage.routine_store import FileRoutineStore, RoutineStore
 
 
 class RoutineController:
     def __init__(self, app):
         self.app: App = app
         self.routine: Routine = None
+        self.store: RoutineStore = self._create_store()
+        self.name_index = RoutineNameIndex()
+        self._routines_by_name: dict[str, Routine] = {}
+        self._routines_by_id: dict[int, Routine] = {}
+        self._routine_ids: dict[Routine, int] = {}
+        self._next_ids = count(1)
+        # Bumped whenever app.routines changes, so views can tell they are
+        # out of date.
+        self.routines_version = 0
+
+    def _create_store(self) -> RoutineStore:
+        storage = self.app.settings.get("routines_storage")
+        if storage == "sqlite":
+            from storage.sqlite_store import SqliteRoutineStore
+
+            return SqliteRoutineStore(
+                self.app.routines_path.with_suffix(".db"),
+                import_from=self.app.routines_path,
+            )
+        # File formats import from each other, so switching the format
+        # converts the existing routines file.
+        codec = CODECS.get(storage, CODECS["json"])
+        other_formats = [c for c in CODECS if c != codec.name]
+        return FileRoutineStore(
+            self.app.routines_path.with_suffix(f".{codec.name}"),
+            codec=codec,
+            delay=self.app.settings.get("routines_save_delay"),
+            import_from=self.app.routines_path.with_suffix(
+                f".{other_formats[0]}"
+            ),
+        )
 
     def create_and_set_new_routine(self) -> None:
         x = datetime.datetime.now()
-        self.routine = Routine(name=f"Routine-{x.strftime('%d-%m-%Y-%X')}")
+        self.set_routine(Routine(name=f"Routine-{x.strftime('%d-%m-%Y-%X')}"))
+
+    def _register(self, routine: Routine) -> None:
+        routine_id = next(self._next_ids)
+        self._routines_by_name[routine.name] = routine
+        self._routines_by_id[routine_id] = routine
+        self._routine_ids[routine] = routine_id
+
+    def _index_routines(self, routines: list[Routine]) -> None:
+        self.name_index = RoutineNameIndex(routines)
+        self._routines_by_name = {}
+        self._routines_by_id = {}
+        self._routine_ids = {}
+        for routine in routines:
+            self._register(routine)
+
+    def routine_id(self, routine: Routine) -> int | None:
+        """Session-wide ID that survives renames, reordering and removal
+        of other routines."""
+        return self._routine_ids.get(routine)
+
+    def get_routine(self, routine_id: int) -> Routine | None:
+        return self._routines_by_id.get(routine_id)
+
+    def get_routine_by_name(self, routine_name: str) -> Routine | None:
+        return self._routines_by_name.get(routine_name)
 
     def check_if_routine_exists(self, routine_name: str) -> bool:
-        for r in self.app.routines:
-            if r.name == routine_name:
-                return True
-        return False
+        return routine_name in self._routines_by_name
 
     def set_routine(self, routine: Routine) -> None:
         self.routine = routine
+        self.store.pin(routine)
 
     def unset_routine(self) -> None:
         self.routine = None
+        self.store.pin(None)
 
     def set_routine_name(self, routine_name: Routine) -> bool:
+        if self.routine in self._routine_ids:
+            return self.rename_routine(self.routine, routine_name)
         if self.check_if_routine_exists(routine_name):
             return False
         else:
             self.routine.name = routine_name
             return True
 
+    def rename_routine(self, routine: Routine, routine_name: str) -> bool:
+        if routine.name == routine_name:
+            return True
+        if self.check_if_routine_exists(routine_name):
+            return False
+        if self._routines_by_name.get(routine.name) is routine:
+            del self._routines_by_name[routine.name]
+        routine.name = routine_name
+        self._routines_by_name[routine_name] = routine
+        self.name_index.rename(routine)
+        self.routines_version += 1
+        self.store.routine_changed(routine)
+        return True
+
     def add_routine_to_app_routines(self):
         self.app.routines.append(self.routine)
+        self._register(self.routine)
+        self.name_index.add(self.routine)
+        self.routines_version += 1
+
+    def delete_routine(self, routine: Routine) -> None:
+        self.app.routines.remove(routine)
+        if self._routines_by_name.get(routine.name) is routine:
+            del self._routines_by_name[routine.name]
+        del self._routines_by_id[self._routine_ids.pop(routine)]
+        self.name_index.remove(routine)
+        self.routines_version += 1
+        self.store.routine_removed(routine)
+        if self.routine is routine:
+            self.unset_routine()
+
+    def find_routines(self, query: str) -> Sequence[int]:
+        """Positions in `name_index.routines` that match `query`."""
+        return self.name_index.search(query)
 
     def get_routine_name(self) -> str:
         return self.routine.name
@@ -67,15 +161,19 @@ class RoutineController:
             self.routine.exercises = new_order
 
     def load_routines(self) -> list[Routine]:
-        from routine import load_routines
+        routines = self.store.load()
+        self._index_routines(routines)
+        self.routines_version += 1
+        return routines
 
-        if not self.app.routines_path.exists():
-            open(self.app.routines_path, "w").close()
-            return []
-        else:
-            return load_routines(self.app.routines_path)
+    def save_routine(self) -> None:
+        """Persist the current routine."""
+        if self.routine:
+            self.store.routine_changed(self.routine)
 
-    def save_routines(self):
-        from routine import save_routines
+    def flush(self) -> None:
+        """Wait for pending routine writes to reach the disk."""
+        self.store.flush()
 
-        save_routines(self.app.routines_path, self.app.routines)
+    def close(self) -> None:
+        self.store.close()
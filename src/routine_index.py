@@ -0,0 +1,121 @@
+from collections.abc import Sequence
+
+from routine import Routine
+
+
+class RoutineNameIndex:
+    """Routines with their lower-cased names, for incremental fuzzy search.
+
+    A routine matches when the query's characters appear in its name in
+    order (a subsequence), ignoring case. Results are kept for every
+    prefix of the last query, so typing one more character only checks
+    the routines that matched before it, and deleting one is a lookup.
+
+    Search results are positions in `routines`, which is independent of
+    the order of `app.routines`.
+    """
+
+    def __init__(self, routines: list[Routine] = ()):
+        self.routines: list[Routine] = list(routines)
+        self.names: list[str] = [r.name.lower() for r in self.routines]
+        self._positions: dict[Routine, int] = {
+            r: i for i, r in enumerate(self.routines)
+        }
+        # query -> (matching positions, end of each match in its name)
+        self._results: dict[str, tuple[list[int], list[int] | None]] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, routine: Routine) -> None:
+        self._positions[routine] = len(self.routines)
+        self.routines.append(routine)
+        self.names.append(routine.name.lower())
+        self._results.clear()
+
+    def rename(self, routine: Routine) -> None:
+        """Pick up the new name of a routine."""
+        self.names[self._positions[routine]] = routine.name.lower()
+        self._results.clear()
+
+    def remove(self, routine: Routine) -> None:
+        position = self._positions.pop(routine)
+        del self.routines[position]
+        del self.names[position]
+        for i in range(position, len(self.routines)):
+            self._positions[self.routines[i]] = i
+        self._results.clear()
+
+    def search(self, query: str) -> Sequence[int]:
+        """Positions of the routines matching `query`, in index order.
+
+        The returned list is shared with the cache; do not modify it.
+        """
+        query = query.lower()
+        if not query:
+            self._results.clear()
+            return range(len(self.names))
+
+        prefix = query
+        while prefix and prefix not in self._results:
+            prefix = prefix[:-1]
+
+        # Forget results that are not on the way to this query.
+        for cached in list(self._results):
+            if not query.startswith(cached):
+                del self._results[cached]
+
+        if prefix:
+            indices, ends = self._results[prefix]
+        else:
+            # Match ends are only needed once a second character is typed.
+            char = query[0]
+            indices = [i for i, name in enumerate(self.names) if char in name]
+            ends = None
+            prefix = query[0]
+            self._results[prefix] = indices, ends
+
+        for length in range(len(prefix) + 1, len(query) + 1):
+            indices, ends = self._narrow(query[:length], indices, ends)
+            self._results[query[:length]] = indices, ends
+        return indices
+
+    def _narrow(
+        self, query: str, indices: list[int], ends: list[int] | None
+    ) -> tuple[list[int], list[int]]:
+        """Keep the `indices` that matched `query` minus its last
+        character and still match `query`."""
+        names = self.names
+        char = query[-1]
+        new_indices = []
+        new_ends = []
+        if ends is None:
+            first = query[0]
+            for i in indices:
+                name = names[i]
+                end = name.find(char, name.find(first) + 1)
+                if end >= 0:
+                    new_indices.append(i)
+                    new_ends.append(end)
+            return new_indices, new_ends
+
+        for i, end in zip(indices, ends):
+            # Matching each character as early as possible is enough to
+            # tell whether the rest of the query can still follow.
+            end = names[i].find(char, end + 1)
+            if end >= 0:
+                new_indices.append(i)
+                new_ends.append(end)
+        return new_indices, new_ends
+
+    def match_positions(self, index: int, query: str) -> list[int]:
+        """Positions of the characters of `query` matched in a name."""
+        name = self.names[index]
+        positions = []
+        end = -1
+        for char in query.lower():
+            end = name.find(char, end + 1)
+            if end < 0:
+                return []
+            positions.append(end)
+        return positions
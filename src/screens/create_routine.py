@@ -9,3 +9,6 @@ class CreateRoutineView(Screen):
         yield Header()
         yield RoutineWidget(create_mode=True)
         yield Footer()
+
+    def on_screen_resume(self) -> None:
+        self.query_one(RoutineWidget).sync_with_controller()
@@ -0,0 +1,89 @@
+from textual.screen import Screen
+from textual.app import ComposeResult
+from textual.widgets import Header, Footer, Label, DataTable
+from textual.containers import VerticalScroll
+
+from countdown import NS_PER_SECOND
+from utils.time_strings import seconds_to_time_str
+
+RECENT_WEEKS = 8
+
+
+def _time_str(ns: int) -> str:
+    return seconds_to_time_str(round(ns / NS_PER_SECOND)) or "0s"
+
+
+def _days_str(days: int) -> str:
+    return f"{days} day" if days == 1 else f"{days} days"
+
+
+class HistoryScreen(Screen):
+    """Workout statistics, read from the history rollups only."""
+
+    BINDINGS = [("b", "go_back", "Back")]
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Footer()
+        with VerticalScroll():
+            yield Label(id="history-summary")
+            yield DataTable(id="history-routines", cursor_type="row")
+            yield DataTable(id="history-exercises", cursor_type="row")
+            yield DataTable(id="history-weeks", cursor_type="row")
+
+    def on_mount(self) -> None:
+        self.sub_title = "Workout history"
+        routines = self.query_one("#history-routines", DataTable)
+        routines.border_title = "Routines"
+        routines.add_columns("Routine", "Sessions", "Time", "Planned")
+        exercises = self.query_one("#history-exercises", DataTable)
+        exercises.border_title = "Exercises"
+        exercises.add_columns("Exercise", "Done", "Skipped", "Time", "Planned")
+        weeks = self.query_one("#history-weeks", DataTable)
+        weeks.border_title = "Recent weeks"
+        weeks.add_columns("Week", "Sessions", "Time")
+
+    def on_screen_resume(self) -> None:
+        self.show_history()
+
+    def show_history(self) -> None:
+        history = self.app.history.load()
+        current, longest = history.streaks()
+        sessions = sum(totals[0] for totals in history.routines.values())
+        active_ns = sum(totals[1] for totals in history.routines.values())
+        self.query_one("#history-summary", Label).update(
+            f"{sessions} workouts, {_time_str(active_ns)} in total. "
+            f"Current streak: {_days_str(current)}, "
+            f"longest: {_days_str(longest)}."
+        )
+
+        routines = self.query_one("#history-routines", DataTable)
+        routines.clear()
+        for name, (count, active, planned) in sorted(
+            history.routines.items(), key=lambda item: -item[1][1]
+        ):
+            routines.add_row(
+                name, count, _time_str(active), _time_str(planned)
+            )
+
+        exercises = self.query_one("#history-exercises", DataTable)
+        exercises.clear()
+        for name, (count, skipped, active, planned) in sorted(
+            history.exercises.items(), key=lambda item: -item[1][2]
+        ):
+            exercises.add_row(
+                name, count, skipped, _time_str(active), _time_str(planned)
+            )
+
+        weeks = self.query_one("#history-weeks", DataTable)
+        weeks.clear()
+        for week in sorted(history.weeks, reverse=True)[:RECENT_WEEKS]:
+            totals = history.weeks[week].values()
+            weeks.add_row(
+                week,
+                sum(count for count, _ in totals),
+                _time_str(sum(active for _, active in totals)),
+            )
+
+    def action_go_back(self) -> None:
+        self.app.switch_screen("homepage")
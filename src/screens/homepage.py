@@ -3,8 +3,6 @@ from textual.screen import Screen
 from textual.widgets import Header, Footer, Button
 from textual.containers import HorizontalGroup
 
-from screens.create_routine import CreateRoutineView
-
 
 class Homepage(Screen):
     """Homepage for the app"""
@@ -12,6 +10,7 @@ class Homepage(Screen):
     BINDINGS = [
         ("l", "go_to_routines", "List of routines"),
         ("c", "create_routine", "Create new routine"),
+        ("w", "show_history", "Workout history"),
     ]
 
     def compose(self) -> ComposeResult:
@@ -20,6 +19,7 @@ class Homepage(Screen):
         yield HorizontalGroup(
             Button("List Of Routines", id="list-btn"),
             Button("Create Routine", id="create-btn"),
+            Button("History", id="history-btn"),
             id="start-btns",
         )
 
@@ -29,9 +29,14 @@ class Homepage(Screen):
             self.action_go_to_routines()
         elif button_id == "create-btn":
             self.action_create_routine()
+        elif button_id == "history-btn":
+            self.action_show_history()
 
     def action_go_to_routines(self) -> None:
         self.app.screen_manager.go_to_routine_select()
 
     def action_create_routine(self) -> None:
-        self.app.switch_screen(CreateRoutineView())
+        self.app.screen_manager.go_to_create_routine()
+
+    def action_show_history(self) -> None:
+        self.app.switch_screen("history")
@@ -1,23 +1,65 @@
+from textual import on
 from textual.app import ComposeResult
 from textual.screen import Screen
-from textual.widgets import Header, Footer, ListItem, ListView, Label
+from textual.widgets import Header, Footer, Input
+
+from widgets.routine_list import RoutineList
 
 
 class RoutinesSelectScreen(Screen):
     """Screen with all routines"""
 
+    BINDINGS = [
+        ("down", "move_cursor('down')", "Next"),
+        ("up", "move_cursor('up')", "Previous"),
+    ]
+
     def compose(self) -> ComposeResult:
         yield Header()
         yield Footer()
-        items = (
-            ListItem(Label(r.name), name=str(idx))
-            for idx, r in enumerate(self.app.routines)
+        self.search_input = Input(
+            placeholder="Search routines",
+            type="text",
+            classes="routines-search",
+        )
+        yield self.search_input
+        self.routine_list = RoutineList(
+            self.app.routine_controller.name_index.routines,
+            classes="routines-list",
+        )
+        self.routine_list.border_title = "Select Routine: "
+        yield self.routine_list
+        self.routines_version = self.app.routine_controller.routines_version
+
+    def _show_matches(self, query: str) -> None:
+        controller = self.app.routine_controller
+        self.routine_list.set_matches(
+            controller.find_routines(query),
+            query,
+            controller.name_index.match_positions,
         )
-        lv = ListView(*items, classes="routines-list")
-        lv.border_title = "Select Routine: "
-        yield lv
 
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
-        idx = int(event.item.name)
-        self.app.routine_controller.set_routine(self.app.routines[idx])
+    def on_screen_resume(self) -> None:
+        controller = self.app.routine_controller
+        if self.routines_version != controller.routines_version:
+            self.routines_version = controller.routines_version
+            self.routine_list.routines = controller.name_index.routines
+            self._show_matches(self.search_input.value)
+
+    @on(Input.Changed, ".routines-search")
+    def search_routines(self, event: Input.Changed) -> None:
+        self._show_matches(event.value)
+
+    @on(Input.Submitted, ".routines-search")
+    def select_first_match(self) -> None:
+        self.routine_list.action_select()
+
+    def action_move_cursor(self, direction: str) -> None:
+        if direction == "down":
+            self.routine_list.action_cursor_down()
+        else:
+            self.routine_list.action_cursor_up()
+
+    def on_routine_list_selected(self, event: RoutineList.Selected) -> None:
+        self.app.routine_controller.set_routine(event.routine)
         self.app.screen_manager.go_to_routine()
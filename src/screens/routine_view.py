@@ -14,5 +14,8 @@ class RoutineViewScreen(Screen):
         yield Footer()
         yield RoutineWidget(id="routine-widget")
 
+    def on_screen_resume(self) -> None:
+        self.query_one(RoutineWidget).sync_with_controller()
+
     def action_go_back(self) -> None:
         self.app.screen_manager.go_to_routine_select()
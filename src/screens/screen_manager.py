@@ -1,16 +1,81 @@
+from collections import OrderedDict
+from itertools import count
+
 from textual.app import App
+from textual.await_complete import AwaitComplete
+from textual.screen import Screen
 
 
 class ScreenManager:
-    def __init__(self, app: App):
+    """Navigation between the routine screens.
+
+    Up to `cache_size` screens stay installed after they are left, so
+    going back to one shows it again instead of composing a new one. The
+    least recently used screen is uninstalled when the cache is full.
+    Cached screens catch up with the controller when they are resumed.
+    """
+
+    def __init__(self, app: App, cache_size: int = 8):
         self.app = app
+        self.cache_size = cache_size
+        # cache key -> installed screen name
+        self._screens: OrderedDict[object, str] = OrderedDict()
+        self._names = count()
+
+    def _switch_to(self, key, create_screen) -> AwaitComplete:
+        name = self._screens.get(key)
+        if name is None:
+            screen = create_screen()
+            if self.cache_size <= 0:
+                return self.app.switch_screen(screen)
+            name = f"cached-{next(self._names)}"
+            self.app.install_screen(screen, name)
+            self._screens[key] = name
+        else:
+            self._screens.move_to_end(key)
+        return AwaitComplete(self._switch_and_evict(name))
+
+    async def _switch_and_evict(self, name: str) -> None:
+        # Evicting only once the switch is done lets the screen that was
+        # left go too, and never the one being switched to.
+        await self.app.switch_screen(name)
+        self._evict()
+
+    def _evict(self) -> None:
+        for key in list(self._screens):
+            if len(self._screens) <= self.cache_size:
+                return
+            if self.app.get_screen(self._screens[key]) is self.app.screen:
+                continue
+            self._uninstall(key)
+
+    def _uninstall(self, key) -> None:
+        name = self._screens.pop(key)
+        screen: Screen = self.app.get_screen(name)
+        self.app.uninstall_screen(name)
+        screen.remove()
 
     def go_to_routine(self):
         from screens.routine_view import RoutineViewScreen
 
-        self.app.switch_screen(RoutineViewScreen())
+        controller = self.app.routine_controller
+        routine_id = controller.routine_id(controller.routine)
+        return self._switch_to(("routine", routine_id), RoutineViewScreen)
 
     def go_to_routine_select(self):
         from screens.routine_select import RoutinesSelectScreen
 
-        self.app.switch_screen(RoutinesSelectScreen())
+        return self._switch_to("routine_select", RoutinesSelectScreen)
+
+    def go_to_create_routine(self):
+        from screens.create_routine import CreateRoutineView
+
+        self.app.routine_controller.create_and_set_new_routine()
+        return self._switch_to("create_routine", CreateRoutineView)
+
+    def go_to_training(self):
+        from screens.train_view import TrainView
+
+        # A training session keeps its own progress, so it always starts
+        # on a fresh screen.
+        return self.app.switch_screen(TrainView())
@@ -1,6 +1,14 @@
 from textual.screen import Screen
 from textual.app import ComposeResult
-from textual.widgets import Header, Footer, Switch, Input, Button, Label
+from textual.widgets import (
+    Header,
+    Footer,
+    Switch,
+    Input,
+    Button,
+    Label,
+    Select,
+)
 from textual.containers import (
     VerticalScroll,
     HorizontalGroup,
@@ -63,6 +71,20 @@ class SettingsScreen(Screen):
                     validators=[IsEmptyValidator()],
                 )
 
+            with HorizontalGroup(classes="settings-item-container"):
+                with Middle():
+                    yield Label("Timer precision", classes="setting-label")
+                yield Select(
+                    [
+                        ("Seconds", "seconds"),
+                        ("Tenths", "tenths"),
+                        ("Hundredths", "hundredths"),
+                    ],
+                    allow_blank=False,
+                    value=self.app.settings.get("timer_precision"),
+                    id="timer-precision-select",
+                )
+
             with HorizontalGroup(id="buttons-container"):
                 yield Button("Save", id="save-settings", variant="success")
                 yield Button("Reset to Defaults", id="reset-settings")
@@ -95,12 +117,25 @@ class SettingsScreen(Screen):
             "#auto-start-exercises-switch"
         ).value
         break_duration = int(self.query_one("#break-duration-input").value)
-
-        self.app.settings.set("show_breaks", show_breaks)
-        self.app.settings.set("auto_start_breaks", auto_start_breaks)
-        self.app.settings.set("auto_start_exercises", auto_start_exercises)
-        self.app.settings.set("break_duration", break_duration)
-        self.app.settings.save_settings()
+        timer_precision = self.query_one("#timer-precision-select").value
+
+        try:
+            self.app.settings.update(
+                {
+                    "show_breaks": show_breaks,
+                    "auto_start_breaks": auto_start_breaks,
+                    "auto_start_exercises": auto_start_exercises,
+                    "break_duration": break_duration,
+                    "timer_precision": timer_precision,
+                }
+            )
+        except ValueError as e:
+            self.notify(
+                message=str(e),
+                title="Cannot Save Settings",
+                severity="error",
+            )
+            return
 
         self.app.switch_screen("homepage")
 
@@ -117,3 +152,6 @@ class SettingsScreen(Screen):
         self.query_one("#break-duration-input").value = str(
             self.app.settings.get("break_duration")
         )
+        self.query_one("#timer-precision-select").value = (
+            self.app.settings.get("timer_precision")
+        )
@@ -2,142 +2,200 @@ from textual import on
 from textual.screen import Screen
 from textual.app import ComposeResult
 from textual.widgets import Header, Footer, Button, ProgressBar
-from textual.reactive import reactive
-from textual.css.query import NoMatches
 from widgets.timer import TimeDisplay, Timer
 from widgets.train_repetition import TrainRepetitionWidget
 from widgets.training_end import TrainingEndWidget
+from history import Session
+from training_engine import TrainingEngine, TrainingEvent
+from utils.time_strings import seconds_to_time_str
 
 
 class TrainView(Screen):
+    """A training session, shown from the events of a `TrainingEngine`."""
+
     CSS_PATH = "../widgets/timer.tcss"
 
     BINDINGS = [("s", "skip_exercise", "Skip")]
 
-    is_in_break = reactive(False)
-
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        exercises = self.app.routine_controller.get_exercises()
-        self.exercise_iter = iter(exercises)
-        self.total_exercises = len(exercises)
-        self.show_breaks = self.app.settings.get("show_breaks")
-        self.auto_start_breaks = self.app.settings.get("auto_start_breaks")
-        self.auto_start_exercises = self.app.settings.get(
-            "auto_start_exercises"
+        self.timer_precision = self.app.settings.get("timer_precision")
+        self.engine = TrainingEngine(
+            self.app.routine_controller.routine,
+            self.app.settings,
+            self.app.session_journal,
+            clock=self.app.clock,
         )
-        self.break_duration = self.app.settings.get("break_duration")
-        self.completed_exercises = 0
-
-    def _remove_train_widgets(self) -> None:
-        children = self.query_children()
-        train_widgets = children.exclude(".no-remove")
-        self.remove_children(train_widgets)
-
-    def _show_training_end(self) -> None:
-        self._remove_train_widgets()
-        self.mount(
-            TrainingEndWidget(self.app.routine_controller.get_routine_name())
+        # Step widgets are mounted once and reused; this maps each of them
+        # to the plan position it currently shows.
+        self._loaded = {}
+
+    @property
+    def plan(self):
+        return self.engine.plan
+
+    @property
+    def position(self) -> int:
+        return self.engine.position
+
+    def _show_only(self, widget=None) -> None:
+        for step_widget in self.step_widgets:
+            step_widget.set_class(step_widget is not widget, "hide")
+
+    def _show_training_end(self, session: Session) -> None:
+        self.app.history.add_session(session)
+        self._show_only()
+        self.mount(TrainingEndWidget(self.engine.routine_name))
+
+    def _show_break(self) -> None:
+        self.break_timer.configure(
+            "Break", self.engine.step.duration, self.timer_precision
         )
-
-    def _start_break_timer(self) -> None:
-        self._remove_train_widgets()
-        self.break_timer.reset_timer()
-        self.break_timer.remove_class("hide")
-        self.is_in_break = True
-        if self.auto_start_breaks:
-            self.break_timer.start_timer()
+        self._show_only(self.break_timer)
 
     def _update_progress_bar(self) -> None:
-        progress_percent = (
-            self.completed_exercises / self.total_exercises
-        ) * 100
-        self.progress_bar.update(progress=progress_percent)
-
-    def _show_next_exercise(self):
-        self._remove_train_widgets()
-        e = next(self.exercise_iter, None)
-        self.is_in_break = False
-
-        if e.type == "duration":
-            timer_widget = Timer(
-                title=e.name,
-                duration_time=e.duration,
-                classes="exercise-timer",
-            )
-            self.mount(timer_widget)
-            if self.auto_start_exercises:
-                timer_widget.start_timer()
-        elif e.type == "repetition":
-            train_widget = TrainRepetitionWidget(e)
-            self.mount(train_widget)
+        self.progress_bar.update(
+            progress=self.plan.progress(self.position) * 100
+        )
+        remaining = round(self.plan.remaining(self.position))
+        self.sub_title = (
+            f"About {seconds_to_time_str(remaining)} left" if remaining else ""
+        )
+
+    def _widget_for(self, exercise):
+        if exercise.type == "duration":
+            return self.exercise_timer
+        return self.repetition_widget
+
+    def _load_exercise(self, position: int):
+        """Put the exercise at `position` into its widget."""
+        e = self.plan[position].exercise
+        widget = self._widget_for(e)
+        if self._loaded.get(widget) != position:
+            if e.type == "duration":
+                widget.configure(e.name, e.duration, self.timer_precision)
+            else:
+                widget.show_exercise(e)
+            self._loaded[widget] = position
+        return widget
+
+    def _prepare_next_exercise(self) -> None:
+        """Load the next exercise while its widget is hidden."""
+        position = self.plan.next_exercise(self.position)
+        if self.plan.is_finished(position):
+            return
+        widget = self._widget_for(self.plan[position].exercise)
+        if widget.has_class("hide"):
+            self._load_exercise(position)
+
+    def _show_exercise(self, position: int) -> None:
+        widget = self._load_exercise(position)
+        self._show_only(widget)
+        if widget is self.repetition_widget:
+            widget.call_after_refresh(widget.focus_finished)
+
+    def _current_timer(self) -> Timer:
+        if self.engine.is_in_break:
+            return self.break_timer
+        return self.exercise_timer
 
     def compose(self) -> ComposeResult:
-        yield Header(classes="no-remove")
-        self.progress_bar = ProgressBar(
-            classes="no-remove",
-            total=100,
-            show_eta=False,
-        )
+        yield Header()
+        self.progress_bar = ProgressBar(total=100, show_eta=False)
         yield self.progress_bar
+        # Both timers show the engine's countdown; one is hidden at a time.
         self.break_timer = Timer(
             title="Break",
-            duration_time=self.break_duration,
+            duration_time=self.engine.break_duration,
+            precision=self.timer_precision,
+            countdown=self.engine.countdown,
             id="break-timer",
-            classes="no-remove hide",
+            classes="hide",
+        )
+        self.exercise_timer = Timer(
+            title="",
+            duration_time=0,
+            precision=self.timer_precision,
+            countdown=self.engine.countdown,
+            classes="exercise-timer hide",
+        )
+        self.step_widgets = [self.break_timer, self.exercise_timer]
+        yield from self.step_widgets
+        first_repetitions = next(
+            (
+                step.exercise
+                for step in self.plan.steps
+                if step.kind == "exercise"
+                and step.exercise.type == "repetition"
+            ),
+            None,
         )
-        yield self.break_timer
-        yield Footer(classes="no-remove")
+        self.repetition_widget = None
+        if first_repetitions is not None:
+            self.repetition_widget = TrainRepetitionWidget(
+                first_repetitions, classes="hide"
+            )
+            self.step_widgets.append(self.repetition_widget)
+            yield self.repetition_widget
+        yield Footer()
 
     def on_mount(self) -> None:
-        self._show_next_exercise()
-
-    def choose_next_action(self):
-        if self.completed_exercises == self.total_exercises:
+        self.app.settings.subscribe(self.apply_settings)
+        self.engine.subscribe(self.on_training_event)
+        self.engine.start()
+
+    def on_unmount(self) -> None:
+        self.app.settings.unsubscribe(self.apply_settings)
+        self.engine.unsubscribe(self.on_training_event)
+        self.engine.close()
+
+    def on_training_event(
+        self, event: TrainingEvent, engine: TrainingEngine
+    ) -> None:
+        if event == TrainingEvent.BREAK_STARTED:
             self._update_progress_bar()
-            self._show_training_end()
-            return
-
-        if self.show_breaks:
-            if self.is_in_break:
-                self.break_timer.add_class("hide")
-                self._show_next_exercise()
-            else:
-                self._update_progress_bar()
-                self._start_break_timer()
-        else:
+            self._show_break()
+            self.call_after_refresh(self._prepare_next_exercise)
+        elif event == TrainingEvent.STEP_STARTED:
+            self._update_progress_bar()
+            self._show_exercise(engine.position)
+            self.call_after_refresh(self._prepare_next_exercise)
+        elif event == TrainingEvent.FINISHED:
+            self._update_progress_bar()
+            self._show_training_end(engine.finished_session)
+        elif engine.is_timed:
+            # The countdown was started, paused, reset or ended.
+            self._current_timer().sync()
+
+    def apply_settings(self, changed: dict) -> None:
+        """Apply saved settings to the rest of the training."""
+        if "timer_precision" in changed:
+            self.timer_precision = changed["timer_precision"]
+            self._loaded.pop(self.exercise_timer, None)
+        self.engine.apply_settings(changed)
+        if "show_breaks" in changed or "break_duration" in changed:
             self._update_progress_bar()
-            self._show_next_exercise()
 
     @on(TimeDisplay.Ended, ".exercise-timer TimeDisplay")
-    def exercise_timer_ended(self) -> None:
-        self.completed_exercises += 1
-        self.choose_next_action()
-
     @on(TimeDisplay.Ended, "#break-timer TimeDisplay")
-    def break_timer_ended(self) -> None:
-        self.choose_next_action()
+    def step_timer_ended(self) -> None:
+        # Ended can arrive after the step was skipped, so the engine checks
+        # that the countdown has really run out.
+        if not self.engine.update():
+            self._current_timer().sync()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         button_id = event.button.id
         if button_id == "reps-finished":
-            self.completed_exercises += 1
-            self.choose_next_action()
+            self.engine.finish_step()
+        elif button_id == "stop":
+            self.engine.pause_timer()
+        elif button_id == "start":
+            self.engine.start_timer()
+        elif button_id == "reset":
+            self.engine.reset_timer()
         elif button_id == "exit-training":
             self.app.screen_manager.go_to_routine()
 
     def action_skip_exercise(self):
-        if (
-            not self.is_in_break
-            and self.completed_exercises != self.total_exercises
-        ):
-            self.completed_exercises += 1
-
-        if self.is_in_break:
-            self.break_timer.stop_timer()
-        try:
-            self.query_one(".exercise-timer", Timer).stop_timer()
-        except NoMatches:
-            pass
-
-        self.choose_next_action()
+        self.engine.skip()
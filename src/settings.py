@@ -1,6 +1,26 @@
 import json
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+from utils.files import atomic_write
+from utils.time_strings import TIMER_PRECISIONS
+
+
+def _is_bool(value) -> bool:
+    return isinstance(value, bool)
+
+
+def _is_non_negative_int(value) -> bool:
+    return (
+        isinstance(value, int) and not isinstance(value, bool) and value >= 0
+    )
+
+
+def _is_non_negative_number(value) -> bool:
+    return _is_non_negative_int(value) or (
+        isinstance(value, float) and value >= 0
+    )
 
 
 class Settings:
@@ -9,11 +29,31 @@ class Settings:
         "auto_start_breaks": True,
         "auto_start_exercises": True,
         "break_duration": 10,
+        "timer_precision": "hundredths",
+        "routines_storage": "json",
+        "routines_save_delay": 0.5,
+    }
+
+    VALIDATORS = {
+        "show_breaks": _is_bool,
+        "auto_start_breaks": _is_bool,
+        "auto_start_exercises": _is_bool,
+        "break_duration": _is_non_negative_int,
+        "timer_precision": lambda value: value in TIMER_PRECISIONS,
+        "routines_storage": lambda value: value
+        in ("json", "msgpack", "sqlite"),
+        "routines_save_delay": _is_non_negative_number,
     }
 
+    # Kept by `reset_to_defaults`: switching the storage back would hide
+    # the routines kept in the current one.
+    STORAGE_SETTINGS = ("routines_storage", "routines_save_delay")
+
     def __init__(self, config_path: str):
         self.config_file = Path(config_path)
         self.settings = self.DEFAULT_SETTINGS.copy()
+        self._observers: list[Callable[[dict[str, Any]], None]] = []
+        self._pending: dict[str, Any] | None = None
         self._load_settings()
 
     def _load_settings(self) -> None:
@@ -27,18 +67,79 @@ class Settings:
 
     def save_settings(self) -> None:
         try:
-            with open(self.config_file, "w") as f:
-                json.dump(self.settings, f, indent=4)
+            atomic_write(self.config_file, json.dumps(self.settings, indent=4))
         except IOError as e:
             print(f"Error saving settings: {e}")
 
     def get(self, key: str, default: Any = None) -> Any:
         return self.settings.get(key, default)
 
-    def set(self, key: str, value: Any) -> None:
-        self.settings[key] = value
+    def validate(self, values: dict[str, Any]) -> None:
+        """Raise ValueError naming every invalid value."""
+        invalid = [
+            key
+            for key, value in values.items()
+            if key in self.VALIDATORS and not self.VALIDATORS[key](value)
+        ]
+        if invalid:
+            raise ValueError(f"Invalid settings: {', '.join(invalid)}")
+
+    def update(self, values: dict[str, Any]) -> dict[str, Any]:
+        """Validate and apply several settings with a single write.
+
+        Nothing is applied if any value is invalid. Observers are told
+        which settings actually changed, which are also returned.
+        """
+        if self._pending is not None:
+            self.validate(values)
+            self._pending.update(values)
+            return {}
+
+        self.validate(values)
+        changed = {
+            key: value
+            for key, value in values.items()
+            if key not in self.settings or self.settings[key] != value
+        }
+        if not changed:
+            return changed
+        self.settings.update(changed)
         self.save_settings()
+        for observer in list(self._observers):
+            observer(changed)
+        return changed
+
+    @contextmanager
+    def batch(self):
+        """Collect `set` and `update` calls and apply them on exit."""
+        if self._pending is not None:
+            yield self
+            return
+        self._pending = {}
+        try:
+            yield self
+        except BaseException:
+            self._pending = None
+            raise
+        pending, self._pending = self._pending, None
+        self.update(pending)
+
+    def set(self, key: str, value: Any) -> None:
+        self.update({key: value})
 
     def reset_to_defaults(self) -> None:
-        self.settings = self.DEFAULT_SETTINGS.copy()
-        self.save_settings()
+        self.update(
+            {
+                key: value
+                for key, value in self.DEFAULT_SETTINGS.items()
+                if key not in self.STORAGE_SETTINGS
+            }
+        )
+
+    def subscribe(self, observer: Callable[[dict[str, Any]], None]) -> None:
+        """Call `observer(changed)` whenever settings change."""
+        self._observers.append(observer)
+
+    def unsubscribe(self, observer: Callable[[dict[str, Any]], None]) -> None:
+        if observer in self._observers:
+            self._observers.remove(observer)
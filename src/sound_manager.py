@@ -1,18 +1,134 @@
-import pygame
+import os
+import threading
+from concurrent.futures import Future
 from pathlib import Path
 
 
-class SoundManager:
+class SoundBank:
+    """Decoded sounds kept in memory, keyed by asset filename."""
+
+    def __init__(self, assets_path: str, loader=None):
+        self.assets_path = Path(assets_path)
+        self._loader = loader if loader else self._load_sound
+        self._sounds = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _load_sound(path: Path):
+        import pygame
+
+        return pygame.mixer.Sound(str(path))
+
+    def preload(self, *filenames: str) -> None:
+        """Decode the given assets (all `.wav` assets if none given)."""
+        if not filenames:
+            filenames = sorted(p.name for p in self.assets_path.glob("*.wav"))
+        for filename in filenames:
+            if filename not in self._sounds:
+                self._sounds[filename] = self._loader(
+                    self.assets_path / filename
+                )
+
+    def evict(self, *filenames: str) -> None:
+        """Drop the given assets (all assets if none given) from memory."""
+        if not filenames:
+            self._sounds.clear()
+            return
+        for filename in filenames:
+            self._sounds.pop(filename, None)
+
+    def get(self, filename: str):
+        """Return a playable handle, decoding the asset on a miss."""
+        sound = self._sounds.get(filename)
+        if sound is None:
+            self.misses += 1
+            sound = self._loader(self.assets_path / filename)
+            self._sounds[filename] = sound
+        else:
+            self.hits += 1
+        return sound
+
+    def __contains__(self, filename: str) -> bool:
+        return filename in self._sounds
+
+    def __len__(self) -> int:
+        return len(self._sounds)
+
+
+class NullSoundManager:
+    """Silent backend for machines without an audio device."""
+
+    bank: SoundBank = None
+
+    def __init__(self, *args, **kwargs):
+        self.ready: Future = Future()
+        self.ready.set_result(self)
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether `ready` has resolved; a backend that failed to start
+        stays silent."""
+        return self.ready.done()
+
+    def get_handle(self, filename: str):
+        return self.bank.get(filename) if self.bank else None
+
+    def play(self, handle) -> None:
+        if handle is not None:
+            handle.play()
+
+    def play_sound(self, filename: str):
+        """Play a cue, dropping it if the backend is not ready yet."""
+        self.play(self.get_handle(filename))
+
+    def stop_all_sounds(self):
+        pass
+
+    def quit(self):
+        pass
+
+
+class SoundManager(NullSoundManager):
+    """pygame backend started on a worker thread.
+
+    `ready` resolves once the mixer is up and every asset is decoded. Cues
+    requested before that are dropped; if the mixer fails to start the
+    manager stays silent.
+    """
+
     def __init__(self, audio_assets_path: str):
-        pygame.mixer.init()
         self.assets_path = Path(audio_assets_path)
+        self.ready: Future = Future()
+        self._init_thread = threading.Thread(
+            target=self._init_backend, name="sound-init", daemon=True
+        )
+        self._init_thread.start()
 
-    def play_sound(self, filename: str):
-        audio_path = self.assets_path / filename
-        pygame.mixer.Sound(str(audio_path)).play()
+    def _init_backend(self) -> None:
+        os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+        try:
+            import pygame
+
+            pygame.mixer.init()
+            bank = SoundBank(self.assets_path)
+            bank.preload()
+        except Exception as e:
+            self.ready.set_exception(e)
+            return
+        self.bank = bank
+        self.ready.set_result(self)
 
     def stop_all_sounds(self):
-        pygame.mixer.stop()
+        if self.bank:
+            import pygame
+
+            pygame.mixer.stop()
 
     def quit(self):
-        pygame.mixer.quit()
+        self._init_thread.join()
+        if self.bank:
+            import pygame
+
+            self.bank.evict()
+            pygame.mixer.quit()
@@ -0,0 +1,144 @@
+"""Startup profile for `python src/timero.py --profile-startup`.
+
+The app is started headless in a fresh interpreter running with
+`-X importtime`, so the import timings and the time to first paint are
+those of a real start and not of the already-warm profiling process.
+It works on a temporary copy of the app's data files, which loading may
+rewrite (e.g. to convert the routines file).
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+SRC = Path(__file__).parent
+DATA_DIR = SRC.parent
+DATA_FILES = ("config.json", "banners.json", "history.json", "sessions")
+
+# Runs in the child interpreter. Exits as soon as the first screen has
+# been painted and reports its own timings on stdout.
+_CHILD = """
+from time import perf_counter
+started = perf_counter()
+
+import json
+import sys
+from pathlib import Path
+from textual.reactive import var
+from timero import TimeroApp
+
+SRC = Path.cwd()
+DATA = Path(sys.argv[1])
+
+imported = perf_counter()
+
+
+class ProfiledApp(TimeroApp):
+    CSS_PATH = SRC / "timero.tcss"
+    routines_path = var(DATA / "routines.json")
+    painted = None
+
+    # Textual also runs TimeroApp.on_mount, which pushes the homepage.
+    def on_mount(self):
+        self.call_after_refresh(self.first_paint)
+
+    def first_paint(self):
+        self.painted = perf_counter()
+        self.exit()
+
+
+app = ProfiledApp(data_dir=DATA)
+app.run(headless=True)
+print(json.dumps({
+    "imports": imported - started,
+    "first_paint": app.painted - started,
+}))
+"""
+
+
+def _parse_import_times(stderr: str) -> list[tuple[int, str, float]]:
+    """(depth, module, cumulative seconds) for every `-X importtime` line."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # the header line
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((depth, name.strip(), int(cumulative) / 1e6))
+    return imports
+
+
+def _copy_data(destination: Path) -> None:
+    """Copy the app's data files that exist into `destination`."""
+    names = [*DATA_FILES, *(p.name for p in DATA_DIR.glob("routines.*"))]
+    for name in names:
+        source = DATA_DIR / name
+        if source.is_dir():
+            shutil.copytree(source, destination / name)
+        elif source.exists():
+            shutil.copy2(source, destination / name)
+
+
+def measure_startup() -> dict:
+    """Start the app once and return its startup timings in seconds.
+
+    `imports` lists the modules `timero` imports directly with their
+    cumulative import time, slowest first.
+    """
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    with tempfile.TemporaryDirectory() as data_dir:
+        _copy_data(Path(data_dir))
+        start = perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _CHILD, data_dir],
+            cwd=SRC,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        total = perf_counter() - start
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+
+    imports = _parse_import_times(result.stderr)
+    # importtime lists a module after everything it imported, so timero's
+    # imports are the deeper lines just before it.
+    end = next(i for i, (_, name, _) in enumerate(imports) if name == "timero")
+    depth = imports[end][0]
+    start = end
+    while start > 0 and imports[start - 1][0] > depth:
+        start -= 1
+    direct = sorted(
+        (
+            (name, seconds)
+            for module_depth, name, seconds in imports[start:end]
+            if module_depth == depth + 1
+        ),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+
+    return {
+        "process": total,
+        "imports_time": timings["imports"],
+        "first_paint": timings["first_paint"],
+        "imports": direct,
+    }
+
+
+def print_startup_profile(top: int = 15) -> None:
+    profile = measure_startup()
+    print("Startup (headless, fresh interpreter)")
+    print(f"  {'import timero':<28}{profile['imports_time'] * 1000:>9.1f} ms")
+    print(f"  {'first paint':<28}{profile['first_paint'] * 1000:>9.1f} ms")
+    print(f"  {'whole process':<28}{profile['process'] * 1000:>9.1f} ms")
+    print("Imports of timero (cumulative)")
+    for name, seconds in profile["imports"][:top]:
+        print(f"  {name:<28}{seconds * 1000:>9.1f} ms")
@@ -0,0 +1,220 @@
+"""On-disk layouts for routine files.
+
+A codec turns a routine into a self-contained record, joins records into
+a file and can index a file into `(name, offset, length)` entries without
+decoding exercises.
+
+Convert a routines file between formats (run from `src`):
+
+    python -m storage.codecs routines.json routines.msgpack --format msgpack
+"""
+
+import json
+import re
+from pathlib import Path
+from sys import intern
+
+from routine import (
+    DurationExercise,
+    Exercise,
+    RepetitionExercise,
+    Routine,
+    RoutineDecoder,
+    dumps_routine,
+    load_routines,
+)
+from utils.files import atomic_write
+
+IndexEntry = tuple[str, int, int]
+
+
+class JsonCodec:
+    """JSON array with one routine per line (see `dumps_routines`)."""
+
+    name = "json"
+
+    ROUTINE_LINE = re.compile(
+        rb'\{"__type__": "Routine", "name": ("(?:[^"\\]|\\.)*"), '
+    )
+
+    def index(self, file) -> list[IndexEntry] | None:
+        """Index the file, or return None if it uses another layout."""
+        file.seek(0)
+        lines = iter(file)
+        first_line = next(lines, b"")
+        if first_line.strip() == b"[]":
+            return []
+        if first_line.strip() != b"[":
+            return None
+        entries = []
+        offset = len(first_line)
+        for line in lines:
+            record = line.rstrip(b"\r\n")
+            if record == b"]":
+                break
+            record = record.removesuffix(b",")
+            match = self.ROUTINE_LINE.match(record)
+            if match is None:
+                return None
+            entries.append((json.loads(match.group(1)), offset, len(record)))
+            offset += len(line)
+        return entries
+
+    def decode(self, record: bytes) -> list[Exercise]:
+        return json.loads(record, cls=RoutineDecoder).exercises
+
+    def encode(self, name: str, exercises: list[Exercise]) -> bytes:
+        return dumps_routine(Routine(name, exercises)).encode()
+
+    def join(self, records: list[bytes]) -> tuple[bytes, list[int]]:
+        """Return the file content and the offset of every record."""
+        if not records:
+            return b"[]\n", []
+        offsets = []
+        offset = 2
+        for record in records:
+            offsets.append(offset)
+            offset += len(record) + 2
+        return b"[\n" + b",\n".join(records) + b"\n]\n", offsets
+
+    def load_all(self, path: str) -> list[Routine]:
+        return load_routines(path)
+
+
+class MsgpackCodec:
+    """Versioned header followed by one msgpack array per routine.
+
+    A routine is `[name, [[tag, name, quantity], ...]]` where the tag is
+    `DURATION_TAG` or `REPETITION_TAG` instead of a type name.
+    """
+
+    name = "msgpack"
+
+    MAGIC = b"TIMERO"
+    VERSION = 1
+    HEADER = MAGIC + bytes([VERSION])
+
+    DURATION_TAG = 1
+    REPETITION_TAG = 2
+
+    def _check_header(self, header: bytes) -> None:
+        if len(header) != len(self.HEADER) or header[:-1] != self.MAGIC:
+            raise ValueError("Not a Timero msgpack routines file")
+        version = header[-1]
+        if version > self.VERSION:
+            raise ValueError(f"Unsupported routines file version {version}")
+
+    def index(self, file) -> list[IndexEntry]:
+        import msgpack
+
+        file.seek(0)
+        self._check_header(file.read(len(self.HEADER)))
+        unpacker = msgpack.Unpacker(file, raw=False)
+        entries = []
+        while True:
+            start = unpacker.tell()
+            try:
+                unpacker.read_array_header()
+            except msgpack.OutOfData:
+                break
+            try:
+                name = unpacker.unpack()
+                unpacker.skip()
+            except msgpack.OutOfData:
+                raise ValueError(
+                    "Routines file ends in the middle of a routine"
+                ) from None
+            entries.append(
+                (name, len(self.HEADER) + start, unpacker.tell() - start)
+            )
+        return entries
+
+    def decode(self, record: bytes) -> list[Exercise]:
+        import msgpack
+
+        _, rows = msgpack.unpackb(record, raw=False)
+        return self._exercises(rows)
+
+    def _exercises(self, rows: list) -> list[Exercise]:
+        exercises = []
+        for tag, name, quantity in rows:
+            if tag == self.DURATION_TAG:
+                exercises.append(DurationExercise(intern(name), quantity))
+            elif tag == self.REPETITION_TAG:
+                exercises.append(RepetitionExercise(intern(name), quantity))
+            else:
+                raise ValueError(f"Unknown exercise tag {tag}")
+        return exercises
+
+    def encode(self, name: str, exercises: list[Exercise]) -> bytes:
+        import msgpack
+
+        rows = []
+        for e in exercises:
+            if e.type == "duration":
+                rows.append((self.DURATION_TAG, e.name, e.duration))
+            elif e.type == "repetition":
+                rows.append((self.REPETITION_TAG, e.name, e.repetitions))
+            else:
+                raise ValueError(f"Cannot encode exercise type {e.type!r}")
+        return msgpack.packb((name, rows))
+
+    def join(self, records: list[bytes]) -> tuple[bytes, list[int]]:
+        offsets = []
+        offset = len(self.HEADER)
+        for record in records:
+            offsets.append(offset)
+            offset += len(record)
+        return self.HEADER + b"".join(records), offsets
+
+    def load_all(self, path: str) -> list[Routine]:
+        import msgpack
+
+        with open(path, "rb") as file:
+            self._check_header(file.read(len(self.HEADER)))
+            return [
+                Routine(name, self._exercises(rows))
+                for name, rows in msgpack.Unpacker(file, raw=False)
+            ]
+
+
+CODECS = {codec.name: codec for codec in (JsonCodec(), MsgpackCodec())}
+
+
+def detect_codec(path: str):
+    """Pick the codec of an existing routines file from its first bytes."""
+    with open(path, "rb") as file:
+        head = file.read(len(MsgpackCodec.MAGIC))
+    if head == MsgpackCodec.MAGIC:
+        return CODECS["msgpack"]
+    return CODECS["json"]
+
+
+def load_all_routines(path: str) -> list[Routine]:
+    return detect_codec(path).load_all(path)
+
+
+def save_all_routines(path: str, routines: list[Routine], codec) -> None:
+    data, _ = codec.join([codec.encode(r.name, r.exercises) for r in routines])
+    atomic_write(path, data)
+
+
+def convert_routines(source: str, destination: str, format: str) -> int:
+    """Rewrite a routines file (in any format) in the given format."""
+    routines = load_all_routines(source)
+    save_all_routines(destination, routines, CODECS[format])
+    return len(routines)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Convert a routines file between formats."
+    )
+    parser.add_argument("source", type=Path)
+    parser.add_argument("destination", type=Path)
+    parser.add_argument("--format", choices=sorted(CODECS), required=True)
+    args = parser.parse_args()
+    count = convert_routines(args.source, args.destination, args.format)
+    print(f"Converted {count} routines to {args.format}")
@@ -0,0 +1,260 @@
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+
+from routine import Routine
+from storage.codecs import CODECS, detect_codec
+from utils.files import atomic_write
+
+
+class RoutineStore(ABC):
+    """Persistence backend used by `RoutineController`.
+
+    `load` returns the list of routines the app works on; the store keeps a
+    reference to it. The controller then reports every routine it adds,
+    changes or removes so the backend can persist just that.
+
+    Stores may return routines whose exercises are not decoded yet. Up to
+    `cache_size` decoded routines are kept; beyond that the least recently
+    used routine without unsaved changes is unloaded again. The `pinned`
+    routine (the one the UI is showing) is never unloaded, as edits made
+    through its exercises would be lost when they are decoded again.
+    """
+
+    def __init__(self, path: str, cache_size: int = 64):
+        self.path = Path(path)
+        self.routines: list[Routine] = []
+        self.dirty: set[Routine] = set()
+        self.cache_size = cache_size
+        self._decoded: OrderedDict[Routine, None] = OrderedDict()
+        self.pinned: Routine | None = None
+
+    @abstractmethod
+    def load(self) -> list[Routine]:
+        pass
+
+    @abstractmethod
+    def routine_changed(self, routine: Routine) -> None:
+        pass
+
+    @abstractmethod
+    def routine_removed(self, routine: Routine) -> None:
+        pass
+
+    def touch(self, routine: Routine) -> None:
+        """Mark a routine as the most recently used one."""
+        if routine in self._decoded:
+            self._decoded.move_to_end(routine)
+
+    def pin(self, routine: Routine | None) -> None:
+        """Keep `routine` decoded, releasing the previously pinned one."""
+        self.pinned = routine
+        if routine is not None:
+            self.touch(routine)
+
+    def _remember_decoded(self, routine: Routine) -> None:
+        self._decoded[routine] = None
+        self._decoded.move_to_end(routine)
+        while len(self._decoded) > self.cache_size:
+            victim = next(
+                (r for r in self._decoded if self._can_unload(r)), None
+            )
+            if victim is None or victim is routine:
+                return
+            del self._decoded[victim]
+            victim.unload()
+
+    def _can_unload(self, routine: Routine) -> bool:
+        return routine not in self.dirty and routine is not self.pinned
+
+    def flush(self) -> None:
+        """Block until every reported change is on disk."""
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+
+class FileRoutineStore(RoutineStore):
+    """All routines in a single file, written behind the UI.
+
+    Loading only indexes the file: each routine's name and the position of
+    its record are read, and the exercises are decoded on first use. The
+    format of an existing file is detected; it is rewritten with `codec`
+    if that differs. If `import_from` was modified after `path` (or `path`
+    does not exist yet), routines are taken from it instead, so switching
+    formats back and forth keeps the latest edits.
+
+    Change notifications arriving within `delay` seconds of the first one
+    are coalesced into a single write. The write runs on a worker thread
+    and replaces the file atomically, so a crash never leaves it truncated.
+    Routines that were never decoded are copied over byte for byte.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        codec=CODECS["json"],
+        delay: float = 0.5,
+        cache_size: int = 64,
+        import_from: str = None,
+    ):
+        super().__init__(path, cache_size)
+        self.codec = codec
+        self.import_from = Path(import_from) if import_from else None
+        self.delay = delay
+        self.writes = 0
+        self._read_codec = codec
+        self._offsets: dict[Routine, tuple[int, int, str]] = {}
+        self._file = None
+        self._writing: set[Routine] = set()
+        self._needs_rewrite = False
+        self._lock = threading.Lock()
+        self._file_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._timer: threading.Timer = None
+
+    def _source_path(self) -> Path | None:
+        candidates = [
+            path
+            for path in (self.path, self.import_from)
+            if path and path.exists() and path.stat().st_size > 0
+        ]
+        if not candidates:
+            return None
+        # The first candidate wins a tie.
+        return max(candidates, key=lambda path: path.stat().st_mtime_ns)
+
+    def load(self) -> list[Routine]:
+        source = self._source_path()
+        if source is None:
+            self.routines = []
+            return self.routines
+
+        self._read_codec = detect_codec(source)
+        self._file = open(source, "rb")
+        entries = self._read_codec.index(self._file)
+        if entries is None:
+            # Older JSON layout: decode everything once.
+            routines = self._read_codec.load_all(source)
+        else:
+            routines = []
+            for name, offset, length in entries:
+                routine = Routine(name, loader=self._load_exercises)
+                self._offsets[routine] = (offset, length, name)
+                routines.append(routine)
+
+        if (
+            entries is None
+            or source != self.path
+            or self._read_codec is not self.codec
+        ):
+            self._needs_rewrite = True
+            self._schedule_write()
+        self.routines = routines
+        return self.routines
+
+    def _read_record(self, routine: Routine) -> tuple:
+        """A routine's record and the codec it is written with.
+
+        Both are read under the file lock, as a rewrite may switch the
+        file's format.
+        """
+        with self._file_lock:
+            offset, length, _ = self._offsets[routine]
+            self._file.seek(offset)
+            return self._file.read(length), self._read_codec
+
+    def _load_exercises(self, routine: Routine) -> list:
+        record, codec = self._read_record(routine)
+        exercises = codec.decode(record)
+        self._remember_decoded(routine)
+        return exercises
+
+    def _can_unload(self, routine: Routine) -> bool:
+        return super()._can_unload(routine) and routine not in self._writing
+
+    def _schedule_write(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Timer(self.delay, self._write)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _mark_dirty(self, routine: Routine) -> None:
+        with self._lock:
+            self.dirty.add(routine)
+            self._schedule_write()
+
+    def routine_changed(self, routine: Routine) -> None:
+        self._mark_dirty(routine)
+
+    def routine_removed(self, routine: Routine) -> None:
+        self._mark_dirty(routine)
+
+    def _encode(self, routine: Routine, name: str, exercises) -> bytes:
+        if exercises is None:
+            record, codec = self._read_record(routine)
+            if codec is self.codec and self._offsets[routine][2] == name:
+                return record
+            exercises = codec.decode(record)
+        return self.codec.encode(name, exercises)
+
+    def _write(self) -> None:
+        with self._write_lock:
+            with self._lock:
+                self._timer = None
+                if not (self.dirty or self._needs_rewrite):
+                    return
+                self._writing, self.dirty = self.dirty, set()
+                self._needs_rewrite = False
+                # Copies, as the UI keeps editing the routines while they
+                # are encoded.
+                snapshot = [
+                    (
+                        r,
+                        r.name,
+                        None if r._exercises is None else list(r._exercises),
+                    )
+                    for r in self.routines
+                ]
+
+            records = [self._encode(*routine) for routine in snapshot]
+            data, record_offsets = self.codec.join(records)
+            offsets = {
+                routine: (offset, len(record), name)
+                for (routine, name, _), record, offset in zip(
+                    snapshot, records, record_offsets
+                )
+            }
+
+            try:
+                atomic_write(self.path, data)
+            except OSError as e:
+                print(f"Error saving routines: {e}")
+                with self._lock:
+                    self.dirty |= self._writing
+                    self._writing = set()
+                return
+            self.writes += 1
+
+            with self._file_lock:
+                if self._file is not None:
+                    self._file.close()
+                self._file = open(self.path, "rb")
+                self._read_codec = self.codec
+                self._offsets = offsets
+            self._writing = set()
+
+    def flush(self) -> None:
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        self._write()
+
+    def close(self) -> None:
+        super().close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,295 @@
+"""Append-only journal of workout session events.
+
+Every event is one fixed-size little-endian record (`RECORD`, 56 bytes)
+appended to the newest segment file in the journal directory. Segments
+are named `journal-000001.bin`, `journal-000002.bin`, ... and start with
+a 16-byte header; a new segment is started once the current one would
+grow past `max_segment_bytes`. Records are never rewritten, so a segment
+can be read (or memory-mapped) as a plain array of records.
+
+Routine and exercise names are interned: records store a name ID, which
+is the line number of the name in `names.jsonl` (one JSON string per
+line). ID 0 means no name.
+"""
+
+import json
+import os
+import struct
+import threading
+from enum import IntEnum, IntFlag
+from pathlib import Path
+from time import monotonic_ns, time_ns
+from typing import Iterator, NamedTuple
+
+MAGIC = b"TMRJ"
+VERSION = 1
+HEADER = struct.Struct("<4sHH8x")
+RECORD = struct.Struct("<qqqqIIIIBBB5x")
+NAMES_FILE = "names.jsonl"
+
+
+class Event(IntEnum):
+    SESSION_START = 1
+    SESSION_END = 2
+    STEP_START = 3
+    STEP_END = 4
+    SKIP = 5
+    PAUSE = 6
+    RESUME = 7
+    # A step's countdown started by hand for the first time.
+    TIMER_START = 8
+
+
+class Flag(IntFlag):
+    # On SESSION_END: the whole plan, as it was by then, was gone through.
+    COMPLETED = 1
+
+
+class StepKind(IntEnum):
+    NONE = 0
+    DURATION = 1
+    REPETITION = 2
+    BREAK = 3
+
+
+class JournalRecord(NamedTuple):
+    monotonic_ns: int
+    wall_ns: int
+    # Expected length of the step (or of the whole session).
+    planned_ns: int
+    # Time actually spent, set on STEP_END, SKIP and SESSION_END.
+    actual_ns: int
+    session: int
+    # Position in the workout plan. SESSION_START stores the number of
+    # steps and SESSION_END the position reached.
+    step: int
+    routine: int
+    exercise: int
+    event: int
+    step_kind: int
+    flags: int
+
+
+def segment_paths(directory: str) -> list[Path]:
+    return sorted(Path(directory).glob("journal-*.bin"))
+
+
+def read_names(directory: str) -> list[str]:
+    """Interned names, indexed by name ID (index 0 is the empty name)."""
+    path = Path(directory) / NAMES_FILE
+    names = [""]
+    if path.exists():
+        with open(path, encoding="utf-8") as f:
+            names.extend(json.loads(line) for line in f if line.strip())
+    return names
+
+
+def check_header(data: bytes, path: str) -> None:
+    """Raise ValueError unless `data` starts with a segment header."""
+    magic, version, record_size = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+        raise ValueError(f"Not a Timero journal segment: {path}")
+
+
+def read_segment(path: str) -> Iterator[JournalRecord]:
+    data = Path(path).read_bytes()
+    check_header(data, path)
+    # A crash can leave a partial record at the end; it is ignored.
+    end = HEADER.size + (len(data) - HEADER.size) // RECORD.size * RECORD.size
+    for fields in RECORD.iter_unpack(memoryview(data)[HEADER.size : end]):
+        yield JournalRecord(*fields)
+
+
+def read_journal(directory: str) -> Iterator[JournalRecord]:
+    for path in segment_paths(directory):
+        yield from read_segment(path)
+
+
+class SessionJournal:
+    """Buffered writer for the session journal.
+
+    Recording an event only packs it into an in-memory buffer. The buffer
+    is written `flush_delay` seconds after the first unwritten event, on a
+    worker thread, so the UI never waits for the disk. Nothing is read or
+    created on disk until the first event is recorded.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_segment_bytes: int = 4 * 1024 * 1024,
+        flush_delay: float = 1.0,
+        clock=monotonic_ns,
+        wall_clock=time_ns,
+    ):
+        self.directory = Path(directory)
+        self.max_segment_bytes = max(
+            max_segment_bytes, HEADER.size + RECORD.size
+        )
+        self.flush_delay = flush_delay
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self.writes = 0
+        self._names: dict[str, int] | None = None
+        self._new_names: list[str] = []
+        self._buffer = bytearray()
+        self._last_session = None
+        self._segment: Path | None = None
+        self._segment_size = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._timer: threading.Timer = None
+
+    def _open(self) -> None:
+        self._names = {
+            name: name_id
+            for name_id, name in enumerate(read_names(self.directory))
+        }
+        segments = segment_paths(self.directory)
+        self._last_session = 0
+        for path in reversed(segments):
+            size = path.stat().st_size
+            records = (size - HEADER.size) // RECORD.size
+            if size != HEADER.size + records * RECORD.size:
+                # Drop a record cut short by a crash, so appends stay
+                # aligned.
+                size = HEADER.size + max(records, 0) * RECORD.size
+                os.truncate(path, size)
+            if records > 0:
+                with open(path, "rb") as f:
+                    f.seek(size - RECORD.size)
+                    self._last_session = JournalRecord(
+                        *RECORD.unpack(f.read(RECORD.size))
+                    ).session
+                break
+        if segments:
+            self._segment = segments[-1]
+            self._segment_size = self._segment.stat().st_size
+
+    def _name_id(self, name: str) -> int:
+        if not name:
+            return 0
+        name_id = self._names.get(name)
+        if name_id is None:
+            name_id = self._names[name] = len(self._names)
+            self._new_names.append(name)
+        return name_id
+
+    def begin_session(
+        self, routine: str, steps: int = 0, planned_ns: int = 0
+    ) -> int:
+        """Record the start of a new session and return its ID."""
+        with self._lock:
+            if self._names is None:
+                self._open()
+            self._last_session += 1
+            session = self._last_session
+        self.record(
+            Event.SESSION_START,
+            session,
+            routine=routine,
+            step=steps,
+            planned_ns=planned_ns,
+        )
+        return session
+
+    def record(
+        self,
+        event: Event,
+        session: int,
+        step: int = 0,
+        step_kind: StepKind = StepKind.NONE,
+        routine: str = "",
+        exercise: str = "",
+        planned_ns: int = 0,
+        actual_ns: int = 0,
+        flags: int = 0,
+    ) -> None:
+        now = self.clock()
+        wall = self.wall_clock()
+        with self._lock:
+            if self._names is None:
+                self._open()
+            self._buffer += RECORD.pack(
+                now,
+                wall,
+                planned_ns,
+                actual_ns,
+                session,
+                step,
+                self._name_id(routine),
+                self._name_id(exercise),
+                event,
+                step_kind,
+                flags,
+            )
+            self._schedule_write()
+
+    def _schedule_write(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Timer(self.flush_delay, self._write)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _new_segment(self) -> None:
+        number = int(self._segment.stem.split("-")[1]) if self._segment else 0
+        self._segment = self.directory / f"journal-{number + 1:06}.bin"
+        with open(self._segment, "xb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        self._segment_size = HEADER.size
+
+    def _write(self) -> None:
+        with self._write_lock:
+            with self._lock:
+                self._timer = None
+                data, self._buffer = self._buffer, bytearray()
+                names, self._new_names = self._new_names, []
+            if not data:
+                return
+            view = memoryview(data)
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                # Names go first, so every stored record can be resolved.
+                if names:
+                    with open(
+                        self.directory / NAMES_FILE, "a", encoding="utf-8"
+                    ) as f:
+                        f.writelines(json.dumps(name) + "\n" for name in names)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    names = []
+                while view:
+                    if self._segment is None or (
+                        self._segment_size + RECORD.size
+                        > self.max_segment_bytes
+                    ):
+                        self._new_segment()
+                    room = (
+                        self.max_segment_bytes - self._segment_size
+                    ) // RECORD.size
+                    chunk = view[: room * RECORD.size]
+                    with open(self._segment, "ab") as f:
+                        f.write(chunk)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    self._segment_size += len(chunk)
+                    view = view[len(chunk) :]
+            except OSError as e:
+                print(f"Error writing session journal: {e}")
+                with self._lock:
+                    self._new_names[:0] = names
+                    self._buffer[:0] = view
+                    self._schedule_write()
+                return
+            self.writes += 1
+
+    def flush(self) -> None:
+        """Block until every recorded event is on disk."""
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        self._write()
+
+    def close(self) -> None:
+        self.flush()
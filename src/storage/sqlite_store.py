@@ -0,0 +1,184 @@
+import sqlite3
+from sys import intern
+from pathlib import Path
+
+from routine import (
+    DurationExercise,
+    Exercise,
+    RepetitionExercise,
+    Routine,
+    load_routines,
+)
+from storage.routine_store import RoutineStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS routines (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS exercises (
+    routine_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    PRIMARY KEY (routine_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def exercise_to_row(e: Exercise) -> tuple[str, str, int]:
+    if e.type == "duration":
+        return ("duration", e.name, e.duration)
+    elif e.type == "repetition":
+        return ("repetition", e.name, e.repetitions)
+    raise ValueError(f"Unknown exercise type: {e.type}")
+
+
+def row_to_exercise(kind: str, name: str, quantity: int) -> Exercise:
+    if kind == "duration":
+        return DurationExercise(intern(name), quantity)
+    elif kind == "repetition":
+        return RepetitionExercise(intern(name), quantity)
+    raise ValueError(f"Unknown exercise type: {kind}")
+
+
+class SqliteRoutineStore(RoutineStore):
+    """Routines and exercises stored as rows in a SQLite database.
+
+    Each change is written in its own transaction and only touches the
+    rows of the changed routine whose content differs from what is stored.
+    """
+
+    def __init__(self, path: str, import_from: str = None):
+        super().__init__(path)
+        self.import_from = Path(import_from) if import_from else None
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript(SCHEMA)
+        self._row_ids: dict[Routine, int] = {}
+
+    def _get_meta(self, key: str) -> str | None:
+        row = self.conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def import_json(self, json_path: str) -> int:
+        """Copy routines from a JSON routines file, skipping taken names."""
+        path = Path(json_path)
+        routines = []
+        if path.exists() and path.stat().st_size > 0:
+            routines = load_routines(path)
+
+        imported = 0
+        with self.conn:
+            position = self._next_position()
+            for routine in routines:
+                cursor = self.conn.execute(
+                    "INSERT OR IGNORE INTO routines (name, position) "
+                    "VALUES (?, ?)",
+                    (routine.name, position),
+                )
+                if cursor.rowcount == 0:
+                    continue
+                self.conn.executemany(
+                    "INSERT INTO exercises VALUES (?, ?, ?, ?, ?)",
+                    (
+                        (cursor.lastrowid, pos, *exercise_to_row(e))
+                        for pos, e in enumerate(routine.exercises)
+                    ),
+                )
+                position += 1
+                imported += 1
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('json_imported', ?)",
+                (str(path),),
+            )
+        return imported
+
+    def load(self) -> list[Routine]:
+        if self.import_from and self._get_meta("json_imported") is None:
+            self.import_json(self.import_from)
+
+        self._row_ids = {}
+        self.routines = []
+        for row_id, name in self.conn.execute(
+            "SELECT id, name FROM routines ORDER BY position"
+        ):
+            routine = Routine(name, loader=self._load_exercises)
+            self._row_ids[routine] = row_id
+            self.routines.append(routine)
+        return self.routines
+
+    def _load_exercises(self, routine: Routine) -> list[Exercise]:
+        exercises = [
+            row_to_exercise(*row)
+            for row in self.conn.execute(
+                "SELECT kind, name, quantity FROM exercises "
+                "WHERE routine_id = ? ORDER BY position",
+                (self._row_ids[routine],),
+            )
+        ]
+        self._remember_decoded(routine)
+        return exercises
+
+    def _next_position(self) -> int:
+        row = self.conn.execute("SELECT MAX(position) FROM routines")
+        last = row.fetchone()[0]
+        return 0 if last is None else last + 1
+
+    def routine_changed(self, routine: Routine) -> None:
+        with self.conn:
+            row_id = self._row_ids.get(routine)
+            if row_id is None:
+                row_id = self.conn.execute(
+                    "INSERT INTO routines (name, position) VALUES (?, ?)",
+                    (routine.name, self._next_position()),
+                ).lastrowid
+                self._row_ids[routine] = row_id
+            else:
+                self.conn.execute(
+                    "UPDATE routines SET name = ? WHERE id = ? AND name != ?",
+                    (routine.name, row_id, routine.name),
+                )
+
+            stored = self.conn.execute(
+                "SELECT kind, name, quantity FROM exercises "
+                "WHERE routine_id = ? ORDER BY position",
+                (row_id,),
+            ).fetchall()
+            current = [exercise_to_row(e) for e in routine.exercises]
+            changed = [
+                (row_id, pos, *row)
+                for pos, row in enumerate(current)
+                if pos >= len(stored) or stored[pos] != row
+            ]
+            if changed:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO exercises VALUES (?, ?, ?, ?, ?)",
+                    changed,
+                )
+            if len(stored) > len(current):
+                self.conn.execute(
+                    "DELETE FROM exercises "
+                    "WHERE routine_id = ? AND position >= ?",
+                    (row_id, len(current)),
+                )
+
+    def routine_removed(self, routine: Routine) -> None:
+        row_id = self._row_ids.pop(routine, None)
+        if row_id is None:
+            return
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM exercises WHERE routine_id = ?", (row_id,)
+            )
+            self.conn.execute("DELETE FROM routines WHERE id = ?", (row_id,))
+
+    def close(self) -> None:
+        self.conn.close()
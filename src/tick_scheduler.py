@@ -0,0 +1,108 @@
+import asyncio
+import math
+from time import monotonic
+
+
+class TickScheduler:
+    """A single wake-up source shared by every running timer.
+
+    Each subscriber is registered with a monotonic deadline and the
+    resolution its display shows (e.g. 0.01 for hundredths). The scheduler
+    sleeps until the next moment any subscriber's display would visibly
+    change, but never wakes more than `max_rate` times per second for
+    display updates. Deadlines are never delayed by that cap.
+
+    Subscribers implement `tick(now)`, called on display wake-ups, and
+    `expire(now)`, called once the deadline has passed (after which the
+    subscriber is removed).
+    """
+
+    def __init__(
+        self,
+        clock=monotonic,
+        call_later=None,
+        max_rate: float = 30,
+    ):
+        self.clock = clock
+        self._call_later = call_later
+        self.min_interval = 1 / max_rate
+        self._subscribers = {}
+        self._handle = None
+        self._wake_at = None
+        self._last_tick = -math.inf
+        self.wakeups = 0
+
+    @staticmethod
+    def next_change(now: float, deadline: float, resolution: float) -> float:
+        """Time at which a countdown shown at `resolution` changes next.
+
+        The display shows the remaining time rounded up to a whole number
+        of `resolution` units, so it changes each time the remaining time
+        crosses a multiple of `resolution`, the last one being the deadline.
+        Like the display, it treats float error at a boundary as being on
+        it.
+        """
+        steps_left = math.ceil((deadline - now) / resolution - 1e-9) - 1
+        if steps_left <= 0:
+            return deadline
+        return deadline - steps_left * resolution
+
+    def add(self, subscriber, deadline: float, resolution: float) -> None:
+        self._subscribers[subscriber] = (deadline, resolution)
+        self._arm()
+
+    def remove(self, subscriber) -> None:
+        if self._subscribers.pop(subscriber, None) is not None:
+            self._arm()
+
+    def __contains__(self, subscriber) -> bool:
+        return subscriber in self._subscribers
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def _schedule(self, delay: float, callback):
+        if self._call_later is None:
+            self._call_later = asyncio.get_running_loop().call_later
+        return self._call_later(delay, callback)
+
+    def _arm(self) -> None:
+        if not self._subscribers:
+            if self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
+                self._wake_at = None
+            return
+
+        now = self.clock()
+        next_deadline = math.inf
+        next_change = math.inf
+        for deadline, resolution in self._subscribers.values():
+            next_deadline = min(next_deadline, deadline)
+            next_change = min(
+                next_change, self.next_change(now, deadline, resolution)
+            )
+        next_change = max(next_change, self._last_tick + self.min_interval)
+        wake_at = min(next_change, next_deadline)
+
+        if self._handle is not None:
+            if self._wake_at == wake_at:
+                return
+            self._handle.cancel()
+        self._wake_at = wake_at
+        self._handle = self._schedule(max(0.0, wake_at - now), self._run)
+
+    def _run(self) -> None:
+        self._handle = None
+        now = self.clock()
+        self._last_tick = now
+        self.wakeups += 1
+        for subscriber, (deadline, _) in list(self._subscribers.items()):
+            if subscriber not in self._subscribers:
+                continue
+            if now >= deadline:
+                del self._subscribers[subscriber]
+                subscriber.expire(now)
+            else:
+                subscriber.tick(now)
+        self._arm()
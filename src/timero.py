@@ -1,41 +1,82 @@
 from pathlib import Path
+from time import monotonic_ns
+
 from textual.app import App
 from textual.reactive import reactive, var
 
 
+from countdown import NS_PER_SECOND
 from routine import Routine
 from routine_controller import RoutineController
 from screens.homepage import Homepage
 
 from screens.screen_manager import ScreenManager
-from screens.settings_screen import SettingsScreen
+from history import WorkoutHistory
 from settings import Settings
 from sound_manager import SoundManager
+from storage.session_journal import SessionJournal
+from tick_scheduler import TickScheduler
+from utils.banners import BannerCache
+
+DATA_DIR = Path(__file__).parent.parent
+
+
+def _settings_screen():
+    from screens.settings_screen import SettingsScreen
+
+    return SettingsScreen(id="settings")
+
+
+def _history_screen():
+    from screens.history_screen import HistoryScreen
+
+    return HistoryScreen(id="history")
 
 
 class TimeroApp(App):
     CSS_PATH = "timero.tcss"
+    # Screens other than the homepage are imported on first use.
+    SCREENS = {"settings": _settings_screen, "history": _history_screen}
     BINDINGS = [
         ("h", "go_home", "Homepage"),
         ("ctrl+s", "open_settings", "Settings"),
     ]
 
     routines: list[Routine] = reactive(None)
-    routines_path = var(Path(__file__).parent.parent / "routines.json")
+    routines_path = var(DATA_DIR / "routines.json")
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        clock=monotonic_ns,
+        call_later=None,
+        data_dir: Path = DATA_DIR,
+        **kwargs,
+    ):
+        """`clock` (integer nanoseconds) and `call_later` drive every
+        timer, so a simulated clock can replace them. Settings, banners,
+        the session journal and the history are kept in `data_dir`;
+        routines are at `routines_path`."""
         super().__init__(*args, **kwargs)
+        self.clock = clock
         self.screen_manager = ScreenManager(self)
         self.sound_manager = SoundManager(
             Path(__file__).parent.parent / "assets" / "audio"
         )
-        self.settings = Settings(Path(__file__).parent.parent / "config.json")
+        self.tick_scheduler = TickScheduler(
+            clock=lambda: clock() / NS_PER_SECOND, call_later=call_later
+        )
+        self.banners = BannerCache(data_dir / "banners.json")
+        self.settings = Settings(data_dir / "config.json")
+        self.session_journal = SessionJournal(
+            data_dir / "sessions", clock=clock
+        )
+        self.history = WorkoutHistory(data_dir / "history.json")
         self.routine_controller = RoutineController(self)
         self.routines = self.routine_controller.load_routines()
 
     def on_mount(self) -> None:
         self.install_screen(Homepage(id="homepage"), name="homepage")
-        self.install_screen(SettingsScreen(id="settings"), name="settings")
         self.push_screen("homepage")
         self.theme = "gruvbox"
 
@@ -45,10 +86,31 @@ class TimeroApp(App):
     def action_open_settings(self) -> None:
         self.app.switch_screen("settings")
 
+    def on_unmount(self) -> None:
+        # Textual has no exit event; the app is unmounted on shutdown.
+        self.on_exit()
+
     def on_exit(self):
+        self.routine_controller.flush()
+        self.routine_controller.close()
+        self.session_journal.close()
         self.sound_manager.quit()
 
 
 if __name__ == "__main__":
-    app = TimeroApp()
-    app.run()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Timero workout timer.")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="report import times and time to first paint, then exit",
+    )
+    args = parser.parse_args()
+    if args.profile_startup:
+        from startup_profile import print_startup_profile
+
+        print_startup_profile()
+    else:
+        app = TimeroApp()
+        app.run()
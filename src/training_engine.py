@@ -0,0 +1,282 @@
+"""Sequencing and timing of a training session, without any UI.
+
+`TrainingEngine` walks a routine's `WorkoutPlan`, times breaks and
+duration exercises with a `Countdown` and logs the session to the
+journal. Views subscribe to its events and forward user input to it.
+Time only comes from the injected clock, so a whole session can be
+simulated without waiting:
+
+    engine = TrainingEngine(routine, settings, clock=fake_clock)
+    engine.start()
+    while not engine.is_finished:
+        if engine.is_timed:
+            engine.start_timer()
+            fake_clock.now = engine.countdown.deadline
+            engine.update()
+        else:
+            engine.finish_step()
+"""
+
+from enum import Enum, auto
+from time import monotonic_ns, time_ns
+from typing import Callable
+
+from countdown import Countdown, seconds_to_ns
+from history import Session, SessionStep
+from routine import Routine
+from storage.session_journal import Event, Flag, SessionJournal, StepKind
+from workout_plan import PlanStep, WorkoutPlan
+
+
+class TrainingEvent(Enum):
+    STEP_STARTED = auto()
+    BREAK_STARTED = auto()
+    TIMER_STARTED = auto()
+    TIMER_PAUSED = auto()
+    TIMER_RESET = auto()
+    STEP_ENDED = auto()
+    STEP_SKIPPED = auto()
+    FINISHED = auto()
+
+
+Listener = Callable[[TrainingEvent, "TrainingEngine"], None]
+
+
+class TrainingEngine:
+    """A training session over `routine`, configured from `settings`.
+
+    Listeners are called synchronously with every `TrainingEvent`, after
+    the engine has reached the state the event describes. Breaks and
+    duration exercises are timed by `countdown`; `update` ends them once
+    it has run out. Repetition exercises last until `finish_step`.
+    """
+
+    def __init__(
+        self,
+        routine: Routine,
+        settings,
+        journal: SessionJournal | None = None,
+        clock=monotonic_ns,
+        wall_clock=time_ns,
+    ):
+        self.routine_name = routine.name
+        self.show_breaks = settings.get("show_breaks")
+        self.auto_start_breaks = settings.get("auto_start_breaks")
+        self.auto_start_exercises = settings.get("auto_start_exercises")
+        self.break_duration = settings.get("break_duration")
+        self.plan = WorkoutPlan(
+            routine.exercises, self.show_breaks, self.break_duration
+        )
+        self.journal = journal
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self.countdown = Countdown(0, clock)
+        self.position = 0
+        # The step being trained, kept apart from the plan, which can be
+        # rebuilt by a settings change in the middle of the step.
+        self.step: PlanStep | None = None
+        self._timer_started = False
+        self.session = None
+        self.finished_session: Session | None = None
+        self._steps: list[SessionStep] = []
+        self._listeners: list[Listener] = []
+
+    def subscribe(self, listener: Listener) -> None:
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Listener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _emit(self, event: TrainingEvent) -> None:
+        for listener in list(self._listeners):
+            listener(event, self)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.finished_session is not None
+
+    @property
+    def is_in_break(self) -> bool:
+        return self.step is not None and self.step.kind == "break"
+
+    @property
+    def is_timed(self) -> bool:
+        """Whether the current step is timed by `countdown`."""
+        return self.step is not None and (
+            self.step.kind == "break" or self.step.exercise.type == "duration"
+        )
+
+    def start(self) -> None:
+        self.session_started = self.clock()
+        self.session_started_wall = self.wall_clock()
+        if self.journal is not None:
+            self.session = self.journal.begin_session(
+                self.routine_name,
+                len(self.plan),
+                seconds_to_ns(self.plan.total_duration),
+            )
+        self.go_to_step(0)
+
+    def go_to_step(self, position: int) -> None:
+        self.position = position
+        if self.plan.is_finished(position):
+            self.step = None
+            self.finished_session = self._end_session()
+            self._emit(TrainingEvent.FINISHED)
+            return
+
+        self.step = self.plan[position]
+        self.step_started = self.clock()
+        self._timer_started = False
+        self._record(Event.STEP_START)
+        if self.is_timed:
+            self.countdown.reset(seconds_to_ns(self.step.duration))
+        if self.is_in_break:
+            self._emit(TrainingEvent.BREAK_STARTED)
+            auto_start = self.auto_start_breaks
+        else:
+            self._emit(TrainingEvent.STEP_STARTED)
+            auto_start = self.auto_start_exercises
+        if self.is_timed and auto_start:
+            self.start_timer(record=False)
+
+    def start_timer(self, record: bool = True) -> None:
+        """Start or resume the current step's countdown."""
+        if not self.is_timed or self.countdown.is_running:
+            return
+        self.countdown.start()
+        if record:
+            self._record(
+                Event.RESUME if self._timer_started else Event.TIMER_START
+            )
+        self._timer_started = True
+        self._emit(TrainingEvent.TIMER_STARTED)
+
+    def pause_timer(self) -> None:
+        if not self.is_timed or not self.countdown.is_running:
+            return
+        self.countdown.stop()
+        self._record(Event.PAUSE)
+        self._emit(TrainingEvent.TIMER_PAUSED)
+
+    def reset_timer(self) -> None:
+        """Stop and rewind the countdown to the full step length.
+
+        A break is rewound to the current break duration setting.
+        """
+        if not self.is_timed:
+            return
+        if self.is_in_break:
+            duration = self.break_duration
+        else:
+            duration = self.step.duration
+        self.countdown.reset(seconds_to_ns(duration))
+        self._emit(TrainingEvent.TIMER_RESET)
+
+    def update(self, now: int | None = None) -> bool:
+        """End the current step if its countdown has run out."""
+        if not self.is_timed or not self.countdown.is_running:
+            return False
+        now = self.clock() if now is None else now
+        if self.countdown.remaining(now) > 0:
+            return False
+        self.countdown.stop(now)
+        self.finish_step()
+        return True
+
+    def finish_step(self) -> None:
+        """End the current step as done and go to the next one."""
+        self._end_step(Event.STEP_END, TrainingEvent.STEP_ENDED)
+
+    def skip(self) -> None:
+        self._end_step(Event.SKIP, TrainingEvent.STEP_SKIPPED)
+
+    def _end_step(self, event: Event, training_event: TrainingEvent) -> None:
+        if self.step is None:
+            return
+        if self.is_timed:
+            self.countdown.stop()
+            active_ns = self.countdown.elapsed()
+        else:
+            active_ns = self.clock() - self.step_started
+        self._steps.append(self._record(event, active_ns))
+        self._emit(training_event)
+        self.go_to_step(self.position + 1)
+
+    def apply_settings(self, changed: dict) -> None:
+        """Apply changed settings to the rest of the session.
+
+        A running break keeps its length; later breaks get the new one.
+        """
+        for key in (
+            "show_breaks",
+            "auto_start_breaks",
+            "auto_start_exercises",
+            "break_duration",
+        ):
+            if key in changed:
+                setattr(self, key, changed[key])
+        if self.is_finished:
+            return
+        if "show_breaks" in changed or "break_duration" in changed:
+            plan = self.plan.with_breaks(self.show_breaks, self.break_duration)
+            self.position = plan.equivalent_position(self.plan, self.position)
+            self.plan = plan
+
+    def close(self) -> None:
+        """End the session, if it is not over yet."""
+        if self.step is not None:
+            self.countdown.stop()
+            self.step = None
+            self._end_session()
+
+    def _record(self, event: Event, actual_ns: int = 0) -> SessionStep:
+        """Journal `event` for the current step."""
+        step = self.step
+        if step.kind == "break":
+            step_kind = StepKind.BREAK
+        elif step.exercise.type == "duration":
+            step_kind = StepKind.DURATION
+        else:
+            step_kind = StepKind.REPETITION
+        exercise = step.exercise.name if step.exercise else ""
+        planned_ns = seconds_to_ns(step.duration)
+        if self.journal is not None:
+            self.journal.record(
+                event,
+                self.session,
+                step=self.position,
+                step_kind=step_kind,
+                routine=self.routine_name,
+                exercise=exercise,
+                planned_ns=planned_ns,
+                actual_ns=actual_ns,
+            )
+        return SessionStep(
+            exercise, step_kind, planned_ns, actual_ns, event == Event.SKIP
+        )
+
+    def _end_session(self) -> Session:
+        duration_ns = self.clock() - self.session_started
+        # Judged against the current plan, which changes with the break
+        # settings, and journaled so a rebuilt history agrees.
+        completed = self.plan.is_finished(self.position)
+        if self.journal is not None:
+            self.journal.record(
+                Event.SESSION_END,
+                self.session,
+                step=self.position,
+                routine=self.routine_name,
+                planned_ns=seconds_to_ns(self.plan.total_duration),
+                actual_ns=duration_ns,
+                flags=Flag.COMPLETED if completed else 0,
+            )
+        return Session(
+            self.session or 0,
+            self.routine_name,
+            self.session_started_wall,
+            duration_ns,
+            completed,
+            tuple(self._steps),
+        )
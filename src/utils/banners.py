@@ -0,0 +1,52 @@
+import json
+from pathlib import Path
+
+from utils.files import atomic_write
+
+
+def _render_with_art(text: str, font: str) -> str:
+    # Importing art loads every font it ships, so it is only done when a
+    # banner is missing from the cache.
+    from art import text2art
+
+    return text2art(text, font)
+
+
+class BannerCache:
+    """ASCII-art banners rendered once per (text, font) and kept on disk."""
+
+    def __init__(self, path: str | None = None, render=None):
+        self.path = Path(path) if path is not None else None
+        self._render = render if render else _render_with_art
+        self._banners: dict[str, dict[str, str]] | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> dict[str, dict[str, str]]:
+        if self._banners is None:
+            self._banners = {}
+            if self.path is not None and self.path.exists():
+                try:
+                    self._banners = json.loads(self.path.read_text())
+                except (json.JSONDecodeError, OSError) as e:
+                    print(f"Error loading banners: {e}")
+        return self._banners
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        try:
+            atomic_write(self.path, json.dumps(self._banners, indent=4))
+        except OSError as e:
+            print(f"Error saving banners: {e}")
+
+    def get(self, text: str, font: str = "straight") -> str:
+        fonts = self._load().setdefault(font, {})
+        banner = fonts.get(text)
+        if banner is not None:
+            self.hits += 1
+            return banner
+        self.misses += 1
+        banner = fonts[text] = self._render(text, font)
+        self._save()
+        return banner
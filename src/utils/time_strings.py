@@ -1,3 +1,6 @@
+import math
+
+
 def seconds_to_time_str(seconds: int) -> str:
     minutes, sec = divmod(seconds, 60)
     hours, minutes = divmod(minutes, 60)
@@ -35,3 +38,40 @@ def duration_input_to_seconds(value: str):
         seconds += int(cleaned[4:6])  # Add seconds
 
     return seconds
+
+
+# Countdown display precisions, as display units per second.
+TIMER_PRECISIONS = {"seconds": 1, "tenths": 10, "hundredths": 100}
+
+_TWO_DIGITS = tuple(f"{i:02}" for i in range(100))
+# Joined rather than formatted, which keeps the import cheap.
+_MINUTES_SECONDS = tuple(
+    minutes + ":" + seconds
+    for minutes in _TWO_DIGITS[:60]
+    for seconds in _TWO_DIGITS[:60]
+)
+_HOURS = tuple(f"{hours:02}:" for hours in range(100))
+_FRACTIONS = {
+    1: ("",),
+    10: tuple(f".{i}" for i in range(10)),
+    100: tuple(f".{i:02}" for i in range(100)),
+}
+
+
+def countdown_units(seconds_left: float, units_per_second: int) -> int:
+    """Display units left, rounded up so zero only shows at the end."""
+    if seconds_left <= 0:
+        return 0
+    return math.ceil(seconds_left * units_per_second - 1e-9)
+
+
+def format_countdown(units: int, units_per_second: int) -> str:
+    """Format display units as HH:MM:SS with the precision's fraction."""
+    seconds, fraction = divmod(units, units_per_second)
+    hours, seconds = divmod(seconds, 3600)
+    hours_str = _HOURS[hours] if hours < 100 else f"{hours:02,}:"
+    return (
+        hours_str
+        + _MINUTES_SECONDS[seconds]
+        + _FRACTIONS[units_per_second][fraction]
+    )
@@ -1,9 +1,8 @@
 from textual import on
 from textual.containers import HorizontalGroup
 from textual.app import ComposeResult
-from textual.widgets import Input, Select, Button, ListItem
+from textual.widgets import Input, Select, Button
 from textual import log
-from widgets.exercises import create_exercise_widget
 from widgets.time_masked_input import TimeMaskedInput
 
 from routine import (
@@ -84,13 +83,13 @@ class ExerciseInputWidget(HorizontalGroup):
 
         new_exercise = self._create_exercise_from_input()
 
-        new_widget = ListItem(create_exercise_widget(new_exercise))
-        self.parent.query_one("#exercises-scroll").mount(new_widget)
-        new_widget.scroll_visible()
-
         self.app.routine_controller.add_exercise(new_exercise)
+
+        e_list = self.parent.e_list
+        e_list.refresh_rows()
+        e_list.index = len(e_list.exercises) - 1
         if not self.parent.create_mode:
-            self.app.routine_controller.save_routines()
+            self.app.routine_controller.save_routine()
 
         self.add_class("hide")
 
@@ -105,30 +104,17 @@ class ExerciseInputWidget(HorizontalGroup):
             )
             return
 
-        e = self.parent.exercise_to_edit
-
-        if e.type == "duration" and self.e_type == DURATION_OPTION:
-            e.name = self.e_name.value
-            e.duration = duration_input_to_seconds(self.duration_input.value)
-        elif e.type == "repetition" and self.e_type == REPETITION_OPTION:
-            e.name = self.e_name.value
-            e.repetitions = int(self.rep_input.value)
-        else:  # Exercise type changed
-            new_exercise = self._create_exercise_from_input()
-
-            self.app.routine_controller.replace_exercise(
-                new_exercise, self.parent.exercise_to_edit_idx
-            )
-
-            e = new_exercise
+        # Replaced rather than edited in place, as the routine store may be
+        # encoding the old exercise on its writer thread.
+        new_exercise = self._create_exercise_from_input()
+        self.app.routine_controller.replace_exercise(
+            new_exercise, self.parent.exercise_to_edit_idx
+        )
 
-        # Update widget
-        self.parent.exercise_to_edit_widget.remove_children()
-        new_exercise_widget = create_exercise_widget(e)
-        self.parent.exercise_to_edit_widget.mount(new_exercise_widget)
+        self.parent.e_list.refresh_row(self.parent.exercise_to_edit_idx)
 
         if not self.parent.create_mode:
-            self.app.routine_controller.save_routines()
+            self.app.routine_controller.save_routine()
 
         self.add_class("hide")
 
@@ -0,0 +1,178 @@
+from rich.cells import cell_len, set_cell_size
+from rich.segment import Segment
+from rich.style import Style
+from textual.strip import Strip
+
+from routine import Exercise
+from utils.time_strings import repetitions_to_str, seconds_to_time_str
+from widgets.virtual_list import VirtualList
+
+
+def exercise_quantity_str(e: Exercise) -> str:
+    if e.type == "duration":
+        return seconds_to_time_str(e.duration)
+    elif e.type == "repetition":
+        return repetitions_to_str(e.repetitions)
+    return ""
+
+
+class ExerciseList(VirtualList):
+    """Exercise cards drawn straight from `exercises`.
+
+    Opening a long routine costs the same as opening a short one. After
+    changing `exercises`, call `refresh_rows`.
+
+    Rows can be reordered without touching `exercises`: the list then
+    shows `exercises[order[row]]` until the order is committed or
+    dropped.
+    """
+
+    COMPONENT_CLASSES = {
+        "exercise-list--row",
+        "exercise-list--cursor",
+        "exercise-list--border",
+    }
+
+    DEFAULT_CSS = """
+    ExerciseList {
+        height: 1fr;
+        background: $surface;
+        overflow-x: hidden;
+
+        & > .exercise-list--row {
+            background: $boost;
+        }
+
+        & > .exercise-list--border {
+            color: $border;
+        }
+
+        & > .exercise-list--cursor {
+            color: $block-cursor-blurred-foreground;
+            background: $block-cursor-blurred-background;
+            text-style: $block-cursor-blurred-text-style;
+        }
+
+        &:focus {
+            background-tint: $foreground 5%;
+
+            & > .exercise-list--cursor {
+                color: $block-cursor-foreground;
+                background: $block-cursor-background;
+                text-style: $block-cursor-text-style;
+            }
+        }
+    }
+    """
+
+    # Card edges, drawn like a `tall` border.
+    CARD_EDGES = (("▊", "▔", "▎"), ("▊", " ", "▎"), ("▊", "▁", "▎"))
+
+    # Three lines of card and one line of gap per exercise.
+    ROW_HEIGHT = 4
+    CARD_HEIGHT = 3
+
+    def __init__(self, exercises: list[Exercise] = None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.exercises = exercises if exercises is not None else []
+        self.order: list[int] | None = None
+
+    def exercise_at(self, row: int) -> Exercise:
+        if self.order is None:
+            return self.exercises[row]
+        return self.exercises[self.order[row]]
+
+    @property
+    def highlighted_exercise(self) -> Exercise | None:
+        if self.index is None:
+            return None
+        return self.exercise_at(self.index)
+
+    @property
+    def is_reordered(self) -> bool:
+        return self.order is not None
+
+    def set_exercises(self, exercises: list[Exercise]) -> None:
+        self.exercises = exercises
+        self.order = None
+        self.refresh_rows()
+
+    def _refresh_row_range(self, start: int, end: int) -> None:
+        for row in range(max(start, 0), min(end, self.row_count)):
+            self.refresh_row(row)
+
+    def move_row(self, row: int, target: int) -> None:
+        """Move a row to `target` and keep the cursor on it."""
+        if self.order is None:
+            self.order = list(range(len(self.exercises)))
+        self.order.insert(target, self.order.pop(row))
+        # Only the rows between the two positions change.
+        first, last = sorted((row, target))
+        if last - first < self._rows_per_page():
+            self._refresh_row_range(first, last + 1)
+        else:
+            self.refresh()
+        self.index = target
+
+    def sort_rows(self, key, reverse: bool = False) -> None:
+        """Order the rows by `key(exercise)`, keeping ties in place."""
+        order = self.order or range(len(self.exercises))
+        exercises = self.exercises
+        self.order = sorted(
+            order, key=lambda i: key(exercises[i]), reverse=reverse
+        )
+        self.refresh()
+
+    def reverse_rows(self) -> None:
+        order = self.order or range(len(self.exercises))
+        self.order = list(reversed(order))
+        self.refresh()
+
+    def ordered_exercises(self) -> list[Exercise]:
+        if self.order is None:
+            return list(self.exercises)
+        return [self.exercises[i] for i in self.order]
+
+    def restore_order(self) -> None:
+        """Drop the reordering; `exercises` itself was never changed."""
+        self.order = None
+        self.refresh()
+
+    @property
+    def row_count(self) -> int:
+        return len(self.exercises)
+
+    def render_row_line(
+        self, index: int, line: int, width: int, base_style: Style
+    ) -> Strip:
+        if line >= self.CARD_HEIGHT:
+            return Strip.blank(width, base_style)
+
+        component = (
+            "exercise-list--cursor"
+            if index == self.index
+            else "exercise-list--row"
+        )
+        style = base_style + self.row_style(index, component)
+        border_style = style + Style(
+            color=self.get_component_rich_style("exercise-list--border").color
+        )
+        left, middle, right = self.CARD_EDGES[line]
+        inner_width = max(0, width - 4)
+        if line != 1:
+            text = middle * inner_width
+        else:
+            exercise = self.exercise_at(index)
+            quantity = exercise_quantity_str(exercise) + " "
+            name_width = max(0, inner_width - cell_len(quantity))
+            text = set_cell_size("  " + exercise.name, name_width) + quantity
+            text = set_cell_size(text, inner_width)
+        return Strip(
+            [
+                Segment(" ", base_style),
+                Segment(left, border_style),
+                Segment(text, border_style if line != 1 else style),
+                Segment(right, border_style),
+                Segment(" ", base_style),
+            ]
+        )
@@ -0,0 +1,138 @@
+from collections.abc import Sequence
+
+from rich.cells import set_cell_size
+from rich.segment import Segment
+from rich.style import Style
+from textual import events
+from textual.binding import Binding
+from textual.message import Message
+from textual.strip import Strip
+
+from routine import Routine
+from widgets.virtual_list import VirtualList
+
+
+class RoutineList(VirtualList):
+    """Names of the routines at `matches` (positions in `routines`).
+
+    Characters matched by `search_query` are highlighted.
+    """
+
+    COMPONENT_CLASSES = {
+        "routine-list--cursor",
+        "routine-list--match",
+    }
+
+    DEFAULT_CSS = """
+    RoutineList {
+        height: auto;
+        max-height: 70vh;
+        background: $surface;
+        overflow-x: hidden;
+
+        & > .routine-list--match {
+            text-style: bold underline;
+        }
+
+        & > .routine-list--cursor {
+            color: $block-cursor-blurred-foreground;
+            background: $block-cursor-blurred-background;
+            text-style: $block-cursor-blurred-text-style;
+        }
+
+        &:focus {
+            background-tint: $foreground 5%;
+
+            & > .routine-list--cursor {
+                color: $block-cursor-foreground;
+                background: $block-cursor-background;
+                text-style: $block-cursor-text-style;
+            }
+        }
+    }
+    """
+
+    BINDINGS = [Binding("enter", "select", "Select", show=False)]
+
+    class Selected(Message):
+        """Posted when a routine is picked with enter or a click."""
+
+        def __init__(self, routine_list: "RoutineList", routine: Routine):
+            super().__init__()
+            self.routine_list = routine_list
+            self.routine = routine
+
+        @property
+        def control(self) -> "RoutineList":
+            return self.routine_list
+
+    def __init__(self, routines: list[Routine], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.routines = routines
+        self.matches: Sequence[int] = range(len(routines))
+        self.search_query = ""
+        self.match_positions = None
+
+    def set_matches(
+        self, matches: Sequence[int], query: str = "", match_positions=None
+    ) -> None:
+        """Show `matches`; `match_positions(index, query)` gives the
+        characters of a routine's name to highlight."""
+        self.matches = matches
+        self.search_query = query
+        self.match_positions = match_positions
+        self.index = 0
+        self.refresh_rows()
+
+    @property
+    def row_count(self) -> int:
+        return len(self.matches)
+
+    @property
+    def highlighted_routine(self) -> Routine | None:
+        if self.index is None:
+            return None
+        return self.routines[self.matches[self.index]]
+
+    def render_row_line(
+        self, index: int, line: int, width: int, base_style: Style
+    ) -> Strip:
+        routine_index = self.matches[index]
+        name = set_cell_size(" " + self.routines[routine_index].name, width)
+        if index == self.index:
+            style = base_style + self.row_style(index, "routine-list--cursor")
+        else:
+            style = base_style + Style.from_meta({"row": index})
+
+        positions = []
+        if self.search_query and self.match_positions is not None:
+            positions = self.match_positions(routine_index, self.search_query)
+        if not positions:
+            return Strip([Segment(name, style)])
+
+        match_style = style + self.get_component_rich_style(
+            "routine-list--match", partial=True
+        )
+        segments = []
+        start = 0
+        for position in positions:
+            # Names are drawn after one cell of padding.
+            position += 1
+            if position >= len(name):
+                break
+            if position > start:
+                segments.append(Segment(name[start:position], style))
+            segments.append(Segment(name[position], match_style))
+            start = position + 1
+        segments.append(Segment(name[start:], style))
+        return Strip(segments).crop(0, width)
+
+    def on_click(self, event: events.Click) -> None:
+        super().on_click(event)
+        if event.style.meta.get("row") is not None:
+            self.action_select()
+
+    def action_select(self) -> None:
+        routine = self.highlighted_routine
+        if routine is not None:
+            self.post_message(self.Selected(self, routine))
@@ -6,102 +6,90 @@ from textual.reactive import reactive
 from textual.widgets import (
     Button,
     Label,
-    ListView,
-    ListItem,
     Input,
 )
 
-from routine import (
-    DurationExercise,
-    Exercise,
-    RepetitionExercise,
-)
+from routine import Exercise
 
 
-from screens.train_view import TrainView
 from validators import IsEmptyValidator
 from widgets.exercise_input import (
     DURATION_OPTION,
     REPETITION_OPTION,
     ExerciseInputWidget,
 )
-from widgets.exercises import create_exercise_widget
+from widgets.exercise_list import ExerciseList
+
+
+def _duration_sort_key(e: Exercise) -> tuple[int, int]:
+    # Timed exercises by duration, then repetition exercises.
+    if e.type == "duration":
+        return (0, e.duration)
+    return (1, 0)
 
 
 class ReorderWidget(HorizontalGroup):
+    """Reorder controls. Moves only change the list's row order, which
+    is written to the routine on Save and dropped on Cancel."""
 
     def compose(self) -> ComposeResult:
         yield Button("🔼", id="move-up", classes="icon-btn")
         yield Button("⏫", id="move-top", classes="icon-btn")
         yield Button("🔽", id="move-down", classes="icon-btn")
         yield Button("⏬", id="move-bottom", classes="icon-btn")
+        yield Button("A-Z", id="sort-by-name", classes="icon-btn")
+        yield Button("⏱", id="sort-by-duration", classes="icon-btn")
+        yield Button("🔃", id="reverse-order", classes="icon-btn")
         yield Button("Save", id="save-reorder")
         yield Button("Cancel", id="cancel-reorder", variant="error")
 
-    def _get_exercise_to_move(self) -> tuple[int, Exercise]:
-        e_list: ListView = self.parent.e_list
-        index = e_list.index
-        item: ListItem = e_list.highlighted_child
-        e_widget = item.query_one(".exercise-widget")
-        exercise_moved = e_widget.exercise
-        return index, exercise_moved
-
-    def _move_exercise(self, index, target_index, exercise) -> None:
-        e_list: ListView = self.parent.e_list
-        e_list.pop(index)
-        e_list.insert(
-            target_index,
-            [ListItem(create_exercise_widget(exercise))],
-        )
-        e_list.index = target_index
+    def _move_exercise(self, target_index) -> None:
+        e_list: ExerciseList = self.parent.e_list
+        if e_list.index is not None and e_list.index != target_index:
+            e_list.move_row(e_list.index, target_index)
 
     def _save_reordered_exercises(self):
-        reordered_exercises = []
-
-        for list_item in self.parent.e_list.children:
-            exercise = list_item.children[0].exercise
-            reordered_exercises.append(exercise)
-
+        e_list: ExerciseList = self.parent.e_list
+        if not e_list.is_reordered:
+            return
+        reordered_exercises = e_list.ordered_exercises()
         self.app.routine_controller.reorder_exercises(reordered_exercises)
+        e_list.set_exercises(self.app.routine_controller.get_exercises())
 
         if not self.parent.create_mode:
-            self.app.routine_controller.save_routines()
-
-    def _reset_exercise_list(self):
-        e_list: ListView = self.parent.e_list
-        e_list.remove_children()
-        e_list.extend(
-            [
-                ListItem(create_exercise_widget(e))
-                for e in self.app.routine_controller.get_exercises()
-            ]
-        )
+            self.app.routine_controller.save_routine()
 
     @on(Button.Pressed, "#move-up")
     def move_exercise_one_up(self):
-        index, e = self._get_exercise_to_move()
-        if index > 0:
-            self._move_exercise(index, index - 1, e)
+        index = self.parent.e_list.index
+        if index is not None and index > 0:
+            self._move_exercise(index - 1)
 
     @on(Button.Pressed, "#move-top")
     def move_exercise_to_the_top(self):
-        index, e = self._get_exercise_to_move()
-        if index != 0:
-            self._move_exercise(index, 0, e)
+        self._move_exercise(0)
 
     @on(Button.Pressed, "#move-down")
     def move_exercise_one_down(self):
-        index, e = self._get_exercise_to_move()
-        e_list: ListView = self.parent.e_list
-        if index < len(e_list.children) - 1:
-            self._move_exercise(index, index + 2, e)
+        index = self.parent.e_list.index
+        if index is not None and index < self.parent.e_list.row_count - 1:
+            self._move_exercise(index + 1)
 
     @on(Button.Pressed, "#move-bottom")
     def move_exercise_to_the_bottom(self):
-        index, e = self._get_exercise_to_move()
-        length = len(self.parent.e_list.children)
-        if index != length - 1:
-            self._move_exercise(index, length, e)
+        self._move_exercise(self.parent.e_list.row_count - 1)
+
+    @on(Button.Pressed, "#sort-by-name")
+    def sort_by_name(self):
+        self.parent.e_list.sort_rows(key=lambda e: e.name.casefold())
+
+    @on(Button.Pressed, "#sort-by-duration")
+    def sort_by_duration(self):
+        self.parent.e_list.sort_rows(key=_duration_sort_key)
+
+    @on(Button.Pressed, "#reverse-order")
+    def reverse_order(self):
+        self.parent.e_list.reverse_rows()
 
     @on(Button.Pressed, "#save-reorder")
     def save_reorder(self):
@@ -110,7 +98,7 @@ class ReorderWidget(HorizontalGroup):
 
     @on(Button.Pressed, "#cancel-reorder")
     def cancel_reorder(self):
-        self._reset_exercise_list()
+        self.parent.e_list.restore_order()
         self.add_class("hide")
 
 
@@ -123,15 +111,13 @@ class RoutineWidget(HorizontalGroup):
     ]
 
     # Accessed by exercise input
-    exercise_to_edit: DurationExercise | RepetitionExercise = reactive(None)
     exercise_to_edit_idx: int = reactive(None)
-    exercise_to_edit_widget = reactive(None)
 
     def __init__(self, create_mode: bool = False, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.create_mode = create_mode
-        if self.create_mode:
-            self.app.routine_controller.create_and_set_new_routine()
+        self.routine = self.app.routine_controller.routine
+        self.routine_name = self.routine.name
 
     def _clear_exercise_form(self) -> None:
         self.e_input.e_name.value = ""
@@ -175,7 +161,7 @@ class RoutineWidget(HorizontalGroup):
         if self.create_mode:
             self.routine_name_input = Input(
                 placeholder="Enter routine name",
-                value=self.app.routine_controller.get_routine_name(),
+                value=self.routine_name,
                 type="text",
                 id="routine-name-input",
                 validators=[IsEmptyValidator()],
@@ -192,11 +178,11 @@ class RoutineWidget(HorizontalGroup):
                 classes="create-routine-header",
             )
         else:
+            self.routine_name_label = Label(
+                self.routine_name, classes="routine-name"
+            )
             yield HorizontalGroup(
-                Label(
-                    self.app.routine_controller.get_routine_name(),
-                    classes="routine-name",
-                ),
+                self.routine_name_label,
                 HorizontalGroup(
                     Button("Start", id="start-btn"),
                     Button("Reorder", id="reorder-btn"),
@@ -208,11 +194,8 @@ class RoutineWidget(HorizontalGroup):
         self.e_input = ExerciseInputWidget(id="exercise-input", classes="hide")
         yield self.e_input
 
-        self.e_list = ListView(
-            *[
-                ListItem(create_exercise_widget(e))
-                for e in self.app.routine_controller.get_exercises()
-            ],
+        self.e_list = ExerciseList(
+            self.app.routine_controller.get_exercises(),
             id="exercises-scroll",
         )
         self.e_list.border_title = "Exercises:"
@@ -221,13 +204,49 @@ class RoutineWidget(HorizontalGroup):
         self.reorder_input = ReorderWidget(classes="hide")
         yield self.reorder_input
 
+    def _exercise_selected(self) -> bool:
+        return self.e_list.index is not None and self.e_list.has_focus
+
+    def _is_reordering(self, title: str) -> bool:
+        """Warn that exercises can't change while the order is edited."""
+        if self.reorder_input.has_class("hide"):
+            return False
+        self.app.notify(
+            message="Save or cancel the new order first.",
+            title=title,
+            severity="warning",
+        )
+        return True
+
+    def sync_with_controller(self) -> None:
+        """Catch up with the controller's routine, e.g. when a cached
+        screen is shown again."""
+        controller = self.app.routine_controller
+        if self.routine is not controller.routine:
+            self.routine = controller.routine
+            self.e_input.add_class("hide")
+            if self.create_mode:
+                self.routine_name_input.value = self.routine.name
+        if self.routine_name != self.routine.name:
+            self.routine_name = self.routine.name
+            if not self.create_mode:
+                self.routine_name_label.update(self.routine_name)
+        # Unsaved reordering is dropped when the screen is left.
+        self.reorder_input.add_class("hide")
+        if self.e_list.exercises is not controller.get_exercises():
+            self.e_list.set_exercises(controller.get_exercises())
+        else:
+            self.e_list.restore_order()
+
     def action_add_exercise(self) -> None:
+        if self._is_reordering("Cannot Add Exercise"):
+            return
         self._show_exercise_form()
 
     def action_remove_exercise(self) -> None:
-        selected_item = self.e_list.highlighted_child
-
-        if not (selected_item and self.e_list.has_focus):
+        if self._is_reordering("Cannot Remove Exercise"):
+            return
+        if not self._exercise_selected():
             self.app.notify(
                 message="Please select an exercise first.",
                 title="Cannot Remove Exercise",
@@ -235,15 +254,15 @@ class RoutineWidget(HorizontalGroup):
             )
             return
 
-        self.e_list.remove_children([selected_item])
         self.app.routine_controller.remove_exercise(self.e_list.index)
+        self.e_list.refresh_rows()
         if not self.create_mode:
-            self.app.routine_controller.save_routines()
+            self.app.routine_controller.save_routine()
 
     def action_edit_exercise(self) -> None:
-        selected_item = self.e_list.highlighted_child
-
-        if not (selected_item and self.e_list.has_focus):
+        if self._is_reordering("Cannot Edit Exercise"):
+            return
+        if not self._exercise_selected():
             self.app.notify(
                 message="Please select an exercise first.",
                 title="Cannot Edit Exercise",
@@ -252,9 +271,7 @@ class RoutineWidget(HorizontalGroup):
             return
 
         e = self.app.routine_controller.get_exercises()[self.e_list.index]
-        self.exercise_to_edit = e
         self.exercise_to_edit_idx = self.e_list.index
-        self.exercise_to_edit_widget = selected_item
         self._show_exercise_form(e, editing=True)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -277,7 +294,7 @@ class RoutineWidget(HorizontalGroup):
                     severity="error",
                 )
                 return
-            self.app.switch_screen(TrainView())
+            self.app.screen_manager.go_to_training()
         elif button_id == "cancel-routine-creation":
             self.app.switch_screen("homepage")
             self.app.routine_controller.unset_routine()
@@ -287,7 +304,7 @@ class RoutineWidget(HorizontalGroup):
                 success = self.app.routine_controller.set_routine_name(name)
                 if success:
                     self.app.routine_controller.add_routine_to_app_routines()
-                    self.app.routine_controller.save_routines()
+                    self.app.routine_controller.save_routine()
                     self.notify(
                         title="Created new routine",
                         message="Check it out in list of routines",
@@ -1,11 +1,16 @@
-from time import monotonic
-
 from textual.app import ComposeResult
 from textual.containers import Container, VerticalGroup
 from textual.reactive import reactive
 from textual.widgets import Button, Digits, Label
 from textual.message import Message
 
+from countdown import NS_PER_SECOND, Countdown, seconds_to_ns
+from utils.time_strings import (
+    TIMER_PRECISIONS,
+    countdown_units,
+    format_countdown,
+)
+
 
 TIMER_END_SOUND = "timer-end-sound.wav"
 TIMER_START_SOUND = "timer-start-sound.wav"
@@ -16,86 +21,197 @@ class TimeDisplay(Digits):
 
     CSS_PATH = "_timer.tcss"
 
-    start_time = reactive(monotonic)
     time_to_display = reactive(0.0)
-    time_left = reactive(0.0)
 
     class Ended(Message):
-        """Timer ended message."""
+        """Timer ended message.
 
-        def __init__(self, time_display: "TimeDisplay") -> None:
+        `overrun_ns` is how far past the deadline the timer was stopped.
+        """
+
+        def __init__(
+            self, time_display: "TimeDisplay", overrun_ns: int = 0
+        ) -> None:
             self.time_display: TimeDisplay = time_display
+            self.overrun_ns = overrun_ns
             super().__init__()
 
         @property
         def control(self) -> "TimeDisplay":
             return self.time_display
 
-    def __init__(self, duration_time, *args, **kwargs):
+        @property
+        def overrun(self) -> float:
+            return self.overrun_ns / NS_PER_SECOND
+
+    def __init__(
+        self,
+        duration_time,
+        precision: str = "hundredths",
+        countdown: Countdown | None = None,
+        *args,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.duration_time = duration_time
+        # A countdown passed in belongs to whoever drives it; the display
+        # only follows it.
+        self._owns_countdown = countdown is None
+        self.countdown = countdown or Countdown(seconds_to_ns(duration_time))
+        self.set_precision(precision)
+
+    def set_precision(self, precision: str) -> None:
+        self.units_per_second = TIMER_PRECISIONS[precision]
+        self.resolution = 1 / self.units_per_second
+        self._displayed_units = None
+        if self.is_mounted:
+            self._render_time(self.time_to_display)
+
+    def _render_time(self, time: float) -> None:
+        """Update the digits, skipping the refresh if they would not change."""
+        units = countdown_units(time, self.units_per_second)
+        if units != self._displayed_units:
+            self._displayed_units = units
+            self.update(format_countdown(units, self.units_per_second))
 
-    def _format_time(self, time: float) -> str:
-        """Format time value into display string."""
-        time = max(0.0, time)
-        minutes, seconds = divmod(time, 60)
-        hours, minutes = divmod(minutes, 60)
-        return f"{hours:02,.0f}:{minutes:02.0f}:{seconds:05.2f}"
+    @property
+    def is_running(self) -> bool:
+        return self in self.app.tick_scheduler
+
+    @property
+    def time_left(self) -> float:
+        return max(0, self.countdown.remaining()) / NS_PER_SECOND
 
     def on_mount(self) -> None:
-        self.update_timer = self.set_interval(
-            1 / 60, self.update_time, pause=True
-        )
         self.set_reactive(TimeDisplay.time_to_display, self.duration_time)
-        self.set_reactive(TimeDisplay.time_left, self.duration_time)
-        self.update(self._format_time(self.duration_time))
+        self._render_time(self.duration_time)
 
-    def update_time(self) -> None:
-        self.time_to_display = max(
-            0.0, self.time_left - (monotonic() - self.start_time)
-        )
+    def on_unmount(self) -> None:
+        self.app.tick_scheduler.remove(self)
+
+    def tick(self, now: float) -> None:
+        """Called by the tick scheduler when the display may change."""
+        self.time_to_display = self.time_left
+
+    def expire(self, now: float) -> None:
+        """Called by the tick scheduler once the deadline has passed."""
+        if self._owns_countdown:
+            self.countdown.stop()
+        self.time_to_display = 0.0
+        self.parent.remove_class("started")
+        self.app.sound_manager.play_sound(TIMER_END_SOUND)
+        # The scheduler runs in the context of the widget that started the
+        # timer, and Textual stops a message from bubbling past its
+        # sender. Creating the message on this widget's own loop keeps it
+        # bubbling up to the screen.
+        self.call_next(self._post_ended, self.countdown.overrun())
+
+    def _post_ended(self, overrun_ns: int) -> None:
+        self.post_message(TimeDisplay.Ended(self, overrun_ns))
 
     def watch_time_to_display(self, time: float) -> None:
-        if time == 0.0:
-            self.update_timer.pause()
-            self.parent.remove_class("started")
-            self.app.sound_manager.play_sound(TIMER_END_SOUND)
-            self.post_message(TimeDisplay.Ended(self))
-        self.update(self._format_time(time))
+        self._render_time(time)
 
     def start(self) -> None:
         """Method to start (or resume) time updating."""
-        self.start_time = monotonic()
-        self.update_timer.resume()
+        if self.is_running:
+            return
+        self.countdown.start()
+        self.app.tick_scheduler.add(
+            self, self.countdown.deadline / NS_PER_SECOND, self.resolution
+        )
         self.app.sound_manager.play_sound(TIMER_START_SOUND)
 
     def stop(self) -> None:
         """Method to stop the time display updating."""
-        self.update_timer.pause()
-        self.time_left -= monotonic() - self.start_time
+        if not self.is_running:
+            return
+        self.app.tick_scheduler.remove(self)
+        self.countdown.stop()
         self.time_to_display = self.time_left
 
+    def sync(self) -> None:
+        """Follow a countdown that was started, stopped or reset
+        elsewhere."""
+        self.duration_time = self.countdown.duration_ns / NS_PER_SECOND
+        if self.countdown.is_running:
+            self.start()
+        else:
+            self.app.tick_scheduler.remove(self)
+            self.time_to_display = self.time_left
+
+    def set_duration(self, duration_time: float) -> None:
+        """Stop and rewind to a countdown of `duration_time` seconds.
+
+        A countdown driven from outside is left alone; only its length is
+        shown until it starts.
+        """
+        self.app.tick_scheduler.remove(self)
+        self.duration_time = duration_time
+        if self._owns_countdown:
+            self.countdown.reset(seconds_to_ns(duration_time))
+        self.time_to_display = duration_time
+
     def reset(self) -> None:
         """Method to reset the time display to zero."""
-        self.time_left = self.parent.duration_time
-        self.time_to_display = self.parent.duration_time
+        self.set_duration(self.parent.duration_time)
 
 
 class Timer(VerticalGroup):
-    """A timer widget."""
+    """A timer widget.
 
-    def __init__(self, title: str, duration_time: float, *args, **kwargs):
+    A timer given a `countdown` shows it, but leaves its buttons to the
+    screen, which drives the countdown and calls `sync`.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        duration_time: float,
+        precision: str = "hundredths",
+        countdown: Countdown | None = None,
+        *args,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.duration_time = duration_time
+        self.precision = precision
         self.title = title
+        self.countdown = countdown
 
     def change_duration_time(self, new_time: float):
         self.duration_time = new_time
-        time_display = self.query_one(TimeDisplay)
-        time_display.time_left = self.duration_time
-        time_display.time_to_display = self.duration_time
+        self.query_one(TimeDisplay).set_duration(self.duration_time)
+
+    def configure(
+        self, title: str, duration_time: float, precision: str = None
+    ) -> None:
+        """Reuse a stopped timer for another countdown."""
+        self.title = title
+        self.query_one("#timer-title", Label).update(title)
+        if precision is not None and precision != self.precision:
+            self.precision = precision
+            self.query_one(TimeDisplay).set_precision(precision)
+        self.remove_class("started")
+        self.change_duration_time(duration_time)
+
+    @property
+    def time_display(self) -> TimeDisplay:
+        return self.query_one(TimeDisplay)
+
+    def sync(self) -> None:
+        """Show the current state of the countdown."""
+        if not self.is_mounted:
+            self.call_after_refresh(self.sync)
+            return
+        time_display = self.time_display
+        time_display.sync()
+        self.duration_time = time_display.duration_time
+        self.set_class(time_display.countdown.is_running, "started")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
+        if self.countdown is not None:
+            return
         button_id = event.button.id
         time_display = self.query_one(TimeDisplay)
         if button_id == "start":
@@ -111,7 +227,7 @@ class Timer(VerticalGroup):
         yield Container(
             Label(self.title, id="timer-title"), id="title-container"
         )
-        yield TimeDisplay(self.duration_time)
+        yield TimeDisplay(self.duration_time, self.precision, self.countdown)
         yield Container(
             Button("Start", id="start", variant="success"),
             Button("Stop", id="stop", variant="error"),
@@ -125,11 +241,15 @@ class Timer(VerticalGroup):
         self.add_class("started")
 
     def start_timer(self) -> None:
-        self.call_after_refresh(self._start_timer_safe)
+        if self.is_mounted:
+            self._start_timer_safe()
+        else:
+            self.call_after_refresh(self._start_timer_safe)
 
     def stop_timer(self) -> None:
         time_display = self.query_one(TimeDisplay)
         time_display.stop()
+        self.remove_class("started")
 
     def reset_timer(self) -> None:
         time_display = self.query_one(TimeDisplay)
@@ -1,7 +1,6 @@
 from textual.containers import VerticalGroup, Container
 from textual.app import ComposeResult
 from textual.widgets import Label, Button, Digits
-from art import text2art
 from routine import RepetitionExercise
 
 
@@ -63,11 +62,22 @@ class TrainRepetitionWidget(VerticalGroup):
             yield Label(self.exercise.name, id="rep-exercise-name")
         yield Digits(f"{self.exercise.repetitions}", id="repetitions-number")
         yield Label(
-            text2art("REPETITIONS", "straight"),
+            self.app.banners.get("REPETITIONS", "straight"),
             id="repetitions-label",
         )
         with Container(id="button-container"):
             yield Button("Finished", id="reps-finished", variant="success")
 
     def on_mount(self) -> None:
+        self.focus_finished()
+
+    def show_exercise(self, exercise: RepetitionExercise) -> None:
+        """Reuse the widget for another exercise."""
+        self.exercise = exercise
+        self.query_one("#rep-exercise-name", Label).update(exercise.name)
+        self.query_one("#repetitions-number", Digits).update(
+            f"{exercise.repetitions}"
+        )
+
+    def focus_finished(self) -> None:
         self.query_one("#reps-finished", Button).focus()
@@ -1,6 +1,5 @@
 from textual.containers import VerticalGroup, Container
 from textual.widgets import Label, Button
-from art import text2art
 from textual.app import ComposeResult
 
 
@@ -35,7 +34,7 @@ class TrainingEndWidget(VerticalGroup):
 
     def compose(self) -> ComposeResult:
         yield Label(
-            text2art("CONGRATS!!!", "straight"),
+            self.app.banners.get("CONGRATS!!!", "straight"),
             id="congrats-label",
         )
         yield Label(f"You have finished {self.routine_name} :)")
@@ -0,0 +1,126 @@
+from rich.style import Style
+from textual import events
+from textual.binding import Binding
+from textual.geometry import Region, Size
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+
+class VirtualList(ScrollView, can_focus=True):
+    """A list with a cursor that only renders the rows in view.
+
+    Subclasses provide `row_count` and draw each line of a row in
+    `render_row_line`; no widget is mounted per row. After the rows
+    change, call `refresh_rows`.
+    """
+
+    BINDINGS = [
+        Binding("up", "cursor_up", "Cursor up", show=False),
+        Binding("down", "cursor_down", "Cursor down", show=False),
+        Binding("home", "first", "First", show=False),
+        Binding("end", "last", "Last", show=False),
+        Binding("pageup", "page_up", "Page up", show=False),
+        Binding("pagedown", "page_down", "Page down", show=False),
+    ]
+
+    ROW_HEIGHT = 1
+
+    index: int | None = reactive(None, always_update=True)
+
+    @property
+    def row_count(self) -> int:
+        raise NotImplementedError
+
+    def render_row_line(
+        self, index: int, line: int, width: int, base_style: Style
+    ) -> Strip:
+        """Render line `line` of row `index`."""
+        raise NotImplementedError
+
+    def refresh_rows(self) -> None:
+        """Pick up added, removed or changed rows."""
+        self.virtual_size = Size(
+            self.scrollable_content_region.width,
+            self.row_count * self.ROW_HEIGHT,
+        )
+        self.index = self.validate_index(self.index)
+        self.refresh()
+
+    def refresh_row(self, index: int) -> None:
+        self.refresh(self._row_region(index).translate(-self.scroll_offset))
+
+    def on_mount(self) -> None:
+        self.refresh_rows()
+
+    def on_resize(self) -> None:
+        self.refresh_rows()
+
+    def validate_index(self, index: int | None) -> int | None:
+        if not self.row_count:
+            return None
+        if index is None:
+            return 0
+        return max(0, min(index, self.row_count - 1))
+
+    def watch_index(self, old_index: int | None, index: int | None) -> None:
+        if old_index is not None and old_index < self.row_count:
+            self.refresh_row(old_index)
+        if index is not None:
+            self.refresh_row(index)
+            self.scroll_to_index(index)
+
+    def scroll_to_index(self, index: int, animate: bool = False) -> None:
+        self.scroll_to_region(self._row_region(index), animate=animate)
+
+    def _row_region(self, index: int) -> Region:
+        return Region(
+            0,
+            index * self.ROW_HEIGHT,
+            self.scrollable_content_region.width,
+            self.ROW_HEIGHT,
+        )
+
+    def row_style(self, index: int, component: str) -> Style:
+        """Style of a row drawn with `component`, clickable to select it."""
+        return self.get_component_rich_style(component) + Style.from_meta(
+            {"row": index}
+        )
+
+    def render_line(self, y: int) -> Strip:
+        width = self.scrollable_content_region.width
+        base_style = self.rich_style
+        index, line = divmod(y + int(self.scroll_y), self.ROW_HEIGHT)
+        if index >= self.row_count:
+            return Strip.blank(width, base_style)
+        return self.render_row_line(index, line, width, base_style)
+
+    def on_click(self, event: events.Click) -> None:
+        index = event.style.meta.get("row")
+        if index is not None:
+            self.index = index
+
+    def action_cursor_up(self) -> None:
+        if self.index is not None and self.index > 0:
+            self.index -= 1
+
+    def action_cursor_down(self) -> None:
+        if self.index is not None:
+            self.index += 1
+
+    def action_first(self) -> None:
+        self.index = 0
+
+    def action_last(self) -> None:
+        self.index = self.row_count - 1
+
+    def _rows_per_page(self) -> int:
+        return max(1, self.scrollable_content_region.height // self.ROW_HEIGHT)
+
+    def action_page_up(self) -> None:
+        if self.index is not None:
+            self.index -= self._rows_per_page()
+
+    def action_page_down(self) -> None:
+        if self.index is not None:
+            self.index += self._rows_per_page()
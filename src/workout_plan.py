@@ -0,0 +1,160 @@
+from typing import NamedTuple, Sequence
+
+from routine import Exercise
+
+# Repetition exercises have no duration, so their expected length is
+# estimated from the number of repetitions.
+SECONDS_PER_REPETITION = 3
+
+
+class PlanStep(NamedTuple):
+    kind: str  # "exercise" or "break"
+    exercise: Exercise | None
+    # Position of the exercise in the routine; for breaks, the exercise
+    # the break follows.
+    exercise_index: int
+    duration: float
+    # Expected time elapsed before the step starts.
+    start: float
+
+    @property
+    def end(self) -> float:
+        return self.start + self.duration
+
+
+def expected_duration(exercise: Exercise) -> float:
+    if exercise.type == "duration":
+        return exercise.duration
+    return exercise.repetitions * SECONDS_PER_REPETITION
+
+
+class WorkoutPlan:
+    """A routine compiled into a flat, immutable sequence of steps.
+
+    Every step knows when it is expected to start, so navigation,
+    progress and the time left are lookups instead of walks over the
+    routine. A position equal to `len(plan)` means the workout is over.
+    """
+
+    __slots__ = (
+        "steps",
+        "total_duration",
+        "exercise_count",
+        "show_breaks",
+        "break_duration",
+        "_exercise_steps",
+        "_next_exercise",
+    )
+
+    def __init__(
+        self,
+        exercises: Sequence[Exercise],
+        show_breaks: bool = True,
+        break_duration: float = 10,
+    ):
+        steps = []
+        exercise_steps = []
+        elapsed = 0.0
+        for i, exercise in enumerate(exercises):
+            if i and show_breaks:
+                steps.append(
+                    PlanStep("break", None, i - 1, break_duration, elapsed)
+                )
+                elapsed += break_duration
+            exercise_steps.append(len(steps))
+            duration = expected_duration(exercise)
+            steps.append(PlanStep("exercise", exercise, i, duration, elapsed))
+            elapsed += duration
+
+        # _next_exercise[i] is the first exercise step after step i.
+        next_exercise = [len(steps)] * (len(steps) + 1)
+        for i in range(len(steps) - 2, -1, -1):
+            next_exercise[i] = (
+                i + 1
+                if steps[i + 1].kind == "exercise"
+                else next_exercise[i + 1]
+            )
+
+        self.steps = tuple(steps)
+        self.total_duration = elapsed
+        self.exercise_count = len(exercise_steps)
+        self.show_breaks = show_breaks
+        self.break_duration = break_duration
+        self._exercise_steps = tuple(exercise_steps)
+        self._next_exercise = tuple(next_exercise)
+
+    def __setattr__(self, name, value):
+        if hasattr(self, "_next_exercise"):
+            raise AttributeError("WorkoutPlan is immutable")
+        super().__setattr__(name, value)
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __getitem__(self, position: int) -> PlanStep:
+        return self.steps[position]
+
+    def is_finished(self, position: int) -> bool:
+        return position >= len(self.steps)
+
+    def exercise_position(self, exercise_index: int) -> int:
+        """Position of the step for the routine's `exercise_index`."""
+        if exercise_index >= self.exercise_count:
+            return len(self.steps)
+        return self._exercise_steps[exercise_index]
+
+    def next_exercise(self, position: int) -> int:
+        """Position of the next exercise after `position`, past breaks."""
+        return self._next_exercise[min(position, len(self.steps))]
+
+    def previous_exercise(self, position: int) -> int:
+        """Position of the last exercise before `position`."""
+        completed = self.exercises_completed(position)
+        return self.exercise_position(max(0, completed - 1))
+
+    def exercises_completed(self, position: int) -> int:
+        if position >= len(self.steps):
+            return self.exercise_count
+        step = self.steps[position]
+        return step.exercise_index + (step.kind == "break")
+
+    def elapsed(self, position: int, step_elapsed: float = 0.0) -> float:
+        """Expected time spent once `step_elapsed` into the step."""
+        if position >= len(self.steps):
+            return self.total_duration
+        step = self.steps[position]
+        return step.start + min(max(step_elapsed, 0.0), step.duration)
+
+    def progress(self, position: int, step_elapsed: float = 0.0) -> float:
+        """Fraction of the expected workout time already done."""
+        if not self.total_duration:
+            return 1.0 if position >= len(self.steps) else 0.0
+        return self.elapsed(position, step_elapsed) / self.total_duration
+
+    def remaining(self, position: int, step_elapsed: float = 0.0) -> float:
+        """Expected time left until the end of the workout."""
+        return self.total_duration - self.elapsed(position, step_elapsed)
+
+    def with_breaks(
+        self, show_breaks: bool, break_duration: float
+    ) -> "WorkoutPlan":
+        """A plan for the same exercises with different breaks."""
+        return WorkoutPlan(
+            [self.steps[i].exercise for i in self._exercise_steps],
+            show_breaks,
+            break_duration,
+        )
+
+    def equivalent_position(self, other: "WorkoutPlan", position: int) -> int:
+        """Position in this plan matching `position` in `other`.
+
+        Without breaks in this plan, a break maps to the exercise it
+        follows, so the step after it is still the next exercise.
+        """
+        if position >= len(other):
+            return len(self.steps)
+        step = other[position]
+        exercise_position = self.exercise_position(step.exercise_index)
+        if step.kind == "break" and self.show_breaks:
+            return exercise_position + 1
+        return exercise_position
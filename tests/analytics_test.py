@@ -0,0 +1,77 @@
+import io
+import math
+
+import pytest
+
+from storage.session_journal import (
+    HEADER,
+    RECORD,
+    Event,
+    SessionJournal,
+    StepKind,
+    segment_paths,
+)
+
+np = pytest.importorskip("numpy")
+
+from analytics import step_stats, write_csv  # noqa: E402
+
+NS = 1_000_000_000
+
+
+def record_step(journal, session, routine, exercise, kind, planned, actual):
+    journal.record(
+        Event.STEP_END if actual is not None else Event.SKIP,
+        session,
+        step_kind=kind,
+        routine=routine,
+        exercise=exercise,
+        planned_ns=planned * NS,
+        actual_ns=(actual or 0) * NS,
+    )
+
+
+def make_journal(path):
+    # Small segments, so the steps span two of them.
+    journal = SessionJournal(
+        path, flush_delay=60, max_segment_bytes=HEADER.size + 8 * RECORD.size
+    )
+    legs = journal.begin_session("Legs")
+    for actual in (3, 1, 5, 2, 4):
+        record_step(
+            journal, legs, "Legs", "Squat", StepKind.DURATION, 3, actual
+        )
+    record_step(journal, legs, "Legs", "", StepKind.BREAK, 10, 10)
+    record_step(journal, legs, "Legs", "Lunge", StepKind.REPETITION, 9, 8)
+    record_step(journal, legs, "Legs", "Lunge", StepKind.REPETITION, 9, None)
+    arms = journal.begin_session("Arms")
+    record_step(journal, arms, "Arms", "Curl", StepKind.REPETITION, 6, None)
+    journal.close()
+    assert len(segment_paths(path)) == 2
+
+
+def test_stats_grouped_by_exercise(tmp_path):
+    make_journal(tmp_path)
+    stats = step_stats(tmp_path)
+    assert stats.name == ["Squat", "Lunge", "Curl"]
+    assert stats.count.tolist() == [5, 1, 0]
+    assert stats.skipped.tolist() == [0, 1, 1]
+    assert stats.total.tolist() == [15, 8, 0]
+    assert stats.mean[:2].tolist() == [3, 8]
+    assert stats.p50[:2].tolist() == [3, 8]
+    assert stats.p95[0] == pytest.approx(4.8)
+    assert math.isnan(stats.p50[2])
+    assert stats.planned.tolist() == [15, 9, 0]
+    assert stats.overrun.tolist() == [0, 0, 0]
+    assert stats.adherence[0] == 1 and math.isnan(stats.adherence[1])
+
+
+def test_stats_grouped_by_routine_to_csv(tmp_path):
+    make_journal(tmp_path)
+    out = io.StringIO()
+    write_csv(step_stats(tmp_path, by="routine"), out)
+    assert out.getvalue().splitlines() == [
+        "name,count,skipped,total,mean,p50,p95,planned,overrun,adherence",
+        "Legs,6,1,23.000,3.833,3.500,7.250,24.000,0.000,1.000",
+        "Arms,0,1,0.000,nan,nan,nan,0.000,0.000,nan",
+    ]
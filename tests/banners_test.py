@@ -0,0 +1,36 @@
+from utils.banners import BannerCache
+
+
+class CountingRenderer:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, text, font):
+        self.calls.append((text, font))
+        return f"<{font}:{text}>"
+
+
+def test_banners_render_once_per_text_and_font(tmp_path):
+    render = CountingRenderer()
+    banners = BannerCache(tmp_path / "banners.json", render=render)
+    assert banners.get("HI") == "<straight:HI>"
+    assert banners.get("HI") == "<straight:HI>"
+    assert banners.get("HI", "block") == "<block:HI>"
+    assert render.calls == [("HI", "straight"), ("HI", "block")]
+    assert (banners.hits, banners.misses) == (1, 2)
+
+
+def test_banners_persist_between_runs(tmp_path):
+    BannerCache(tmp_path / "banners.json", render=CountingRenderer()).get("HI")
+    render = CountingRenderer()
+    banners = BannerCache(tmp_path / "banners.json", render=render)
+    assert banners.get("HI") == "<straight:HI>"
+    assert render.calls == []
+
+
+def test_corrupt_cache_file_is_rebuilt(tmp_path):
+    path = tmp_path / "banners.json"
+    path.write_text("{not json")
+    banners = BannerCache(path, render=CountingRenderer())
+    assert banners.get("HI") == "<straight:HI>"
+    assert BannerCache(path, render=None).get("HI") == "<straight:HI>"
@@ -0,0 +1,56 @@
+import random
+
+from countdown import NS_PER_SECOND, Countdown, seconds_to_ns
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 123_456_789
+
+    def __call__(self):
+        return self.now
+
+
+def test_pause_resume_stress_keeps_exact_time():
+    rng = random.Random(20)
+    clock = FakeClock()
+    countdown = Countdown(seconds_to_ns(3600), clock=clock)
+    expected_elapsed = 0
+    for _ in range(10_000):
+        countdown.start()
+        run = rng.randrange(1, 50_000_000)
+        clock.now += run
+        expected_elapsed += run
+        assert (
+            countdown.remaining() == countdown.duration_ns - expected_elapsed
+        )
+        countdown.stop()
+        clock.now += rng.randrange(0, 2 * NS_PER_SECOND)
+        assert countdown.elapsed() == expected_elapsed
+
+    # Run to the end and stop a known amount past the deadline.
+    countdown.start()
+    deadline = countdown.deadline
+    assert deadline == clock.now + countdown.duration_ns - expected_elapsed
+    clock.now = deadline + 7_654_321
+    countdown.stop()
+    assert countdown.remaining() == -7_654_321
+    assert countdown.overrun() == 7_654_321
+
+
+def test_start_and_stop_are_idempotent():
+    clock = FakeClock()
+    countdown = Countdown(seconds_to_ns(10), clock=clock)
+    countdown.stop()
+    countdown.start()
+    clock.now += NS_PER_SECOND
+    countdown.start()
+    clock.now += NS_PER_SECOND
+    countdown.stop()
+    countdown.stop()
+    assert countdown.elapsed() == 2 * NS_PER_SECOND
+    assert countdown.overrun() == 0
+
+    countdown.reset(seconds_to_ns(5))
+    assert not countdown.is_running
+    assert countdown.remaining() == 5 * NS_PER_SECOND
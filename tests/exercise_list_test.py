@@ -0,0 +1,128 @@
+import asyncio
+
+from textual.app import App
+
+from routine import DurationExercise, RepetitionExercise
+from widgets.exercise_list import ExerciseList
+from widgets.routine_widget import _duration_sort_key
+
+
+def make_list():
+    exercises = [
+        RepetitionExercise("Squats", 10),
+        DurationExercise("Plank", 60),
+        DurationExercise("Bridge", 30),
+        RepetitionExercise("Crunches", 15),
+    ]
+    return ExerciseList(exercises), exercises
+
+
+def assert_consistent(e_list, exercises, names):
+    assert sorted(e_list.order) == list(range(len(exercises)))
+    assert [e.name for e in e_list.ordered_exercises()] == names
+    assert [
+        e_list.exercise_at(row).name for row in range(e_list.row_count)
+    ] == names
+    # Reordering never touches the routine's own list.
+    assert e_list.exercises is exercises
+    assert [e.name for e in exercises] == [
+        "Squats",
+        "Plank",
+        "Bridge",
+        "Crunches",
+    ]
+
+
+def test_move_rows():
+    e_list, exercises = make_list()
+    e_list.move_row(0, 2)
+    assert e_list.index == 2
+    assert_consistent(
+        e_list, exercises, ["Plank", "Bridge", "Squats", "Crunches"]
+    )
+    e_list.move_row(3, 0)
+    assert e_list.index == 0
+    assert_consistent(
+        e_list, exercises, ["Crunches", "Plank", "Bridge", "Squats"]
+    )
+
+
+def test_sort_and_reverse_rows():
+    e_list, exercises = make_list()
+    e_list.sort_rows(key=_duration_sort_key)
+    assert_consistent(
+        e_list, exercises, ["Bridge", "Plank", "Squats", "Crunches"]
+    )
+    e_list.sort_rows(key=lambda e: e.name)
+    assert_consistent(
+        e_list, exercises, ["Bridge", "Crunches", "Plank", "Squats"]
+    )
+    e_list.reverse_rows()
+    assert_consistent(
+        e_list, exercises, ["Squats", "Plank", "Crunches", "Bridge"]
+    )
+    e_list.move_row(3, 1)
+    assert_consistent(
+        e_list, exercises, ["Squats", "Bridge", "Plank", "Crunches"]
+    )
+
+
+def test_sort_keeps_ties_in_place():
+    e_list, exercises = make_list()
+    e_list.reverse_rows()
+    # Both repetition exercises tie, so they keep the reversed order.
+    e_list.sort_rows(key=_duration_sort_key)
+    assert_consistent(
+        e_list, exercises, ["Bridge", "Plank", "Crunches", "Squats"]
+    )
+
+
+def test_restore_order():
+    e_list, exercises = make_list()
+    e_list.move_row(0, 3)
+    e_list.reverse_rows()
+    assert e_list.is_reordered
+    e_list.restore_order()
+    assert not e_list.is_reordered
+    assert e_list.ordered_exercises() == exercises
+    assert e_list.exercise_at(0) is exercises[0]
+
+
+def test_renders_only_rows_in_view():
+    exercises = [DurationExercise(f"Exercise {i}", 60) for i in range(50)]
+
+    class ListApp(App):
+        def compose(self):
+            yield ExerciseList(exercises)
+
+    def row_text(e_list, y):
+        return e_list.render_line(y).text
+
+    async def main():
+        app = ListApp()
+        async with app.run_test(size=(40, 12)) as pilot:
+            e_list = app.query_one(ExerciseList)
+            await pilot.pause()
+            # Rows are drawn, not mounted as widgets.
+            assert not e_list.children
+            assert e_list.virtual_size.height == 50 * ExerciseList.ROW_HEIGHT
+            assert "Exercise 0 " in row_text(e_list, 1)
+            assert "Exercise 2 " in row_text(e_list, 9)
+
+            e_list.scroll_to(y=10 * ExerciseList.ROW_HEIGHT, animate=False)
+            await pilot.pause()
+            assert "Exercise 10 " in row_text(e_list, 1)
+
+            # Moving the cursor scrolls its row into view and draws it as
+            # the cursor.
+            e_list.index = 40
+            await pilot.pause()
+            y = 40 * ExerciseList.ROW_HEIGHT - int(e_list.scroll_y) + 1
+            assert "Exercise 40 " in row_text(e_list, y)
+            cursor = e_list.get_component_rich_style("exercise-list--cursor")
+            card = list(e_list.render_line(y))[2]
+            assert card.style.bgcolor == cursor.bgcolor
+            above = list(e_list.render_line(y - ExerciseList.ROW_HEIGHT))[2]
+            assert above.style.bgcolor != cursor.bgcolor
+
+    asyncio.run(main())
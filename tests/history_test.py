@@ -0,0 +1,97 @@
+import json
+from datetime import date, datetime
+
+from history import Session, SessionStep, WorkoutHistory
+from storage.session_journal import Event, Flag, SessionJournal, StepKind
+
+
+def wall_ns(day: str) -> int:
+    return int(datetime.fromisoformat(day + "T12:00").timestamp() * 1e9)
+
+
+def make_session(day, routine="Legs", steps=()):
+    return Session(1, routine, wall_ns(day), 100, True, tuple(steps))
+
+
+def test_sessions_roll_up_by_routine_exercise_and_week(tmp_path):
+    history = WorkoutHistory(tmp_path / "history.json")
+    squat = SessionStep("Squat", StepKind.DURATION, 30, 32, False)
+    rest = SessionStep("", StepKind.BREAK, 10, 11, False)
+    lunge = SessionStep("Lunge", StepKind.REPETITION, 9, 0, True)
+    history.add_session(make_session("2024-01-01", steps=(squat, rest)))
+    history.add_session(make_session("2024-01-03", steps=(squat, lunge)))
+    history.add_session(make_session("2024-01-08", "Arms"))
+
+    history = WorkoutHistory(tmp_path / "history.json").load()
+    assert history.routines == {"Legs": [2, 75, 79], "Arms": [1, 0, 0]}
+    assert history.exercises == {
+        "Squat": [2, 0, 64, 60],
+        "Lunge": [1, 1, 0, 9],
+    }
+    assert history.weeks == {
+        "2024-W01": {"Legs": [2, 75]},
+        "2024-W02": {"Arms": [1, 0]},
+    }
+    assert history.days["2024-01-03"] == {"Legs": [1, 32]}
+    assert history.exercise_weeks["2024-W01"] == {
+        "Squat": [2, 0, 64],
+        "Lunge": [1, 1, 0],
+    }
+    assert history.exercise_days["2024-01-03"]["Lunge"] == [1, 1, 0]
+    # Counts are stored as numbers, not as JSON booleans.
+    data = json.loads((tmp_path / "history.json").read_text())
+    assert all(
+        type(value) is int
+        for totals in data["exercises"].values()
+        for value in totals
+    )
+
+
+def test_streaks():
+    history = WorkoutHistory()
+    for day in ("2024-01-01", "2024-01-02", "2024-01-03", "2024-01-05"):
+        history.add_session(make_session(day))
+    history.add_session(make_session("2024-01-06"))
+    assert history.streaks(today=date(2024, 1, 7)) == (2, 3)
+    assert history.streaks(today=date(2024, 1, 8)) == (0, 3)
+
+
+def test_rebuild_from_journal_skips_abandoned_sessions(tmp_path):
+    journal = SessionJournal(tmp_path / "sessions", flush_delay=60)
+    for finished in (True, False, True):
+        session = journal.begin_session("Core", steps=2)
+        journal.record(
+            Event.STEP_END,
+            session,
+            step=0,
+            step_kind=StepKind.DURATION,
+            routine="Core",
+            exercise="Plank",
+            planned_ns=60,
+            actual_ns=61,
+        )
+        journal.record(
+            Event.SKIP,
+            session,
+            step=1,
+            step_kind=StepKind.REPETITION,
+            routine="Core",
+            exercise="Crunch",
+            planned_ns=30,
+        )
+        journal.record(
+            Event.SESSION_END,
+            session,
+            step=2 if finished else 1,
+            flags=Flag.COMPLETED if finished else 0,
+        )
+    journal.close()
+
+    history = WorkoutHistory(tmp_path / "history.json")
+    assert history.rebuild(tmp_path / "sessions") == 2
+    history = WorkoutHistory(tmp_path / "history.json").load()
+    assert history.routines == {"Core": [2, 122, 180]}
+    assert history.exercises == {
+        "Plank": [2, 0, 122, 120],
+        "Crunch": [2, 2, 0, 60],
+    }
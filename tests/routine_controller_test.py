@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+import pytest
+
+from routine import Routine, save_routines
+from routine_controller import RoutineController
+from settings import Settings
+
+
+@pytest.fixture
+def controller(tmp_path):
+    save_routines(
+        tmp_path / "routines.json",
+        [Routine("Leg Day"), Routine("Upper Body"), Routine("Core")],
+    )
+    app = SimpleNamespace(
+        settings=Settings(tmp_path / "config.json"),
+        routines_path=tmp_path / "routines.json",
+    )
+    controller = RoutineController(app)
+    app.routines = controller.load_routines()
+    yield controller
+    controller.close()
+
+
+def test_lookup_by_name_and_id(controller):
+    leg_day = controller.app.routines[0]
+    assert controller.check_if_routine_exists("Leg Day")
+    assert not controller.check_if_routine_exists("Arms")
+    assert controller.get_routine_by_name("Leg Day") is leg_day
+    routine_id = controller.routine_id(leg_day)
+    assert controller.get_routine(routine_id) is leg_day
+
+
+def test_create_rename_and_delete_keep_index_consistent(controller):
+    controller.create_and_set_new_routine()
+    assert controller.set_routine_name("Arms")
+    controller.add_routine_to_app_routines()
+    arms = controller.routine
+    arms_id = controller.routine_id(arms)
+    assert controller.get_routine_by_name("Arms") is arms
+
+    assert not controller.rename_routine(arms, "Core")
+    assert controller.rename_routine(arms, "Biceps")
+    assert not controller.check_if_routine_exists("Arms")
+    assert controller.get_routine_by_name("Biceps") is arms
+    assert controller.routine_id(arms) == arms_id
+    positions = controller.find_routines("bicep")
+    assert [controller.name_index.routines[i] for i in positions] == [arms]
+
+    leg_day = controller.get_routine_by_name("Leg Day")
+    controller.delete_routine(leg_day)
+    assert leg_day not in controller.app.routines
+    assert not controller.check_if_routine_exists("Leg Day")
+    assert controller.get_routine(arms_id) is arms
+    assert controller.find_routines("leg") == []
+
+
+def test_index_survives_reordering(controller):
+    core = controller.get_routine_by_name("Core")
+    controller.app.routines.reverse()
+    assert controller.get_routine_by_name("Core") is core
+    positions = controller.find_routines("core")
+    assert [controller.name_index.routines[i] for i in positions] == [core]
+
+
+def test_current_routine_is_pinned(controller):
+    core = controller.app.routines[2]
+    controller.set_routine(core)
+    assert controller.store.pinned is core
+    controller.delete_routine(core)
+    assert controller.store.pinned is None
@@ -0,0 +1,54 @@
+from routine import Routine
+from routine_index import RoutineNameIndex
+
+NAMES = ["Leg Day", "Upper Body", "Full Body Burn", "Morning Stretch"]
+
+
+def make_index() -> RoutineNameIndex:
+    return RoutineNameIndex([Routine(name) for name in NAMES])
+
+
+def test_search_matches_subsequence_ignoring_case():
+    index = make_index()
+    assert index.search("bdy") == [1, 2]
+    assert index.search("LGD") == [0]
+    assert list(index.search("")) == [0, 1, 2, 3]
+    assert index.search("xyz") == []
+
+
+def test_search_narrows_and_widens_like_fresh_search():
+    index = make_index()
+    for query in ["b", "bo", "bod", "bo", "bu", "r", "rn", "rh", "m"]:
+        assert index.search(query) == make_index().search(query)
+
+
+def test_add_updates_results():
+    index = make_index()
+    assert index.search("core") == []
+    core = Routine("Core Blast")
+    index.add(core)
+    assert index.search("core") == [4]
+    assert index.routines[4] is core
+
+
+def test_rename_and_remove_keep_positions_consistent():
+    index = make_index()
+    assert index.search("leg") == [0]
+    leg_day = index.routines[0]
+    leg_day.name = "Arm Day"
+    index.rename(leg_day)
+    assert index.search("leg") == []
+    assert index.search("arm") == [0]
+
+    upper_body = index.routines[1]
+    index.remove(leg_day)
+    assert index.search("upper") == [0]
+    assert index.routines[0] is upper_body
+    index.remove(upper_body)
+    assert [r.name for r in index.routines] == NAMES[2:]
+
+
+def test_match_positions():
+    index = make_index()
+    assert index.match_positions(2, "fbb") == [0, 5, 10]
+    assert index.match_positions(0, "z") == []
@@ -0,0 +1,296 @@
+import json
+import os
+
+import msgpack
+import pytest
+
+from routine import (
+    DurationExercise,
+    RepetitionExercise,
+    Routine,
+    RoutineEncoder,
+    dumps_routines,
+    load_routines,
+    save_routines,
+)
+from storage.codecs import (
+    CODECS,
+    MsgpackCodec,
+    convert_routines,
+    detect_codec,
+    load_all_routines,
+    save_all_routines,
+)
+from storage.routine_store import FileRoutineStore, RoutineStore
+from storage.sqlite_store import SqliteRoutineStore
+
+
+def make_routine(name="Morning"):
+    routine = Routine(name)
+    routine.add_exercise(DurationExercise("Plank", 60))
+    routine.add_exercise(RepetitionExercise("Push-ups", 15))
+    return routine
+
+
+def test_incomplete_store_cannot_be_created(tmp_path):
+    class LoadOnlyStore(RoutineStore):
+        def load(self):
+            return []
+
+    with pytest.raises(TypeError, match="routine_changed"):
+        LoadOnlyStore(tmp_path / "routines.json")
+
+
+def test_sqlite_store_round_trip(tmp_path):
+    store = SqliteRoutineStore(tmp_path / "routines.db")
+    routines = store.load()
+    routine = make_routine()
+    routines.append(routine)
+    store.routine_changed(routine)
+    store.close()
+
+    loaded = SqliteRoutineStore(tmp_path / "routines.db").load()
+    assert [r.name for r in loaded] == ["Morning"]
+    plank, push_ups = loaded[0].exercises
+    assert (plank.name, plank.duration) == ("Plank", 60)
+    assert (push_ups.name, push_ups.repetitions) == ("Push-ups", 15)
+
+
+def test_sqlite_store_writes_only_changed_rows(tmp_path):
+    store = SqliteRoutineStore(tmp_path / "routines.db")
+    store.load()
+    routine = make_routine()
+    store.routine_changed(routine)
+
+    changes_before = store.conn.total_changes
+    routine.exercises[1].repetitions = 20
+    store.routine_changed(routine)
+    assert store.conn.total_changes - changes_before == 1
+
+    routine.exercises.pop(0)
+    store.routine_changed(routine)
+    loaded = SqliteRoutineStore(tmp_path / "routines.db").load()
+    assert [e.name for e in loaded[0].exercises] == ["Push-ups"]
+
+
+def test_sqlite_store_remove_routine(tmp_path):
+    store = SqliteRoutineStore(tmp_path / "routines.db")
+    store.load()
+    routine = make_routine()
+    store.routine_changed(routine)
+    store.routine_removed(routine)
+    assert SqliteRoutineStore(tmp_path / "routines.db").load() == []
+
+
+def test_sqlite_store_imports_json_once(tmp_path):
+    json_path = tmp_path / "routines.json"
+    save_routines(json_path, [make_routine("A"), make_routine("B")])
+
+    store = SqliteRoutineStore(tmp_path / "routines.db", import_from=json_path)
+    assert [r.name for r in store.load()] == ["A", "B"]
+    store.routine_removed(store.routines[0])
+    store.close()
+
+    store = SqliteRoutineStore(tmp_path / "routines.db", import_from=json_path)
+    assert [r.name for r in store.load()] == ["B"]
+
+
+def test_json_store_coalesces_changes_into_one_write(tmp_path):
+    store = FileRoutineStore(tmp_path / "routines.json", delay=60)
+    routines = store.load()
+    routine = make_routine()
+    routines.append(routine)
+    for _ in range(5):
+        store.routine_changed(routine)
+    assert store.writes == 0
+
+    store.flush()
+    assert store.writes == 1
+    assert not store.dirty
+    assert [r.name for r in load_routines(tmp_path / "routines.json")] == [
+        "Morning"
+    ]
+
+
+def test_json_store_writes_after_delay(tmp_path):
+    store = FileRoutineStore(tmp_path / "routines.json", delay=0.01)
+    store.load().append(make_routine())
+    store.routine_changed(store.routines[0])
+    timer = store._timer
+    if timer:
+        timer.join()
+    assert store.writes == 1
+    assert list(tmp_path.iterdir()) == [tmp_path / "routines.json"]
+
+
+def test_json_store_encodes_a_snapshot(tmp_path):
+    routine = make_routine()
+
+    class EditingCodec(type(CODECS["json"])):
+        def encode(self, name, exercises):
+            # The UI edits the routine while the writer encodes it.
+            routine.name = "Renamed"
+            routine.exercises.clear()
+            return super().encode(name, exercises)
+
+    store = FileRoutineStore(
+        tmp_path / "routines.json", codec=EditingCodec(), delay=60
+    )
+    store.load().append(routine)
+    store.routine_changed(routine)
+    store.flush()
+    saved = load_routines(tmp_path / "routines.json")[0]
+    assert (saved.name, len(saved.exercises)) == ("Morning", 2)
+
+
+def test_json_store_decodes_exercises_on_demand(tmp_path):
+    routines = [make_routine("A"), make_routine("B")]
+    save_routines(tmp_path / "routines.json", routines)
+
+    store = FileRoutineStore(tmp_path / "routines.json")
+    routines = store.load()
+    assert [r.name for r in routines] == ["A", "B"]
+    assert not any(r.is_loaded for r in routines)
+    assert [e.name for e in routines[1].exercises] == ["Plank", "Push-ups"]
+    assert not routines[0].is_loaded and routines[1].is_loaded
+
+
+def test_json_store_unloads_least_recently_used(tmp_path):
+    names = [f"R{i}" for i in range(4)]
+    save_routines(tmp_path / "routines.json", [make_routine(n) for n in names])
+
+    store = FileRoutineStore(tmp_path / "routines.json", cache_size=2)
+    routines = store.load()
+    routines[0].exercises.append(RepetitionExercise("Squats", 10))
+    store.routine_changed(routines[0])
+    for routine in routines[1:]:
+        routine.exercises
+    assert [r.is_loaded for r in routines] == [True, False, False, True]
+
+    store.flush()
+    reloaded = FileRoutineStore(tmp_path / "routines.json").load()
+    assert [r.name for r in reloaded] == names
+    assert len(reloaded[0].exercises) == 3
+    assert len(reloaded[1].exercises) == 2
+
+
+def test_store_keeps_pinned_routine_decoded(tmp_path):
+    names = [f"R{i}" for i in range(4)]
+    save_routines(tmp_path / "routines.json", [make_routine(n) for n in names])
+
+    store = FileRoutineStore(tmp_path / "routines.json", cache_size=2)
+    routines = store.load()
+    store.pin(routines[0])
+    shown = routines[0].exercises
+    for routine in routines[1:]:
+        routine.exercises
+    assert routines[0].exercises is shown
+    assert [r.is_loaded for r in routines] == [True, False, False, True]
+
+    store.pin(None)
+    routines[1].exercises
+    assert not routines[0].is_loaded
+
+
+def test_json_store_rewrites_old_layout(tmp_path):
+    path = tmp_path / "routines.json"
+    path.write_text(json.dumps([make_routine()], cls=RoutineEncoder, indent=2))
+
+    store = FileRoutineStore(path, delay=60)
+    assert [r.name for r in store.load()] == ["Morning"]
+    store.flush()
+    assert path.read_text() == dumps_routines(store.routines)
+    assert FileRoutineStore(path).load()[0].name == "Morning"
+
+
+def test_msgpack_store_round_trip(tmp_path):
+    path = tmp_path / "routines.msgpack"
+    store = FileRoutineStore(path, codec=CODECS["msgpack"], delay=60)
+    store.load().extend([make_routine("A"), make_routine("B")])
+    store.routine_changed(store.routines[1])
+    store.flush()
+    assert path.read_bytes().startswith(MsgpackCodec.HEADER)
+
+    routines = FileRoutineStore(path, codec=CODECS["msgpack"]).load()
+    assert [r.name for r in routines] == ["A", "B"]
+    assert not routines[0].is_loaded
+    plank, push_ups = routines[0].exercises
+    assert (plank.type, plank.name, plank.duration) == (
+        "duration",
+        "Plank",
+        60,
+    )
+    assert (push_ups.type, push_ups.repetitions) == ("repetition", 15)
+
+
+def test_file_store_converts_other_format(tmp_path):
+    json_path = tmp_path / "routines.json"
+    save_routines(json_path, [make_routine("A")])
+    path = tmp_path / "routines.msgpack"
+
+    store = FileRoutineStore(
+        path, codec=CODECS["msgpack"], delay=60, import_from=json_path
+    )
+    assert [r.name for r in store.load()] == ["A"]
+    store.flush()
+    assert detect_codec(path) is CODECS["msgpack"]
+    assert [e.name for e in load_all_routines(path)[0].exercises] == [
+        "Plank",
+        "Push-ups",
+    ]
+
+
+def test_file_store_imports_newer_other_format(tmp_path):
+    json_path = tmp_path / "routines.json"
+    msgpack_path = tmp_path / "routines.msgpack"
+    save_routines(json_path, [make_routine("A")])
+    store = FileRoutineStore(
+        msgpack_path, codec=CODECS["msgpack"], delay=60, import_from=json_path
+    )
+    store.load()[0].name = "Edited"
+    store.routine_changed(store.routines[0])
+    store.close()
+    stat = json_path.stat()
+    os.utime(msgpack_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    store = FileRoutineStore(json_path, delay=60, import_from=msgpack_path)
+    assert [r.name for r in store.load()] == ["Edited"]
+    store.close()
+    assert [r.name for r in load_routines(json_path)] == ["Edited"]
+
+
+def test_msgpack_rejects_unknown_exercises():
+    codec = CODECS["msgpack"]
+    with pytest.raises(ValueError):
+        codec.decode(msgpack.packb(("A", [(7, "X", 1)])))
+
+    class OtherExercise(DurationExercise):
+        __slots__ = ()
+        type = "other"
+
+    with pytest.raises(ValueError):
+        codec.encode("A", [OtherExercise("X", 1)])
+
+
+def test_msgpack_rejects_truncated_file(tmp_path):
+    path = tmp_path / "routines.msgpack"
+    save_all_routines(path, [make_routine("A")], CODECS["msgpack"])
+    path.write_bytes(path.read_bytes()[:-3])
+    with pytest.raises(ValueError):
+        FileRoutineStore(path, codec=CODECS["msgpack"]).load()
+
+
+def test_convert_routines_round_trip(tmp_path):
+    save_routines(tmp_path / "a.json", [make_routine("A"), make_routine("B")])
+    convert_routines(tmp_path / "a.json", tmp_path / "b.msgpack", "msgpack")
+    convert_routines(tmp_path / "b.msgpack", tmp_path / "c.json", "json")
+    assert (tmp_path / "c.json").read_text() == (
+        tmp_path / "a.json"
+    ).read_text()
+
+
+def test_msgpack_rejects_newer_version(tmp_path):
+    path = tmp_path / "routines.msgpack"
+    path.write_bytes(MsgpackCodec.MAGIC + bytes([MsgpackCodec.VERSION + 1]))
+    with pytest.raises(ValueError):
+        FileRoutineStore(path, codec=CODECS["msgpack"]).load()
@@ -0,0 +1,52 @@
+import asyncio
+import os
+from pathlib import Path
+
+from textual.reactive import var
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from routine import DurationExercise, Routine, save_routines  # noqa: E402
+from timero import TimeroApp  # noqa: E402
+from widgets.routine_widget import RoutineWidget  # noqa: E402
+
+SRC = Path(__file__).parent.parent / "src"
+
+
+def test_editing_replaces_the_exercise(tmp_path):
+    save_routines(
+        tmp_path / "routines.json",
+        [Routine("Core", [DurationExercise("Plank", 30)])],
+    )
+
+    class TestApp(TimeroApp):
+        CSS_PATH = SRC / "timero.tcss"
+        routines_path = var(tmp_path / "routines.json")
+
+    async def main():
+        app = TestApp(data_dir=tmp_path)
+        async with app.run_test() as pilot:
+            routine = app.routines[0]
+            plank = routine.exercises[0]
+            app.routine_controller.set_routine(routine)
+            await app.screen_manager.go_to_routine()
+            await pilot.pause()
+            widget = app.screen.query_one(RoutineWidget)
+            widget.e_list.focus()
+            widget.e_list.index = 0
+            await pilot.pause()
+            widget.action_edit_exercise()
+            await pilot.pause()
+            widget.e_input.e_name.value = "Side plank"
+            widget.e_input.duration_input.value = "00:00:45"
+            await pilot.pause()
+            widget.e_input.save_edited_exercise()
+
+            # The old object is left alone, so a write already encoding it
+            # stays consistent.
+            assert (plank.name, plank.duration) == ("Plank", 30)
+            edited = routine.exercises[0]
+            assert (edited.name, edited.duration) == ("Side plank", 45)
+            assert routine in app.routine_controller.store.dirty
+
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+import asyncio
+import os
+from pathlib import Path
+
+from textual.reactive import var
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from routine import DurationExercise, Routine  # noqa: E402
+from screens.train_view import TrainView  # noqa: E402
+from timero import TimeroApp  # noqa: E402
+
+SRC = Path(__file__).parent.parent / "src"
+
+
+def make_app(tmp_path, cache_size=8):
+    class TestApp(TimeroApp):
+        CSS_PATH = SRC / "timero.tcss"
+        routines_path = var(tmp_path / "routines.json")
+
+    app = TestApp(data_dir=tmp_path)
+    app.screen_manager.cache_size = cache_size
+    return app
+
+
+def run(app, test):
+    async def main():
+        async with app.run_test() as pilot:
+            await test(pilot)
+
+    asyncio.run(main())
+
+
+def test_cached_screen_is_shown_again(tmp_path):
+    app = make_app(tmp_path)
+
+    async def test(pilot):
+        await app.screen_manager.go_to_routine_select()
+        select = app.screen
+        await app.screen_manager.go_to_create_routine()
+        await app.screen_manager.go_to_routine_select()
+        assert app.screen is select
+
+    run(app, test)
+
+
+def test_least_recently_used_screen_is_uninstalled(tmp_path):
+    app = make_app(tmp_path, cache_size=1)
+
+    async def test(pilot):
+        await app.screen_manager.go_to_routine_select()
+        select = app.screen
+        await app.screen_manager.go_to_create_routine()
+        create = app.screen
+        await pilot.pause()
+        assert not app.is_screen_installed(select)
+        assert not select.is_attached
+        assert app.is_screen_installed(create)
+
+        await app.screen_manager.go_to_routine_select()
+        assert app.screen is not select
+        assert not app.is_screen_installed(create)
+
+    run(app, test)
+
+
+def test_training_always_starts_on_a_new_screen(tmp_path):
+    app = make_app(tmp_path)
+
+    async def test(pilot):
+        app.routine_controller.set_routine(
+            Routine("Core", [DurationExercise("Plank", 30)])
+        )
+        await app.screen_manager.go_to_training()
+        first = app.screen
+        await app.screen_manager.go_to_routine_select()
+        await app.screen_manager.go_to_training()
+        assert isinstance(app.screen, TrainView)
+        assert app.screen is not first
+        assert not app.is_screen_installed(first)
+
+    run(app, test)
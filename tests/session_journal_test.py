@@ -0,0 +1,99 @@
+from itertools import count
+
+from storage.session_journal import (
+    HEADER,
+    RECORD,
+    Event,
+    SessionJournal,
+    StepKind,
+    read_journal,
+    read_names,
+    segment_paths,
+)
+
+
+def make_journal(path, **kwargs):
+    ticks = count(1000, 10)
+    return SessionJournal(
+        path,
+        flush_delay=60,
+        clock=lambda: next(ticks),
+        wall_clock=lambda: 1_700_000_000_000_000_000,
+        **kwargs,
+    )
+
+
+def test_events_round_trip_with_interned_names(tmp_path):
+    journal = make_journal(tmp_path)
+    session = journal.begin_session("Leg Day", steps=3, planned_ns=90)
+    journal.record(
+        Event.STEP_END,
+        session,
+        step=0,
+        step_kind=StepKind.DURATION,
+        routine="Leg Day",
+        exercise="Squat",
+        planned_ns=30,
+        actual_ns=31,
+    )
+    assert list(tmp_path.iterdir()) == []
+    journal.close()
+
+    records = list(read_journal(tmp_path))
+    names = read_names(tmp_path)
+    assert names == ["", "Leg Day", "Squat"]
+    assert [Event(r.event) for r in records] == [
+        Event.SESSION_START,
+        Event.STEP_END,
+    ]
+    assert records[0].step == 3 and records[0].planned_ns == 90
+    end = records[1]
+    assert (names[end.routine], names[end.exercise]) == ("Leg Day", "Squat")
+    assert (end.planned_ns, end.actual_ns, end.monotonic_ns) == (30, 31, 1010)
+    assert end.step_kind == StepKind.DURATION
+
+
+def test_reopened_journal_continues_sessions_and_names(tmp_path):
+    journal = make_journal(tmp_path)
+    journal.begin_session("Leg Day")
+    journal.close()
+
+    journal = make_journal(tmp_path)
+    assert journal.begin_session("Leg Day") == 2
+    journal.begin_session("Arms")
+    journal.close()
+    assert read_names(tmp_path) == ["", "Leg Day", "Arms"]
+    assert [r.session for r in read_journal(tmp_path)] == [1, 2, 3]
+
+
+def test_segments_rotate_by_size(tmp_path):
+    journal = make_journal(
+        tmp_path, max_segment_bytes=HEADER.size + 3 * RECORD.size
+    )
+    session = journal.begin_session("Core")
+    for step in range(6):
+        journal.record(Event.STEP_START, session, step=step)
+    journal.flush()
+    journal.record(Event.SESSION_END, session)
+    journal.close()
+
+    segments = segment_paths(tmp_path)
+    assert len(segments) == 3
+    assert all(
+        p.stat().st_size <= HEADER.size + 3 * RECORD.size for p in segments
+    )
+    assert len(list(read_journal(tmp_path))) == 8
+
+
+def test_partial_record_is_dropped_on_open(tmp_path):
+    journal = make_journal(tmp_path)
+    journal.begin_session("Core")
+    journal.close()
+    (segment,) = segment_paths(tmp_path)
+    with open(segment, "ab") as f:
+        f.write(b"\0" * 10)
+
+    journal = make_journal(tmp_path)
+    assert journal.begin_session("Core") == 2
+    journal.close()
+    assert [r.session for r in read_journal(tmp_path)] == [1, 2]
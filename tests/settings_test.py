@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+import settings as settings_module
+from settings import Settings
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    calls = []
+    atomic_write = settings_module.atomic_write
+
+    def counting_write(path, data):
+        calls.append(path)
+        atomic_write(path, data)
+
+    monkeypatch.setattr(settings_module, "atomic_write", counting_write)
+    return calls
+
+
+def test_update_writes_once_and_notifies_changes(tmp_path, writes):
+    settings = Settings(tmp_path / "config.json")
+    notified = []
+    settings.subscribe(notified.append)
+
+    changed = settings.update(
+        {"show_breaks": False, "break_duration": 20, "auto_start_breaks": True}
+    )
+
+    assert changed == {"show_breaks": False, "break_duration": 20}
+    assert notified == [changed]
+    assert len(writes) == 1
+    saved = json.loads((tmp_path / "config.json").read_text())
+    assert saved["break_duration"] == 20
+
+    assert settings.update({"break_duration": 20}) == {}
+    assert len(writes) == 1
+    assert notified == [changed]
+
+
+def test_invalid_update_changes_nothing(tmp_path, writes):
+    settings = Settings(tmp_path / "config.json")
+    with pytest.raises(ValueError, match="break_duration, timer_precision"):
+        settings.update(
+            {
+                "show_breaks": False,
+                "break_duration": -1,
+                "timer_precision": "minutes",
+            }
+        )
+    assert settings.get("show_breaks") is True
+    assert writes == []
+
+
+def test_batch_applies_on_exit(tmp_path, writes):
+    settings = Settings(tmp_path / "config.json")
+    notified = []
+    settings.subscribe(notified.append)
+
+    with settings.batch():
+        settings.set("show_breaks", False)
+        settings.set("break_duration", 5)
+        assert settings.get("show_breaks") is True
+    assert notified == [{"show_breaks": False, "break_duration": 5}]
+    assert len(writes) == 1
+
+    with pytest.raises(RuntimeError):
+        with settings.batch():
+            settings.set("break_duration", 30)
+            raise RuntimeError
+    assert settings.get("break_duration") == 5
+    assert len(writes) == 1
+
+
+def test_reset_keeps_routines_storage(tmp_path, writes):
+    settings = Settings(tmp_path / "config.json")
+    settings.update(
+        {
+            "routines_storage": "sqlite",
+            "routines_save_delay": 2,
+            "break_duration": 30,
+        }
+    )
+    settings.reset_to_defaults()
+    assert settings.get("break_duration") == 10
+    assert settings.get("routines_storage") == "sqlite"
+    assert settings.get("routines_save_delay") == 2
@@ -0,0 +1,41 @@
+from sound_manager import NullSoundManager, SoundBank
+
+
+def fake_loader(path):
+    return f"decoded:{path.name}"
+
+
+def test_sound_bank_preload_all_assets(tmp_path):
+    (tmp_path / "a.wav").touch()
+    (tmp_path / "b.wav").touch()
+    (tmp_path / "notes.txt").touch()
+    bank = SoundBank(tmp_path, loader=fake_loader)
+    bank.preload()
+    assert len(bank) == 2
+    assert "a.wav" in bank and "b.wav" in bank
+
+
+def test_sound_bank_counts_hits_and_misses(tmp_path):
+    bank = SoundBank(tmp_path, loader=fake_loader)
+    bank.preload("a.wav")
+    assert bank.get("a.wav") == "decoded:a.wav"
+    assert bank.get("b.wav") == "decoded:b.wav"
+    assert bank.get("b.wav") == "decoded:b.wav"
+    assert (bank.hits, bank.misses) == (2, 1)
+
+
+def test_sound_bank_evict(tmp_path):
+    bank = SoundBank(tmp_path, loader=fake_loader)
+    bank.preload("a.wav", "b.wav")
+    bank.evict("a.wav")
+    assert "a.wav" not in bank and "b.wav" in bank
+    bank.evict()
+    assert len(bank) == 0
+
+
+def test_null_sound_manager_drops_cues():
+    manager = NullSoundManager()
+    assert manager.ready.done()
+    assert manager.is_ready
+    assert manager.get_handle("a.wav") is None
+    manager.play_sound("a.wav")
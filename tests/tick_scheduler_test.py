@@ -0,0 +1,97 @@
+import pytest
+
+from tick_scheduler import TickScheduler
+
+
+class FakeLoop:
+    def __init__(self):
+        self.now = 0.0
+        self.pending = []
+
+    def clock(self):
+        return self.now
+
+    def call_later(self, delay, callback):
+        handle = FakeHandle(self.now + delay, callback)
+        self.pending.append(handle)
+        return handle
+
+    def run_until(self, end):
+        while True:
+            live = [h for h in self.pending if not h.cancelled]
+            if not live:
+                break
+            handle = min(live, key=lambda h: h.when)
+            if handle.when > end:
+                break
+            self.pending.remove(handle)
+            self.now = handle.when
+            handle.callback()
+        self.now = end
+
+
+class FakeHandle:
+    def __init__(self, when, callback):
+        self.when = when
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class Recorder:
+    def __init__(self):
+        self.ticks = []
+        self.expired_at = None
+
+    def tick(self, now):
+        self.ticks.append(now)
+
+    def expire(self, now):
+        self.expired_at = now
+
+
+def make_scheduler(max_rate=30):
+    loop = FakeLoop()
+    scheduler = TickScheduler(
+        clock=loop.clock, call_later=loop.call_later, max_rate=max_rate
+    )
+    return loop, scheduler
+
+
+def test_next_change_rounds_up_to_resolution():
+    assert TickScheduler.next_change(0.0, 10.0, 1) == 1.0
+    assert TickScheduler.next_change(0.5, 10.0, 1) == 1.0
+    assert TickScheduler.next_change(9.5, 10.0, 1) == 10.0
+    # (3.0 - 2.3) / 0.1 is slightly above 7 in floating point.
+    assert TickScheduler.next_change(2.3, 3.0, 0.1) == pytest.approx(2.4)
+
+
+def test_seconds_resolution_wakes_once_per_second():
+    loop, scheduler = make_scheduler()
+    timer = Recorder()
+    scheduler.add(timer, deadline=5.0, resolution=1)
+    loop.run_until(10.0)
+    assert timer.ticks == [1.0, 2.0, 3.0, 4.0]
+    assert timer.expired_at == 5.0
+    assert len(scheduler) == 0
+
+
+def test_tick_rate_is_capped_but_deadline_is_not():
+    loop, scheduler = make_scheduler(max_rate=10)
+    timer = Recorder()
+    scheduler.add(timer, deadline=1.05, resolution=0.01)
+    loop.run_until(2.0)
+    assert len(timer.ticks) <= 11
+    assert timer.expired_at == 1.05
+
+
+def test_removed_timer_does_not_expire():
+    loop, scheduler = make_scheduler()
+    timer = Recorder()
+    scheduler.add(timer, deadline=1.0, resolution=1)
+    scheduler.remove(timer)
+    loop.run_until(2.0)
+    assert timer.expired_at is None
+    assert not loop.pending or all(h.cancelled for h in loop.pending)
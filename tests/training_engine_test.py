@@ -0,0 +1,170 @@
+from countdown import NS_PER_SECOND
+from history import sessions_from_journal
+from routine import DurationExercise, RepetitionExercise, Routine
+from settings import Settings
+from storage.session_journal import Event, SessionJournal, read_journal
+from training_engine import TrainingEngine, TrainingEvent
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000 * NS_PER_SECOND
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += round(seconds * NS_PER_SECOND)
+
+
+def make_engine(clock, journal=None, **settings):
+    routine = Routine(
+        "Core",
+        [
+            DurationExercise("Plank", 30),
+            RepetitionExercise("Crunch", 10),
+            DurationExercise("Side plank", 20),
+        ],
+    )
+    engine = TrainingEngine(
+        routine,
+        {**Settings.DEFAULT_SETTINGS, "break_duration": 5, **settings},
+        journal,
+        clock=clock,
+        wall_clock=lambda: 0,
+    )
+    events = []
+    engine.subscribe(lambda event, engine: events.append(event))
+    return engine, events
+
+
+def run_to_deadline(engine, clock):
+    clock.now = engine.countdown.deadline + 1000
+    assert engine.update()
+
+
+def test_simulated_session_with_auto_start(tmp_path):
+    clock = FakeClock()
+    journal = SessionJournal(tmp_path, flush_delay=60, clock=clock)
+    engine, events = make_engine(clock, journal)
+    engine.start()
+    run_to_deadline(engine, clock)
+    run_to_deadline(engine, clock)
+    assert not engine.is_timed
+    clock.advance(12)
+    engine.finish_step()
+    assert engine.is_in_break and engine.countdown.is_running
+    clock.advance(2)
+    engine.skip()
+    run_to_deadline(engine, clock)
+    journal.close()
+
+    STARTED, BREAK, TIMER, ENDED, SKIPPED, FINISHED = (
+        TrainingEvent.STEP_STARTED,
+        TrainingEvent.BREAK_STARTED,
+        TrainingEvent.TIMER_STARTED,
+        TrainingEvent.STEP_ENDED,
+        TrainingEvent.STEP_SKIPPED,
+        TrainingEvent.FINISHED,
+    )
+    assert events == [
+        STARTED, TIMER, ENDED,
+        BREAK, TIMER, ENDED,
+        STARTED, ENDED,
+        BREAK, TIMER, SKIPPED,
+        STARTED, TIMER, ENDED,
+        FINISHED,
+    ]  # fmt: skip
+    session = engine.finished_session
+    assert session.completed
+    assert [step.actual_ns for step in session.steps] == [
+        30 * NS_PER_SECOND + 1000,
+        5 * NS_PER_SECOND + 1000,
+        12 * NS_PER_SECOND,
+        2 * NS_PER_SECOND,
+        20 * NS_PER_SECOND + 1000,
+    ]
+    assert session.duration_ns == sum(step.actual_ns for step in session.steps)
+    # Auto-started timers are not journaled as resumed.
+    assert [Event(r.event) for r in read_journal(tmp_path)].count(
+        Event.RESUME
+    ) == 0
+
+
+def test_manual_start_pause_and_reset(tmp_path):
+    clock = FakeClock()
+    journal = SessionJournal(tmp_path, flush_delay=60, clock=clock)
+    engine, events = make_engine(clock, journal, auto_start_exercises=False)
+    engine.start()
+    clock.advance(60)
+    assert not engine.update()
+    assert engine.countdown.remaining() == 30 * NS_PER_SECOND
+
+    engine.start_timer()
+    clock.advance(10)
+    engine.pause_timer()
+    clock.advance(60)
+    assert engine.countdown.remaining() == 20 * NS_PER_SECOND
+    engine.reset_timer()
+    assert engine.countdown.remaining() == 30 * NS_PER_SECOND
+    engine.start_timer()
+    run_to_deadline(engine, clock)
+    assert events[1:5] == [
+        TrainingEvent.TIMER_STARTED,
+        TrainingEvent.TIMER_PAUSED,
+        TrainingEvent.TIMER_RESET,
+        TrainingEvent.TIMER_STARTED,
+    ]
+    assert engine.is_in_break and engine.countdown.is_running
+    journal.close()
+    timer_events = [
+        Event(r.event)
+        for r in read_journal(tmp_path)
+        if r.event in (Event.TIMER_START, Event.PAUSE, Event.RESUME)
+    ]
+    assert timer_events == [Event.TIMER_START, Event.PAUSE, Event.RESUME]
+
+
+def test_turning_breaks_off_keeps_the_running_break():
+    clock = FakeClock()
+    engine, _ = make_engine(clock)
+    engine.start()
+    run_to_deadline(engine, clock)
+    engine.apply_settings({"show_breaks": False})
+    assert engine.is_in_break and engine.countdown.is_running
+    run_to_deadline(engine, clock)
+    assert engine.step.exercise.name == "Crunch"
+    assert len(engine.plan) == 3
+
+
+def test_shrunk_plan_counts_as_completed_in_rebuilt_history(tmp_path):
+    clock = FakeClock()
+    journal = SessionJournal(tmp_path, flush_delay=60, clock=clock)
+    engine, _ = make_engine(clock, journal)
+    engine.start()
+    run_to_deadline(engine, clock)
+    run_to_deadline(engine, clock)
+    # The plan drops from five steps to three while on the second
+    # exercise.
+    engine.apply_settings({"show_breaks": False})
+    engine.finish_step()
+    run_to_deadline(engine, clock)
+    assert engine.finished_session.completed
+    journal.close()
+
+    [session] = sessions_from_journal(tmp_path)
+    assert session.completed
+
+
+def test_closing_an_unfinished_session(tmp_path):
+    journal = SessionJournal(tmp_path, flush_delay=60)
+    clock = FakeClock()
+    engine, events = make_engine(clock, journal)
+    engine.start()
+    engine.close()
+    assert engine.step is None and not engine.is_finished
+    assert not engine.countdown.is_running
+    assert TrainingEvent.FINISHED not in events
+    journal.close()
+    [session] = sessions_from_journal(tmp_path)
+    assert not session.completed
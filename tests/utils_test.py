@@ -1,4 +1,9 @@
-from utils.time_strings import duration_input_to_seconds, seconds_to_time_str
+from utils.time_strings import (
+    countdown_units,
+    duration_input_to_seconds,
+    format_countdown,
+    seconds_to_time_str,
+)
 
 
 def test_seconds_to_time_str_default():
@@ -39,3 +44,25 @@ def test_duration_input_to_seconds_no_minute():
 def test_duration_input_to_seconds_no_minute_no_hour():
     result = duration_input_to_seconds("00:00:07")
     assert result == 7
+
+
+def test_format_countdown_hundredths():
+    units = countdown_units(3967.251, 100)
+    assert format_countdown(units, 100) == "01:06:07.26"
+
+
+def test_format_countdown_tenths():
+    assert format_countdown(countdown_units(59.95, 10), 10) == "00:01:00.0"
+
+
+def test_format_countdown_seconds_rounds_up():
+    assert format_countdown(countdown_units(0.2, 1), 1) == "00:00:01"
+    assert format_countdown(countdown_units(0.0, 1), 1) == "00:00:00"
+
+
+def test_format_countdown_many_hours():
+    assert format_countdown(1234 * 3600, 1) == "1,234:00:00"
+
+
+def test_countdown_units_exact_boundary():
+    assert countdown_units(3 * 0.01, 100) == 3
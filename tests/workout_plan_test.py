@@ -0,0 +1,62 @@
+import pytest
+
+from routine import DurationExercise, RepetitionExercise
+from workout_plan import SECONDS_PER_REPETITION, WorkoutPlan
+
+
+def make_exercises():
+    return [
+        DurationExercise("Plank", 30),
+        RepetitionExercise("Push-ups", 10),
+        DurationExercise("Squat", 20),
+    ]
+
+
+def test_steps_and_cumulative_durations():
+    plan = WorkoutPlan(make_exercises(), show_breaks=True, break_duration=5)
+    assert [step.kind for step in plan.steps] == [
+        "exercise",
+        "break",
+        "exercise",
+        "break",
+        "exercise",
+    ]
+    push_ups = 10 * SECONDS_PER_REPETITION
+    assert [step.start for step in plan.steps] == [
+        0,
+        30,
+        35,
+        35 + push_ups,
+        40 + push_ups,
+    ]
+    assert plan.total_duration == 60 + push_ups
+    assert plan.remaining(2) == plan.total_duration - 35
+    assert plan.progress(len(plan)) == 1.0
+    assert plan.elapsed(0, step_elapsed=100) == 30
+
+    with pytest.raises(AttributeError):
+        plan.total_duration = 0
+
+
+def test_navigation():
+    plan = WorkoutPlan(make_exercises(), show_breaks=True, break_duration=5)
+    assert plan.next_exercise(0) == 2
+    assert plan.next_exercise(1) == 2
+    assert plan.next_exercise(4) == len(plan)
+    assert plan.previous_exercise(4) == 2
+    assert plan.previous_exercise(3) == 2
+    assert plan.previous_exercise(0) == 0
+    assert plan.exercises_completed(3) == 2
+    assert plan.exercises_completed(len(plan)) == 3
+
+
+def test_changing_breaks_keeps_position():
+    with_breaks = WorkoutPlan(make_exercises(), True, 5)
+    without_breaks = with_breaks.with_breaks(False, 5)
+    assert len(without_breaks) == 3
+
+    # The break after the first exercise maps to that exercise, so the
+    # step after it is still the second exercise.
+    assert without_breaks.equivalent_position(with_breaks, 1) == 0
+    assert with_breaks.equivalent_position(without_breaks, 2) == 4
+    assert with_breaks.equivalent_position(with_breaks, 3) == 3